@@ -61,8 +61,9 @@ _lines: list[str] = []
 
 
 def say(line: str = "") -> None:
+    # buffered: the transcript reaches stdout in ONE write (step 5), not a
+    # print per CST line
     _lines.append(line)
-    print(line)
 
 
 # ---------------------------------------------------------------------------
@@ -101,7 +102,8 @@ def run(update: bool) -> int:
     say("")
 
     # step 2 — parse: the corpus and its CST
-    source = CORPUS.read_text()
+    # bytes once, parsed once: both extractions below run over this tree
+    source = CORPUS.read_bytes()
     say("=== step 2: parse the corpus (CST, fields shown) ===")
     tree = lang.parse(source)
     render(tree.root_node)
@@ -109,8 +111,9 @@ def run(update: bool) -> int:
 
     # step 3 — extract: the typed rows
     say("=== step 3: extract typed rows ===")
-    funcs = [r.model_dump() for r in Function.extract(source, language=lang)]
-    assigns = [r.model_dump() for r in Assignment.extract(source, language=lang)]
+    funcs = [r.model_dump() for r in Function.extract_tree(tree, language=lang)]
+    assigns = [r.model_dump()
+               for r in Assignment.extract_tree(tree, language=lang)]
     for r in funcs:
         say(f"Function {r['name']!r} -> {r['return_type']!r} at line {r['line']}")
     for r in assigns:
@@ -132,6 +135,7 @@ def run(update: bool) -> int:
     # self-referential status ("DRIFTED") could never be a stable oracle.
     say("=== step 5: the committed per-step transcript oracle ===")
     transcript = "\n".join(_lines) + "\n"
+    sys.stdout.write(transcript)
     saved = TRANSCRIPT.read_text() if TRANSCRIPT.exists() else None
     expected = transcript + "transcript.txt matches this run byte-for-byte ✓\n"
     if update:
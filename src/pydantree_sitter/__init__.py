@@ -22,7 +22,7 @@ hatch: a literal .scm whose captures map to fields by name (the query DSL is
 not public; sibling order/negation/multi-anchor joins live there).
 """
 
-from .binding import Extractor, Language
+from .binding import Document, Extractor, Language
 from .errors import (
     AmbiguousCaptureError,
     BundleError,
@@ -32,7 +32,7 @@ from .errors import (
     SchemaCheckError,
     ShapeError,
 )
-from .loader import load_bundle
+from .loader import load_bundle, load_typed_api
 from .markers import (
     M,
     AnyOf,
@@ -64,10 +64,11 @@ __all__ = [
     "OutputModel", "M", "capture", "capture_kind", "source_meta", "derived",
     "Matches", "Eq", "AnyOf", "NodeKind", "Unescaped", "RawQuery",
     # the bind
-    "Language", "Extractor", "Span",
+    "Language", "Extractor", "Document", "Span",
     # the schema seam + declared value shapes
     "NodeSchema", "NodeTypeInfo", "ChildInfo", "NodeTypeRef",
     "ValueMap", "JSON_VALUE_MAP", "propose_value_map", "load_bundle",
+    "load_typed_api",
     # errors (the taxonomy, §1.3)
     "PydantreeSitterError", "SchemaCheckError", "ShapeError",
     "QueryBuildError", "ExtractionError", "AmbiguousCaptureError",
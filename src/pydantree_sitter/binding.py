@@ -11,12 +11,23 @@ bind — never prints (F-A6).
 
 from __future__ import annotations
 
+import hashlib
+import os
+import tempfile
+import threading
 import types
 import warnings
 import weakref
 from pathlib import Path
+from typing import Annotated, Iterable
 
+import pydantic
 import tree_sitter
+from pydantic import TypeAdapter
+from pydantic.errors import (
+    PydanticInvalidForJsonSchema,
+    PydanticSchemaGenerationError,
+)
 
 from .compiler import compile_spec
 from .errors import ShapeError
@@ -30,7 +41,7 @@ from .valuemap import (
     looks_like_json,
 )
 
-__all__ = ["Language", "Extractor"]
+__all__ = ["Language", "Document", "Extractor"]
 
 
 # ---------------------------------------------------------------------------
@@ -83,7 +94,7 @@ def _transient_language(lang: "Language", schema=None) -> "Language":
 _LANGUAGE_CACHE: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
 # WeakKeyDictionary is not thread-safe; the sugar path can race from two
 # threads (REVIEW 020 minor — the caches were unsynchronized).
-_LANGUAGE_LOCK = __import__("threading").Lock()
+_LANGUAGE_LOCK = threading.Lock()
 
 
 def _language_for(language):
@@ -123,26 +134,65 @@ def _point_of(text: bytes, byte: int) -> tuple:
     return (row, byte - (last_nl + 1))
 
 
-def _apply_edit(tree: tree_sitter.Tree, old_text: bytes, new_text: bytes) -> None:
+def _advance(point: tuple, text: bytes, lo: int, hi: int) -> tuple:
+    """The point of `hi`, given `point` is the point of `lo`: only the
+    bytes between the two are scanned (an edit's end points are derived
+    from its start point, not recounted from byte 0)."""
+    rows = text.count(b"\n", lo, hi)
+    if not rows:
+        return (point[0], point[1] + hi - lo)
+    return (point[0] + rows, hi - (text.rfind(b"\n", lo, hi) + 1))
+
+
+# block size for the edit diff: whole blocks compare as ONE C-level slice
+# equality, only the first differing block is scanned byte by byte
+_DIFF_BLOCK = 4096
+
+
+def _common_prefix(a: bytes, b: bytes) -> int:
+    """Length of the common prefix of `a` and `b`."""
+    limit = min(len(a), len(b))
+    i = 0
+    while i + _DIFF_BLOCK <= limit and \
+            a[i:i + _DIFF_BLOCK] == b[i:i + _DIFF_BLOCK]:
+        i += _DIFF_BLOCK
+    while i < limit and a[i] == b[i]:
+        i += 1
+    return i
+
+
+def _common_suffix(a: bytes, b: bytes, floor: int) -> int:
+    """Length of the common suffix of `a` and `b` that stays clear of the
+    first `floor` bytes (the common prefix — the edit spans never cross)."""
+    limit = min(len(a), len(b)) - floor
+    na, nb = len(a), len(b)
+    j = 0
+    while j + _DIFF_BLOCK <= limit and \
+            a[na - j - _DIFF_BLOCK:na - j] == b[nb - j - _DIFF_BLOCK:nb - j]:
+        j += _DIFF_BLOCK
+    while j < limit and a[na - 1 - j] == b[nb - 1 - j]:
+        j += 1
+    return j
+
+
+def _apply_edit(tree: tree_sitter.Tree, old_text: bytes, new_text: bytes,
+                start: int | None = None, tail: int | None = None) -> None:
     """Apply the old_text -> new_text diff to `tree` before reparsing: the
     tree-sitter edit protocol requires telling the tree EXACTLY what changed
     (start/end byte offsets + points); without it, `Parser.parse(new_source,
     old_tree)` reuses the old tree's nodes at their recorded offsets and
-    mid-buffer edits produce silently wrong trees (A3/REVIEW 020)."""
-    start = 0
-    limit = min(len(old_text), len(new_text))
-    while start < limit and old_text[start] == new_text[start]:
-        start += 1
-    old_end = len(old_text)
-    new_end = len(new_text)
-    while old_end > start and new_end > start \
-            and old_text[old_end - 1] == new_text[new_end - 1]:
-        old_end -= 1
-        new_end -= 1
-    tree.edit(start, old_end, new_end,
-              _point_of(old_text, start),
-              _point_of(old_text, old_end),
-              _point_of(new_text, new_end))
+    mid-buffer edits produce silently wrong trees (A3/REVIEW 020). A caller
+    that already measured the shared prefix/suffix passes them in."""
+    if start is None:
+        start = _common_prefix(old_text, new_text)
+    if tail is None:
+        tail = _common_suffix(old_text, new_text, start)
+    old_end = len(old_text) - tail
+    new_end = len(new_text) - tail
+    start_point = _point_of(old_text, start)
+    tree.edit(start, old_end, new_end, start_point,
+              _advance(start_point, old_text, start, old_end),
+              _advance(start_point, new_text, start, new_end))
 
 
 class Language:
@@ -152,15 +202,21 @@ class Language:
         lang = Language.from_module(tree_sitter_python, schema=...)
         lang = Language.load(tree_sitter_python.language(), schema=...)
 
+    `parse_cache_bytes` opts into keeping recent parses (see `parse`),
+    bounded by their total source size; the default keeps none.
+
     `extractor(Model)` runs all checks once and caches the Extractor on THIS
     instance keyed by (model, strict) — a second bind against another
     language re-checks (F-A1's silent cross-language cache is impossible
     here by construction).
     """
 
-    __slots__ = ("_lang", "_schema", "_value_map", "_lib", "_extractors")
+    __slots__ = ("_lang", "_schema", "_value_map", "_lib", "_extractors",
+                 "_trees", "_trees_lock", "_trees_bytes", "_cache_bytes",
+                 "_local")
 
-    def __init__(self, lang, schema=None, value_map=None):
+    def __init__(self, lang, schema=None, value_map=None, *,
+                 parse_cache_bytes: int = 0):
         if isinstance(lang, Language):
             # wrapping another Language carries its schema AND value map
             # (the ONE Language-unwrap owner; _resolve_language handles the
@@ -176,21 +232,33 @@ class Language:
         self._value_map = value_map
         self._lib = None
         self._extractors: dict = {}
+        self._trees: dict[bytes, tree_sitter.Tree] = {}
+        self._trees_bytes = 0               # total len() of the cached keys
+        self._cache_bytes = parse_cache_bytes
+        # one Language is shared across threads (the sugar path): the
+        # cache's pop / re-insert / evict must not interleave
+        self._trees_lock = threading.Lock()
+        self._local = threading.local()
 
     # -- construction -------------------------------------------------------
 
     @classmethod
-    def load(cls, lang, schema=None, *, value_map=None) -> "Language":
+    def load(cls, lang, schema=None, *, value_map=None,
+             parse_cache_bytes: int = 0) -> "Language":
         """Wrap a language (module / tree_sitter.Language / capsule)."""
-        return cls(lang, schema=schema, value_map=value_map)
+        return cls(lang, schema=schema, value_map=value_map,
+                   parse_cache_bytes=parse_cache_bytes)
 
     @classmethod
-    def from_module(cls, mod, schema=None, value_map=None) -> "Language":
+    def from_module(cls, mod, schema=None, value_map=None, *,
+                    parse_cache_bytes: int = 0) -> "Language":
         """A grammar module (e.g. tree_sitter_python) as a Language."""
-        return cls(mod, schema=schema, value_map=value_map)
+        return cls(mod, schema=schema, value_map=value_map,
+                   parse_cache_bytes=parse_cache_bytes)
 
     @classmethod
-    def load_bundle(cls, dir, *, value_map=None) -> "Language":
+    def load_bundle(cls, dir, *, value_map=None,
+                    parse_cache_bytes: int = 0) -> "Language":
         """Consume a packaged grammar bundle in ONE call (grammar.so +
         node-schema.json + metadata via the shared loader). Keeps the
         bundle's .so library alive for the language's lifetime (F-A10).
@@ -198,7 +266,8 @@ class Language:
         an explicit `value_map=` argument wins.
         """
         bundle = load_bundle(dir)
-        lang = cls(bundle.language, schema=bundle.schema)
+        lang = cls(bundle.language, schema=bundle.schema,
+                   parse_cache_bytes=parse_cache_bytes)
         lang._lib = bundle.lib
         if value_map is not None:
             lang._value_map = value_map
@@ -239,9 +308,40 @@ class Language:
     # -- parsing ------------------------------------------------------------
 
     def parse(self, source: str | bytes) -> tree_sitter.Tree:
+        """Parse `source`. With `parse_cache_bytes` set, recent parses are
+        kept — least recently used out once their sources exceed that many
+        bytes — keyed by the source bytes themselves (exact — no digest to
+        compute or collide): identical source is a dict hit. Each call
+        returns its own `Tree.copy()` (O(1), shared nodes), so a caller's
+        `edit()` or `reparse()` never reaches the cached tree.
+
+        Always a full parse of `source` alone: incremental reparsing is
+        `Document` / `reparse`. Thread-safe: the cache is updated under a
+        lock, the parse itself runs on the calling thread's own parser."""
         if isinstance(source, str):
             source = source.encode("utf-8")
-        return tree_sitter.Parser(self._lang).parse(source)
+        elif not isinstance(source, bytes):
+            return self._parser().parse(source)
+        limit = self._cache_bytes
+        if len(source) > limit:             # no cache, or too big to keep
+            return self._parser().parse(source)
+        trees = self._trees
+        with self._trees_lock:
+            tree = trees.pop(source, None)
+            if tree is not None:
+                trees[source] = tree            # most recent again
+                return tree.copy()
+        # parsed outside the lock: other threads' hits never wait on it
+        tree = self._parser().parse(source)
+        with self._trees_lock:
+            if trees.pop(source, None) is None:     # a racing miss stored it
+                self._trees_bytes += len(source)
+            trees[source] = tree
+            while self._trees_bytes > limit:
+                oldest = next(iter(trees))
+                del trees[oldest]
+                self._trees_bytes -= len(oldest)
+        return tree.copy()
 
     def reparse(self, old_tree: tree_sitter.Tree,
                 source: str | bytes) -> tree_sitter.Tree:
@@ -254,13 +354,141 @@ class Language:
         recovered from the tree's root node (the parse retained it), so no
         `old_source=` parameter is needed; if it cannot be recovered the
         edit is skipped (the pre-fix behavior, correct for EOF appends).
-        The old `old_source=` parameter was deleted (F-A11)."""
+        The old `old_source=` parameter was deleted (F-A11).
+
+        The root node's text is only exact when the root starts at byte 0:
+        leading whitespace sits OUTSIDE the root, so its text would be
+        shifted against the real offsets and the edit misplaced. Such a
+        tree is not reused (a full parse). `Document` keeps the exact
+        source bytes and never needs the recovery."""
         if isinstance(source, str):
             source = source.encode("utf-8")
-        old_text = old_tree.root_node.text
-        if old_text is not None and old_text != source:
+        root = old_tree.root_node
+        old_text = root.text
+        if old_text is None or root.start_byte != 0:
+            return self._parser().parse(source)
+        if old_text != source:
             _apply_edit(old_tree, old_text, source)
-        return tree_sitter.Parser(self._lang).parse(source, old_tree)
+        return self._parser().parse(source, old_tree)
+
+    def _parser(self) -> tree_sitter.Parser:
+        """This thread's parser for the language, built on first use: one
+        Parser per parse re-allocated its lexer and stack every call. Per
+        thread, because a Parser must not run two parses at once."""
+        local = self._local
+        parser = getattr(local, "parser", None)
+        if parser is None:
+            parser = local.parser = tree_sitter.Parser(self._lang)
+        return parser
+
+    def document(self, source: str | bytes) -> "Document":
+        """Parse `source` into a Document (bytes-owning, incrementally
+        updatable)."""
+        return Document(self, source)
+
+
+# ---------------------------------------------------------------------------
+# Document
+# ---------------------------------------------------------------------------
+
+class Document:
+    """A parse that owns its source: a `bytearray` of UTF-8 (what
+    tree-sitter consumes and what every byte offset indexes) is primary.
+    `edit()` splices the buffer in place — no rebuild of the whole text per
+    edit — and each parse reads an immutable `bytes` snapshot of it
+    (`source`), so a tree kept across an `edit()` still reads its own text.
+    `text` (str) is decoded on first access after each change.
+    """
+
+    __slots__ = ("language", "tree", "_buf", "_source", "_text")
+
+    def __init__(self, language: Language, source: str | bytes):
+        text = None
+        if isinstance(source, str):
+            text, source = source, source.encode("utf-8")
+        self.language = language
+        self._buf = bytearray(source)
+        self._source: bytes = bytes(source)
+        self._text: str | None = text
+        self.tree: tree_sitter.Tree = language._parser().parse(self._source)
+
+    @property
+    def source(self) -> bytes:
+        return self._source
+
+    @property
+    def text(self) -> str:
+        if self._text is None:
+            self._text = self._buf.decode("utf-8")
+        return self._text
+
+    @property
+    def root_node(self) -> tree_sitter.Node:
+        return self.tree.root_node
+
+    def edit(self, start_byte: int, old_end_byte: int,
+             new_text: str | bytes) -> tree_sitter.Tree:
+        """Replace bytes [start_byte, old_end_byte) with `new_text`: splice
+        the buffer, tell the tree what changed, reparse incrementally."""
+        return self.apply_edits([(start_byte, old_end_byte, new_text)])
+
+    def apply_edits(self, edits: Iterable[tuple[int, int, str | bytes]]
+                    ) -> tree_sitter.Tree:
+        """Apply several non-overlapping `(start_byte, old_end_byte,
+        new_text)` edits, all in CURRENT-buffer offsets, with ONE reparse:
+        K edit() calls pay K incremental parses, this pays one. Spliced
+        back to front, so each edit's offsets (and the tree's) are still
+        the original ones when it lands."""
+        buf = self._buf
+        todo = []
+        for start_byte, old_end_byte, new_text in edits:
+            if isinstance(new_text, str):
+                new_text = new_text.encode("utf-8")
+            if not 0 <= start_byte <= old_end_byte <= len(buf):
+                raise ValueError(
+                    f"edit range [{start_byte}, {old_end_byte}) is outside "
+                    f"the {len(buf)}-byte source")
+            todo.append((start_byte, old_end_byte, new_text))
+        todo.sort(key=lambda e: (e[0], e[1]))
+        for (_, prev_end, _), (start_byte, old_end_byte, _) in zip(todo, todo[1:]):
+            if start_byte < prev_end:
+                raise ValueError(
+                    f"edit range [{start_byte}, {old_end_byte}) overlaps "
+                    f"an edit ending at {prev_end}")
+        if not todo:
+            return self.tree
+        # edits land on a copy (O(1), shared nodes): a tree handed out
+        # earlier keeps its offsets as well as its bytes
+        tree = self.tree.copy()
+        for start_byte, old_end_byte, new_text in reversed(todo):
+            start_point = _point_of(buf, start_byte)
+            old_end_point = _advance(start_point, buf, start_byte, old_end_byte)
+            new_end_point = _advance(start_point, new_text, 0, len(new_text))
+            buf[start_byte:old_end_byte] = new_text
+            tree.edit(start_byte, old_end_byte,
+                      start_byte + len(new_text), start_point,
+                      old_end_point, new_end_point)
+        # the tree keeps the bytes it was parsed from: a snapshot, never
+        # the buffer the next edit splices
+        self._source = bytes(buf)
+        self._text = None
+        self.tree = self.language._parser().parse(self._source, tree)
+        return self.tree
+
+    def update(self, source: str | bytes) -> tree_sitter.Tree:
+        """Replace the whole source: the diff against the buffer becomes ONE
+        edit() (only the changed span is spliced and reparsed)."""
+        if isinstance(source, str):
+            source = source.encode("utf-8")
+        buf = self._buf
+        if buf == source:
+            return self.tree
+        start = _common_prefix(buf, source)
+        tail = _common_suffix(buf, source, start)
+        return self.edit(start, len(buf) - tail, source[start:len(source) - tail])
+
+    def __repr__(self) -> str:  # pragma: no cover
+        return f"Document({len(self._buf)} bytes, {self.language.name!r})"
 
 
 # ---------------------------------------------------------------------------
@@ -296,6 +524,23 @@ def resolve_value_map(model_cls, language: Language) -> ValueMap:
 # Extractor
 # ---------------------------------------------------------------------------
 
+def _json_opaque_fields(model: type) -> list[str]:
+    """The model's fields whose values cannot round-trip through JSON (the
+    row cache's storage): those with no JSON schema in either direction —
+    arbitrary types such as a source_meta() `Span`, at any depth."""
+    out = []
+    for name, f in model.model_fields.items():
+        ann = (Annotated[(f.annotation, *f.metadata)] if f.metadata
+               else f.annotation)
+        try:
+            adapter = TypeAdapter(ann)
+            adapter.json_schema(mode="validation")
+            adapter.json_schema(mode="serialization")
+        except (PydanticSchemaGenerationError, PydanticInvalidForJsonSchema):
+            out.append(name)
+    return out
+
+
 class Extractor:
     """A bound model: the compiled state + the extraction entry points.
 
@@ -309,6 +554,10 @@ class Extractor:
         self.strict = strict
         vm = resolve_value_map(model, language)
         self.compiled = compile_spec(model, language, value_map=vm)
+        self._cache_salt: bytes | None = None
+        # rows holding non-JSON values (a source_meta() Span) cannot be
+        # stored by the cache_dir row cache: decided on first cache_dir use
+        self._uncacheable: list[str] | None = None
         self.warnings: tuple = tuple(getattr(model, "_binding_warnings", ()))
         if self.warnings:
             warnings.warn(
@@ -325,11 +574,73 @@ class Extractor:
 
     # -- extraction ---------------------------------------------------------
 
-    def extract(self, text) -> list:
+    def extract(self, text, *, cache_dir: str | Path | None = None) -> list:
+        """Parse `text` and extract the model's rows.
+
+        With `cache_dir`, rows are content-addressed on disk by
+        sha256(text) + the bound extraction (model, language, strict, query
+        source): a hit skips the parse AND the query and re-validates the
+        stored JSON rows. Entries are written atomically (tmp + rename), so
+        concurrent extractors never read a torn entry. Stored rows are
+        re-validated on a hit (one `validate_json` call). A model whose
+        rows have no JSON form (a `Span` field) is rejected with
+        ValueError."""
         if not isinstance(text, bytes):
             text = text.encode("utf-8")
-        tree = self.language.parse(text)
-        return self.extract_tree(tree)
+        if cache_dir is None:
+            return self.extract_tree(self.language.parse(text))
+        if self._uncacheable is None:
+            self._uncacheable = _json_opaque_fields(self.model)
+        if self._uncacheable:
+            raise ValueError(
+                f"{self.model.__name__} rows cannot be cached: field(s) "
+                f"{', '.join(self._uncacheable)} hold values with no JSON "
+                f"form (e.g. a source_meta() Span) — extract without "
+                f"cache_dir")
+        rows = self.compiled.rows_adapter()
+        entry = Path(cache_dir) / f"{self._cache_key(text)}.json"
+        try:
+            return rows.validate_json(entry.read_bytes())
+        except (OSError, ValueError):       # absent, or a stale/torn entry
+            pass
+        out = self.extract_tree(self.language.parse(text))
+        # the cache is an optimization: a failed store (read-only or full
+        # disk, a row that will not dump) never fails the extract itself
+        tmp = None
+        try:
+            data = rows.dump_json(out)
+            entry.parent.mkdir(parents=True, exist_ok=True)
+            # a unique temp name: concurrent stores of one key (threads or
+            # processes) never write the same file
+            with tempfile.NamedTemporaryFile(
+                    dir=entry.parent, prefix=f"{entry.name}.",
+                    suffix=".tmp", delete=False) as f:
+                tmp = f.name
+                f.write(data)
+            os.replace(tmp, entry)
+        except (OSError, ValueError):
+            if tmp is not None:
+                try:
+                    os.unlink(tmp)
+                except OSError:
+                    pass
+        return out
+
+    def _cache_key(self, text: bytes) -> str:
+        # the extraction's identity (the query source can run to kilobytes)
+        # is fixed at bind: render and encode it once, not per lookup
+        # (and the library versions: an upgrade may change what rows mean)
+        salt = self._cache_salt
+        if salt is None:
+            from . import __version__
+            salt = self._cache_salt = b"\0" + "|".join((
+                f"{self.model.__module__}.{self.model.__qualname__}",
+                self.language.name or "", str(self.strict),
+                __version__, pydantic.VERSION,
+                self.query_source)).encode()
+        h = hashlib.sha256(text)
+        h.update(salt)
+        return h.hexdigest()
 
     def extract_tree(self, tree: tree_sitter.Tree) -> list:
         if self.compiled.spec.record:
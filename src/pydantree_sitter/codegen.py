@@ -6,7 +6,21 @@ fiction — the old .pyi generator is deleted): a thin `TypedNode` wrapper aroun
 (`child_by_field_name` + `wrap`) typed from the schema — required+single ->
 `T`, optional -> `T | None`, repeated -> `list[T]` — a `children()` accessor
 from the children summary, supertypes as unions over their subtypes,
-`KIND_MAP` (node kind -> class), and `wrap(node)`.
+`KIND_MAP` (every node kind -> class, a read-only mapping), `lookup(kind)`,
+`wrap(node)` and its batch form `wrap_all(nodes)` —
+optionally `bind(language)` first, to dispatch on symbol ids (`warm=True`
+builds the deferred classes up front). Kind
+classes declare their field accessors as `__match_args__` (structural
+`match` works on wrappers); `match_values(node)` reads them all in one
+fused `attrgetter` call. Like-shaped classes share one `_MA<n>` tuple and
+its getter.
+
+Kinds with no field accessors (the bulk of most grammars: leaf tokens,
+keyword wrappers) get no class statement: they are listed in `_LAZY_KINDS`
+and built on first use by the `_kind_class` factory — via `wrap()`,
+`KIND_MAP[kind]`, or a module attribute access through the PEP 562
+`__getattr__`; `_KIND_CLASSES` caches the classes built so far. A
+`TYPE_CHECKING` block keeps them visible to static checkers.
 
 Class names come from kinds via the acronym-aware snake/camel helper
 (shared with the B-side rule naming, F-B4): `function_item` ->
@@ -15,30 +29,48 @@ Class names come from kinds via the acronym-aware snake/camel helper
 
 from __future__ import annotations
 
+import functools
+import keyword
+import py_compile
 from pathlib import Path
 
-from .schema import NodeSchema, NodeTypeRef
+from .schema import ChildInfo, NodeSchema, NodeTypeInfo, NodeTypeRef
 
 _ATTR_SHADOWS = {"node", "text", "span", "kind", "children", "type"}
 
 
+# kind and field names recur across grammars and across every regeneration
+# of one grammar (bundle builds, tests): derive each spelling once
+@functools.lru_cache(maxsize=4096)
 def class_name(kind: str) -> str:
     """A node kind -> a Python class name (acronym-aware camel):
     `function_item` -> `FunctionItem`, `_type` -> `Type`,
     `http_server` -> `HttpServer`."""
-    parts = [p for p in kind.split("_") if p]
-    if not parts:
+    # one pass over the parts: an empty part (leading/doubled `_`)
+    # contributes nothing, so no filtering pass and no generator frame
+    name = "".join([p[:1].upper() + p[1:] for p in kind.split("_")])
+    if not name:
         return "Node"
-    return "".join(p[0].upper() + p[1:] for p in parts)
+    # `true`/`false`/`none` kinds: `class False` is a SyntaxError
+    return f"{name}_" if keyword.iskeyword(name) else name
 
 
+@functools.lru_cache(maxsize=4096)
 def _attr_name(field: str) -> str:
     out = "".join(ch if ch.isalnum() or ch == "_" else "_" for ch in field)
-    return f"field_{out}" if out in _ATTR_SHADOWS else out
+    if out in _ATTR_SHADOWS or keyword.iskeyword(out):
+        return f"field_{out}"
+    return out
 
 
-def _ref_name(r: NodeTypeRef) -> str:
-    return "TypedNode" if not r.named else class_name(r.type)
+def _ref_name(r: NodeTypeRef, names: dict[str, str]) -> str:
+    """`names` is the generation's kind -> class name table."""
+    if not r.named:
+        return "TypedNode"
+    name = names.get(r.type)
+    if name is None:        # referenced, never declared
+        name = names[r.type] = class_name(r.type)
+    return name
 
 
 def _union(names: list[str], *, optional: bool) -> str:
@@ -52,99 +84,319 @@ def _union(names: list[str], *, optional: bool) -> str:
     return " | ".join(names)
 
 
+def _merged_fields(infos: list[NodeTypeInfo]) -> dict[str, ChildInfo]:
+    """The field table of a class shared by several kinds: a field's types
+    are the union over the kinds; it is multiple if any kind repeats it and
+    required only if every kind requires it."""
+    if len(infos) == 1:
+        return infos[0].fields or {}
+    out: dict[str, ChildInfo] = {}
+    for t in infos:
+        for fname, fi in (t.fields or {}).items():
+            prev = out.get(fname)
+            if prev is None:
+                out[fname] = fi
+                continue
+            out[fname] = ChildInfo(
+                multiple=prev.multiple or fi.multiple,
+                required=prev.required and fi.required,
+                types=prev.types + [r for r in fi.types if r not in prev.types])
+    for fname, fi in out.items():
+        if any(fname not in (t.fields or {}) for t in infos):
+            out[fname] = fi.model_copy(update={"required": False})
+    return out
+
+
 def generate_typed_api(schema: NodeSchema, module_name: str) -> str:
     """Generate a real typed-accessor module for `schema`. Returns the
     module source (a runnable module, not a stub)."""
+    return "\n".join(_typed_api_lines(schema, module_name))
+
+
+def _typed_api_lines(schema: NodeSchema, module_name: str) -> list[str]:
+    """The generated module's source lines (no line terminators)."""
     supertype_kinds = {t.type for t in schema.node_types if t.subtypes}
     named = sorted((t for t in schema.node_types if t.named),
                    key=lambda t: t.type)
     by_kind = {t.type: t for t in schema.node_types}
+    # every kind's class name, camel-cased ONCE: the groups, field return
+    # types and unions all look names up here instead of re-deriving them
+    names = {t.type: class_name(t.type) for t in schema.node_types}
 
     L: list[str] = []
     L.append(f'"""{module_name} — typed CST accessors generated from the '
              f'node-schema (pydantree_sitter.codegen)."""')
-    L.append("from __future__ import annotations")
-    L.append("")
-    L.append("import tree_sitter")
-    L.append("")
-    L.append("")
-    L.append("class TypedNode:")
-    L.append('    """A thin wrapper holding a tree_sitter.Node."""')
-    L.append("")
-    L.append("    def __init__(self, node: tree_sitter.Node) -> None:")
-    L.append("        self.node = node")
-    L.append("")
-    L.append("    @property")
-    L.append("    def kind(self) -> str:")
-    L.append("        return self.node.type")
-    L.append("")
-    L.append("    @property")
-    L.append("    def text(self) -> str:")
-    L.append("        b = self.node.text")
-    L.append('        return "" if b is None else b.decode("utf-8")')
-    L.append("")
-    L.append("    @property")
-    L.append("    def line(self) -> int:")
-    # tuple access, not `.row`: the 0.26.0 Point getters corrupt the heap
-    # (py-tree-sitter#472). Generated code ships to users, so it must not
-    # carry the bad access pattern — see materialize.Span.from_node.
-    L.append("        return self.node.start_point[0] + 1")
-    L.append("")
-    L.append("    def children(self, kind: str | None = None) -> list[TypedNode]:")
-    L.append("        out = []")
-    L.append("        for c in self.node.children:")
-    L.append("            if kind is None or c.type == kind:")
-    L.append("                out.append(wrap(c))")
-    L.append("        return out")
-    L.append("")
-    L.append("    def __repr__(self) -> str:  # pragma: no cover")
-    L.append('        return f"<{type(self).__name__} {self.kind!r}>"')
-    L.append("")
+    L.extend((
+        "from __future__ import annotations",
+        "",
+        # the module namespace is the kind classes' namespace too: every
+        # import is underscore-aliased so a kind named `mapping` (class
+        # `Mapping`) can neither shadow nor be shadowed by it.
+        # TYPE_CHECKING keeps its name (static checkers match it literally;
+        # no camel-cased class name can equal it)
+        "from collections.abc import Iterator as _Iterator, Mapping as _Mapping",
+        "from operator import attrgetter as _attrgetter",
+        "from typing import TYPE_CHECKING, Any as _Any, Callable as _Callable",
+        "",
+        "import tree_sitter",
+        "",
+        "",
+        "def _fields_getter(*names: str) -> _Callable[[_Any], tuple]:",
+        '    """ONE C-level getter for a class\'s `__match_args__` (a tuple for',
+        '    any arity — attrgetter alone returns a bare value for one name)."""',
+        "    if not names:",
+        "        return lambda node: ()",
+        "    if len(names) == 1:",
+        "        get = _attrgetter(names[0])",
+        "        return lambda node: (get(node),)",
+        "    return _attrgetter(*names)",
+        "",
+        "",
+        "class TypedNode:",
+        '    """A thin wrapper holding a tree_sitter.Node."""',
+        "",
+        # slotted: one wrapper per visited node, no per-instance __dict__
+        '    __slots__ = ("node", "_text")',
+        "    __match_args__: tuple[str, ...] = ()",
+        "    _match_getter = _fields_getter()",
+        "",
+        "    def __init__(self, node: tree_sitter.Node) -> None:",
+        "        self.node = node",
+        "        self._text: str | None = None",
+        "",
+        "    @property",
+        "    def kind(self) -> str:",
+        "        return self.node.type",
+        "",
+        # `node.text` slices a fresh bytes object per access: decode it once
+        # per wrapper
+        "    @property",
+        "    def text(self) -> str:",
+        "        t = self._text",
+        "        if t is None:",
+        "            b = self.node.text",
+        '            t = self._text = "" if b is None else b.decode("utf-8")',
+        "        return t",
+        "",
+        "    @property",
+        "    def line(self) -> int:",
+        # tuple access, not `.row`: the 0.26.0 Point getters corrupt the heap
+        # (py-tree-sitter#472). Generated code ships to users, so it must not
+        # carry the bad access pattern — see materialize.Span.from_node.
+        "        return self.node.start_point[0] + 1",
+        "",
+        "    def children(self, kind: str | None = None) -> list[TypedNode]:",
+        "        nodes = self.node.children",
+        "        if kind is not None:",
+        "            ids = _IDS_BY_KIND.get(kind)",
+        "            if ids is not None:",
+        "                nodes = [c for c in nodes if c.kind_id in ids]",
+        "            else:",
+        "                nodes = [c for c in nodes if c.type == kind]",
+        "        return wrap_all(nodes)",
+        "",
+        "    def __repr__(self) -> str:  # pragma: no cover",
+        '        return f"<{type(self).__name__} {self.kind!r}>"',
+        "",
+    ))
 
     # per-kind classes FIRST (their annotations are lazy strings thanks to
-    # the future-annotations import); the supertype unions follow
+    # the future-annotations import); the supertype unions follow. Kinds
+    # without a field accessor are deferred to the `_kind_class` factory.
+    # kinds whose class names collide (`self`/`_self`) share ONE class,
+    # registered under every kind — never a second class statement that
+    # shadows the first while KIND_MAP keeps pointing at it
+    groups: dict[str, list[NodeTypeInfo]] = {}
     for t in named:
-        if t.type in supertype_kinds:
-            continue
-        cls = class_name(t.type)
-        fields = t.fields or {}
-        L.append(f"class {cls}(TypedNode):")
-        L.append(f'    """kind {t.type!r}."""')
-        L.append(f"    KIND = {t.type!r}")
+        if t.type not in supertype_kinds:
+            groups.setdefault(names[t.type], []).append(t)
+    merged = {cls: _merged_fields(infos) for cls, infos in groups.items()}
+    # field names repeat across kinds (`name`, `body`, `type`...): sanitize
+    # each distinct one once for the shapes and the accessors both
+    attrs = {f: _attr_name(f) for fields in merged.values() for f in fields}
+    shapes = {cls: tuple(attrs[f] for f in sorted(fields)
+                         if fields[f].types)
+              for cls, fields in merged.items()}
+    # like-shaped classes share ONE `__match_args__` tuple and ONE fused
+    # getter (each class body is its own code object, so equal tuple
+    # literals would otherwise be separate objects)
+    counts: dict[tuple, int] = {}
+    for shape in shapes.values():
+        if shape:
+            counts[shape] = counts.get(shape, 0) + 1
+    shared = {shape: f"_MA{i}" for i, shape in
+              enumerate(sorted(sh for sh, n in counts.items() if n > 1))}
+    for shape, const in shared.items():
+        L.append(f"{const} = {shape!r}")
+        L.append(f"_MG{const[3:]} = _fields_getter(*{const})")
+    if shared:
         L.append("")
-        field_lines = []
+        L.append("")
+    lazy: dict[str, list[str]] = {}     # class name -> kinds
+    hints: dict[tuple, str] = {}        # field type set -> annotation
+    for cls, infos in groups.items():
+        kinds = [t.type for t in infos]
+        fields = merged[cls]
+        if not shapes[cls]:
+            lazy[cls] = kinds
+            continue
+        # each class and accessor is laid out in one extend of its lines,
+        # not an append per line
+        L.extend((f"class {cls}(TypedNode):",
+                  f'    """kind {", ".join(map(repr, kinds))}."""',
+                  f"    KIND = {kinds[0]!r}"))
+        if len(kinds) > 1:
+            L.append(f"    KINDS = {tuple(kinds)!r}")
+        match_args = shapes[cls]
+        if match_args in shared:
+            const = shared[match_args]
+            L.extend(("    __slots__ = ()",
+                      f"    __match_args__ = {const}",
+                      f"    _match_getter = _MG{const[3:]}",
+                      ""))
+        else:
+            L.extend(("    __slots__ = ()",
+                      f"    __match_args__ = {match_args!r}",
+                      f"    _match_getter = _fields_getter{match_args!r}",
+                      ""))
         for fname in sorted(fields):
             fi = fields[fname]
-            types = sorted(dict.fromkeys(_ref_name(r) for r in fi.types))
-            if not types:
+            if not fi.types:
                 continue
+            # the same type set recurs across fields (every `name:
+            # identifier`): its return annotation is rendered once
+            key = (tuple((r.type, r.named) for r in fi.types),
+                   fi.multiple, fi.required)
+            ret = hints.get(key)
+            if ret is None:
+                types = sorted(dict.fromkeys(_ref_name(r, names)
+                                             for r in fi.types))
+                if fi.multiple:
+                    ret = f"list[{_union(types, optional=False)}]"
+                elif fi.required:
+                    ret = _union(types, optional=False)
+                else:
+                    ret = _union(types, optional=True)
+                hints[key] = ret
+            # bound: the field's id (bind()), so tree-sitter skips its
+            # name -> id scan over the grammar's field names per access.
+            # Each accessor asks the C side on its own: one cursor walk
+            # indexing every field (at wrap or first access) measured
+            # slower than all of a node's per-field lookups together
+            # (function_definition, 5 fields: 1.30 us vs 0.77 us), and
+            # most wrappers never read a field at all
             if fi.multiple:
-                ret = f"list[{_union(types, optional=False)}]"
-            elif fi.required:
-                ret = _union(types, optional=False)
-            else:
-                ret = _union(types, optional=True)
-            attr = _attr_name(fname)
-            field_lines.append(f"    @property")
-            field_lines.append(f"    def {attr}(self) -> {ret}:")
-            if fi.multiple:
-                field_lines.append("        out = []")
-                field_lines.append("        for i in range(len(self.node.children)):")
-                field_lines.append("            c = self.node.children[i]")
-                field_lines.append(
-                    f'            if self.node.field_name_for_child(i) == {fname!r}:')
-                field_lines.append("                out.append(wrap(c))")
-                field_lines.append("        return out")
+                # one C-level field walk, not a Python loop asking every
+                # child for its field name
+                L.extend((
+                    "    @property",
+                    f"    def {attrs[fname]}(self) -> {ret}:",
+                    f"        fid = _FIELD_IDS.get({fname!r})",
+                    f"        nodes = (self.node.children_by_field_name({fname!r})"
+                    " if fid is None",
+                    "                 else self.node.children_by_field_id(fid))",
+                    "        return wrap_all(nodes)",
+                    ""))
             else:
-                field_lines.append(f'        c = self.node.child_by_field_name({fname!r})')
-                field_lines.append("        if c is None:")
-                field_lines.append("            return None")
-                field_lines.append("        return wrap(c)")
-            field_lines.append("")
-        if not field_lines:
-            field_lines.append("    ...")
-            field_lines.append("")
-        L.extend(field_lines)
+                L.extend((
+                    "    @property",
+                    f"    def {attrs[fname]}(self) -> {ret}:",
+                    f"        fid = _FIELD_IDS.get({fname!r})",
+                    f"        c = (self.node.child_by_field_name({fname!r})"
+                    " if fid is None",
+                    "             else self.node.child_by_field_id(fid))",
+                    "        if c is None:",
+                    "            return None",
+                    "        return wrap(c)",
+                    ""))
+
+    # the deferred kinds: a static view for type checkers, the factory and
+    # the PEP 562 hook for runtime
+    if lazy:
+        L.append("if TYPE_CHECKING:")
+        for cls in lazy:
+            L.append(f"    class {cls}(TypedNode): __slots__ = ()")
+        L.append("")
+    # the classes built so far (the eager ones, then each deferred one as
+    # the factory builds it): the hot-path probe; KIND_MAP is the complete
+    # view over it
+    L.append("_KIND_CLASSES: dict[str, type[TypedNode]] = {")
+    for cls, infos in groups.items():
+        if cls not in lazy:
+            for t in infos:
+                L.append(f"    {t.type!r}: {cls},")
+    L.append("}")
+    L.append("_LAZY_NAMES: dict[str, tuple[str, ...]] = {")
+    for cls, kinds in lazy.items():
+        L.append(f"    {cls!r}: {tuple(kinds)!r},")
+    L.append("}")
+    # the inverse table as a literal too: built here, not by a
+    # comprehension at every import of the generated module
+    L.append("_LAZY_KINDS: dict[str, str] = {")
+    for cls, kinds in lazy.items():
+        for kind in kinds:
+            L.append(f"    {kind!r}: {cls!r},")
+    L.extend((
+        "}",
+        "_EAGER_KINDS = tuple(_KIND_CLASSES)",
+        "",
+        "",
+        "def _kind_class(kind: str) -> type[TypedNode]:",
+        '    """Build (once) the class of a kind without field accessors,',
+        '    registered under every kind sharing its class name."""',
+        "    cls = _KIND_CLASSES.get(kind)",
+        "    if cls is None:",
+        "        name = _LAZY_KINDS[kind]",
+        "        kinds = _LAZY_NAMES[name]",
+        "        ns = {\"__doc__\": f\"kind {', '.join(map(repr, kinds))}.\",",
+        '              "__module__": __name__, "KIND": kinds[0], "__slots__": ()}',
+        "        if len(kinds) > 1:",
+        '            ns["KINDS"] = kinds',
+        "        cls = globals().setdefault(name, type(name, (TypedNode,), ns))",
+        "        for k in kinds:",
+        "            _KIND_CLASSES.setdefault(k, cls)",
+        "    return cls",
+        "",
+        "",
+        "class _KindMap(_Mapping[str, type[TypedNode]]):",
+        '    """Every named kind -> its class; a deferred class is built on',
+        '    first `[]`."""',
+        "",
+        "    __slots__ = ()",
+        "",
+        "    def __getitem__(self, kind: str) -> type[TypedNode]:",
+        "        cls = _KIND_CLASSES.get(kind)",
+        "        if cls is None:",
+        "            if kind not in _LAZY_KINDS:",
+        "                raise KeyError(kind)",
+        "            cls = _kind_class(kind)",
+        "        return cls",
+        "",
+        "    def __contains__(self, kind: object) -> bool:",
+        "        return kind in _KIND_CLASSES or kind in _LAZY_KINDS",
+        "",
+        "    def __iter__(self) -> _Iterator[str]:",
+        "        yield from _EAGER_KINDS",
+        "        yield from _LAZY_KINDS",
+        "",
+        "    def __len__(self) -> int:",
+        "        return len(_EAGER_KINDS) + len(_LAZY_KINDS)",
+        "",
+        "    def __repr__(self) -> str:  # pragma: no cover",
+        '        return f"<KIND_MAP: {len(self)} kinds>"',
+        "",
+        "",
+        "KIND_MAP: _Mapping[str, type[TypedNode]] = _KindMap()",
+        "",
+        "",
+        "def __getattr__(name: str) -> type[TypedNode]:",
+        "    kinds = _LAZY_NAMES.get(name)",
+        "    if kinds is None:",
+        '        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")',
+        "    return _kind_class(kinds[0])",
+        "",
+        "",
+    ))
 
     # supertype unions (after the classes: the union expressions evaluate
     # the class names at module import). Unions can reference OTHER unions
@@ -152,27 +404,36 @@ def generate_typed_api(schema: NodeSchema, module_name: str) -> str:
     # referenced union names are defined before it; supertype graphs don't
     # cycle).
     union_defs: dict[str, tuple[str, str]] = {}   # kind -> (name, rhs)
+    members: dict[str, list[str]] = {}            # kind -> member names
     for t in named:
         if t.type in supertype_kinds:
-            subs = sorted(dict.fromkeys(
-                _ref_name(NodeTypeRef(type=s.type, named=s.named))
-                for s in t.subtypes))
+            subs = sorted(dict.fromkeys(_ref_name(s, names)
+                                        for s in t.subtypes))
             if subs:
-                union_defs[t.type] = (class_name(t.type),
+                union_defs[t.type] = (names[t.type],
                                       _union(subs, optional=False))
+                members[t.type] = subs
     # emit unions dependency-first (a union may reference another union's
-    # name, e.g. Pattern -> LiteralPattern); supertype graphs don't cycle
-    import re as _re
+    # name, e.g. Pattern -> LiteralPattern); supertype graphs don't cycle.
+    # The edges come from the member names themselves, not a re-scan of
+    # the rendered union text
     union_names = {name for name, _rhs in union_defs.values()}
-    deps = {k: {n for n in _re.findall(r"[A-Za-z_][A-Za-z0-9_]*", rhs)
-                if n in union_names and n != name}
-            for k, (name, rhs) in union_defs.items()}
+    deps = {k: {n for n in members[k] if n in union_names and n != name}
+            for k, (name, _rhs) in union_defs.items()}
+    # Kahn's algorithm, one sorted level at a time: a union is ready once
+    # every union it names has been emitted. Each emitted name releases
+    # only its own dependents, where a rescan of every pending union per
+    # level was quadratic in the union count
+    dependents: dict[str, list[str]] = {}
+    for k, d in deps.items():
+        for n in d:
+            dependents.setdefault(n, []).append(k)
+    waiting = {k: len(d) for k, d in deps.items()}
     order: list[tuple[str, str, str]] = []
     emitted: set[str] = set()
+    level = sorted(k for k, n in waiting.items() if not n)
     while len(order) < len(union_defs):
-        ready = sorted(k for k, (name, rhs) in union_defs.items()
-                       if name not in emitted and deps[k] <= emitted)
-        if not ready:
+        if not level:
             # unsatisfiable: a cyclic/undefined union dependency — emit the
             # rest as-is rather than looping forever (A10). A cycle is a
             # supertype-graph anomaly; the emitted union still imports.
@@ -181,38 +442,140 @@ def generate_typed_api(schema: NodeSchema, module_name: str) -> str:
                     order.append((k, name, rhs))
                     emitted.add(name)
             break
-        for k in ready:
+        released: list[str] = []
+        for k in level:
             name, rhs = union_defs[k]
             order.append((k, name, rhs))
-            emitted.add(name)
+            if name not in emitted:
+                emitted.add(name)
+                released.extend(dependents.get(name, ()))
+        for k in released:
+            waiting[k] -= 1
+        level = sorted(k for k in dict.fromkeys(released)
+                       if not waiting[k] and union_defs[k][0] not in emitted)
+    # the unions evaluate their member names at import: materialize the
+    # deferred kinds they reference first
+    union_refs = sorted(
+        {lazy[n][0] for kind, _name, _rhs in order
+         for n in members[kind]
+         if n in lazy})
+    if union_refs:
+        L.append(f"for _kind in {tuple(union_refs)!r}:")
+        L.extend((
+            "    _kind_class(_kind)",
+            "del _kind",
+            "",
+        ))
     for _kind, name, rhs in order:
         L.append(f"{name} = {rhs}")
         L.append("")
 
-    # KIND_MAP + wrap
-    L.append("KIND_MAP: dict[str, type[TypedNode]] = {")
-    for t in named:
-        if t.type not in supertype_kinds:
-            L.append(f"    {t.type!r}: {class_name(t.type)},")
-    L.append("}")
-    L.append("")
-    L.append("")
-    L.append("def wrap(node: tree_sitter.Node | None) -> TypedNode | None:")
-    L.append("    \"\"\"Wrap a tree_sitter.Node in its kind class (or TypedNode).\"\"\"")
-    L.append("    if node is None:")
-    L.append("        return None")
-    L.append("    cls = KIND_MAP.get(node.type, TypedNode)")
-    L.append("    return cls(node)")
-    L.append("")
+    # lookup + wrap: ONE dict probe per node on the hot path (`str` caches
+    # its hash, so a hand-rolled perfect hash cannot beat it)
+    L.extend((
+        "_KIND_GET = _KIND_CLASSES.get",
+        "",
+        "",
+        "def lookup(kind: str) -> type[TypedNode]:",
+        '    """The class for a node kind (TypedNode for unknown kinds)."""',
+        "    cls = _KIND_GET(kind)",
+        "    if cls is None:",
+        "        cls = _kind_class(kind) if kind in _LAZY_KINDS else TypedNode",
+        "    return cls",
+        "",
+        "",
+        "def match_values(node: TypedNode) -> tuple:",
+        '    """The node\'s `__match_args__` field values as one tuple (one',
+        '    fused getter call instead of an attribute lookup per field)."""',
+        "    return type(node)._match_getter(node)",
+        "",
+        "",
+        # the symbol-id table: `node.kind_id` is a small int where `node.type`
+        # builds (and hashes) a fresh str per access. Empty until bind();
+        # filled lazily per id as wrap() resolves kinds through lookup()
+        "_BY_ID: list[type[TypedNode] | None] = []",
+        # kind name -> its symbol ids (a name can own several: named/anonymous,
+        # aliases), so children(kind) filters on int membership, not str ==
+        "_IDS_BY_KIND: dict[str, frozenset[int]] = {}",
+        # field name -> field id, filled by bind(): the accessors pass the int
+        "_FIELD_IDS: dict[str, int] = {}",
+        "",
+        "",
+        "def bind(language: tree_sitter.Language, *, warm: bool = False) -> None:",
+        '    """Index the kind classes by `language`\'s symbol ids: wrap() then',
+        '    dispatches on `node.kind_id` (one list index per node). `warm`',
+        '    also builds every deferred kind class now, so no first-seen kind',
+        '    pays the factory inside a traversal."""',
+        "    resolve = lookup if warm else _KIND_GET",
+        "    _BY_ID[:] = [None] * language.node_kind_count",
+        "    ids: dict[str, set[int]] = {}",
+        "    for i in range(language.node_kind_count):",
+        "        kind = language.node_kind_for_id(i)",
+        "        if kind is not None:",
+        "            _BY_ID[i] = resolve(kind)",
+        "            ids.setdefault(kind, set()).add(i)",
+        "    _IDS_BY_KIND.clear()",
+        "    _IDS_BY_KIND.update((k, frozenset(v)) for k, v in ids.items())",
+        "    _FIELD_IDS.clear()",
+        "    for i in range(1, language.field_count + 1):",
+        "        name = language.field_name_for_id(i)",
+        "        if name is not None:",
+        "            _FIELD_IDS[name] = i",
+        "",
+        "",
+        "def wrap(node: tree_sitter.Node | None) -> TypedNode | None:",
+        "    \"\"\"Wrap a tree_sitter.Node in its kind class (or TypedNode).\"\"\"",
+        "    if node is None:",
+        "        return None",
+        "    if _BY_ID:",
+        "        kid = node.kind_id",
+        "        if kid < len(_BY_ID):",
+        "            cls = _BY_ID[kid]",
+        "            if cls is None:",
+        "                cls = _BY_ID[kid] = lookup(node.type)",
+        "            return cls(node)",
+        "    cls = _KIND_GET(node.type)",
+        "    if cls is None:",
+        "        cls = lookup(node.type)",
+        "    return cls(node)",
+        "",
+        "",
+        # the batch form: the table, its length and the fallbacks are bound once
+        # per call rather than re-read from module globals per node
+        "def wrap_all(nodes: list[tree_sitter.Node]) -> list[TypedNode]:",
+        '    """wrap() over a list of nodes, dispatch state hoisted out of the loop."""',
+        "    by_id = _BY_ID",
+        "    n = len(by_id)",
+        "    get = _KIND_GET",
+        "    out = []",
+        "    for node in nodes:",
+        "        kid = node.kind_id",
+        "        if kid < n:",
+        "            cls = by_id[kid]",
+        "            if cls is None:",
+        "                cls = by_id[kid] = lookup(node.type)",
+        "        else:",
+        "            cls = get(node.type) or lookup(node.type)",
+        "        out.append(cls(node))",
+        "    return out",
+        "",
+    ))
 
-    text = "\n".join(L)
-    return text
+    return L
 
 
 def write_typed_api(schema: NodeSchema, out: Path | str, *,
                     module_name: str | None = None) -> Path:
-    """Write the generated module to `out` (the bundle hook's target)."""
+    """Write the generated module to `out` (the bundle hook's target) and
+    byte-compile it beside it: `loader.load_typed_api` imports through the
+    import system, so the first load reads `__pycache__` instead of
+    compiling the (large) generated source."""
     out = Path(out)
-    name = module_name or out.stem
-    out.write_text(generate_typed_api(schema, name))
+    lines = _typed_api_lines(schema, module_name or out.stem)
+    # streamed line by line: the module source is never joined into one
+    # string beside its lines (same bytes as generate_typed_api)
+    with out.open("w", encoding="utf-8") as fh:
+        fh.writelines(f"{line}\n" for line in lines[:-1])
+        fh.write(lines[-1])
+    py_compile.compile(str(out), doraise=True)
     return out
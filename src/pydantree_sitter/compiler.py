@@ -16,12 +16,16 @@ class or a global registry (D5).
 
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass, field as dc_field
 from typing import Any, Optional, get_args, get_origin
 
+from pydantic import TypeAdapter
+
 from .emit import Query, cap, node
 from .errors import QueryBuildError, SchemaCheckError, ShapeError
 from .markers import ANCHOR, GAP, RECORD_CAP, AnyOf, Eq, Matches
+from .materialize import kwargs_plan
 from .spec import FieldBinding, MatchSpec, unwrap_optional
 from .valuemap import (
     JSON_KINDS,
@@ -57,6 +61,22 @@ class _Compiled:
     record_kind: Optional[str] = None
     pair_kind: Optional[str] = None
     nested_extractors: dict = dc_field(default_factory=dict)
+    _rows: Any = dc_field(default=None, init=False, repr=False, compare=False)
+    _plan: Any = dc_field(default=None, init=False, repr=False, compare=False)
+
+    def rows_adapter(self) -> TypeAdapter:
+        """`TypeAdapter(list[model])`, built on first use: ONE pydantic-core
+        call validates a whole batch of rows (extract loops, row cache)."""
+        if self._rows is None:
+            self._rows = TypeAdapter(list[self.model])
+        return self._rows
+
+    def kwargs_plan(self) -> tuple:
+        """`materialize.kwargs_plan` for this model, resolved on first use:
+        each field's value source, decided once instead of per row."""
+        if self._plan is None:
+            self._plan = kwargs_plan(self.model, self.bindings)
+        return self._plan
 
     @property
     def quant_maps(self):
@@ -495,6 +515,15 @@ def _check_type(model_cls, schema, vm: ValueMap, b, f, possible: set,
                    entry=where)
 
 
+# the ValueMap scalars each numeric/bool target accepts (exact-type keys:
+# `bool` never falls through to `int`'s entry)
+_SCALARS_FOR: dict[type, frozenset[str]] = {
+    int: frozenset({"int"}),
+    float: frozenset({"float", "int"}),
+    bool: frozenset({"bool"}),
+}
+
+
 def _kind_coerces(schema, vm: ValueMap, target, kind: str) -> bool:
     """Does `kind` coerce to `target`? (ValueMap-backed; supertypes
     expanded.) The committed ValueMap is authoritative (D6) — the name-regex
@@ -505,12 +534,9 @@ def _kind_coerces(schema, vm: ValueMap, target, kind: str) -> bool:
     if origin is list:
         args = get_args(base)
         base = unwrap_optional(args[0]) if args else str
-    if base is int:
-        return any(_scalar_of(schema, vm, k) == "int" for k in expanded)
-    if base is float:
-        return any(_scalar_of(schema, vm, k) in ("float", "int") for k in expanded)
-    if base is bool:
-        return any(_scalar_of(schema, vm, k) == "bool" for k in expanded)
+    accepts = _SCALARS_FOR.get(base) if isinstance(base, type) else None
+    if accepts is not None:
+        return any(_scalar_of(schema, vm, k) in accepts for k in expanded)
     if base is str:
         # text-yielding = a structural text shape OR a ValueMap declaration
         # (scalar "str" / wrapper kind) — mirrors record-mode emission
@@ -826,13 +852,41 @@ def _check_record_bindings(model_cls, schema, vm: ValueMap, pair_kind,
 def _preds_for(b: FieldBinding):
     """Predicates apply to the VALUE capture (record mode: the value node;
     field mode: the captured field node). Marker identity is isinstance
-    (F-A13)."""
+    (F-A13).
+
+    Stacked markers fuse into ONE predicate where they can: Eq/AnyOf
+    intersect into one value set, and each Matches is decided against that
+    set here (`re.search` over the str text — the bindings' `#match?`), so
+    the query engine runs one text predicate per match instead of one per
+    marker. Regex-only stacks, an empty intersection and a regex `re`
+    rejects keep the per-marker predicates (the query reports them)."""
     out = []
+    values: tuple | None = None
+    regexes: list[str] = []
     for m in b.predicates:
         if isinstance(m, Matches):
             out.append(cap(b.capture_name).matches(m.re))
-        elif isinstance(m, Eq):
+            regexes.append(m.re)
+            continue
+        if isinstance(m, Eq):
             out.append(cap(b.capture_name).eq(m.value))
+            allowed = (m.value,)
         elif isinstance(m, AnyOf):
             out.append(cap(b.capture_name).any_of(*m.values))
-    return out
+            allowed = m.values
+        else:
+            continue
+        values = allowed if values is None else \
+            tuple(v for v in values if v in allowed)
+    if values is None or len(out) < 2:
+        return out
+    try:
+        values = tuple(dict.fromkeys(
+            v for v in values if all(re.search(r, v) for r in regexes)))
+    except re.error:
+        return out
+    if not values:
+        return out
+    if len(values) == 1:
+        return [cap(b.capture_name).eq(values[0])]
+    return [cap(b.capture_name).any_of(*values)]
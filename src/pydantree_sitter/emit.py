@@ -125,6 +125,14 @@ class PatternSet:
 
 
 def _emit(spec: NodeSpec, parts: list[str]) -> None:
+    if not spec.children and not spec.predicates:
+        # a leaf (most of a pattern's nodes): one closed-form piece, not
+        # an append per token
+        if spec.cap_name:
+            parts.append(f"({spec.type or '_'}){spec.quant} @{spec.cap_name}")
+        else:
+            parts.append(f"({spec.type or '_'}){spec.quant}")
+        return
     parts.append("(")
     parts.append(spec.type if spec.type else "_")
     for c in spec.children:
@@ -134,13 +142,17 @@ def _emit(spec: NodeSpec, parts: list[str]) -> None:
             parts.append(":")
         _emit(c, parts)   # fully emits ( ... ) quant @cap for the child
     for p in spec.predicates:
+        parts.append(" (#")
+        parts.append(p.name)
         parts.append(" ")
-        parts.append(p.emit())
+        parts.append(" ".join(p.args))
+        parts.append(")")
     parts.append(")")
     if spec.quant:
         parts.append(spec.quant)
     if spec.cap_name:
-        parts.append(" @" + spec.cap_name)
+        parts.append(" @")
+        parts.append(spec.cap_name)
 
 
 def node(type: Optional[str] = None) -> NodeSpec:
@@ -200,16 +212,23 @@ class Query:
     def source(self) -> str:
         if self.raw_source is not None:
             return self.raw_source
-        return "\n\n".join(s.emit() for s in self.specs)
+        # every pattern into ONE buffer, joined once
+        parts: list[str] = []
+        for i, s in enumerate(self.specs):
+            if i:
+                parts.append("\n\n")
+            _emit(s, parts)
+        return "".join(parts)
 
     def compile(self, lang: tree_sitter.Language) -> tree_sitter.Query:
         if self._compiled is not None:
             return self._compiled
+        source = self.source
         try:
-            q = tree_sitter.Query(lang, self.source)
+            q = tree_sitter.Query(lang, source)
         except tree_sitter.QueryError as e:
             raise QueryBuildError(
-                f"emitted .scm rejected by Query(): {e}\n---\n{self.source}"
+                f"emitted .scm rejected by Query(): {e}\n---\n{source}"
             ) from e
         if self.raw_source is None and q.pattern_count != len(self.specs):
             raise QueryBuildError(
@@ -272,17 +291,27 @@ class Cursor:
         self._tree = tree
 
     def matches(self) -> list["MatchView"]:
-        out = []
-        for pi, caps in tree_sitter.QueryCursor(self._query).matches(self._tree.root_node):
-            out.append(MatchView(pi, caps, self._quant_maps[pi]))
-        return out
+        return self._wrap(
+            tree_sitter.QueryCursor(self._query).matches(self._tree.root_node))
 
     def matches_on(self, node: tree_sitter.Node) -> list["MatchView"]:
         """Matches scoped to a node (record extraction)."""
-        out = []
-        for pi, caps in tree_sitter.QueryCursor(self._query).matches(node):
-            out.append(MatchView(pi, caps, self._quant_maps[pi]))
-        return out
+        return self._wrap(tree_sitter.QueryCursor(self._query).matches(node))
+
+    def matches_at(self, node: tree_sitter.Node) -> list["MatchView"]:
+        """Matches whose pattern ROOT is `node` itself (start depth 0): the
+        cursor never starts a match below it, so a record's anchored inner
+        query skips its nested records' subtrees instead of matching them
+        and throwing the matches away."""
+        cursor = tree_sitter.QueryCursor(self._query)
+        cursor.set_max_start_depth(0)
+        return self._wrap(cursor.matches(node))
+
+    def _wrap(self, raw: list) -> list["MatchView"]:
+        # the bindings hand back the whole (eager) list: wrap it in one
+        # comprehension, not an append per match
+        maps = self._quant_maps
+        return [MatchView(pi, caps, maps[pi]) for pi, caps in raw]
 
 
 class MatchView:
@@ -298,7 +327,9 @@ class MatchView:
         self._quant = quant
 
     def nodes(self, name: str) -> list:
-        return list(self._caps.get(name, []))
+        """A copy of the capture's nodes: no caller can reach into the
+        match's own lists (per-match hot paths read `caps` instead)."""
+        return list(self._caps.get(name, ()))
 
     @property
     def caps(self) -> dict[str, list]:
@@ -53,21 +53,42 @@ def raise_ambiguous_capture(fname: str, capture_name: str, count: int) -> None:
         f"(nested key collision?)")
 
 
+# the message lists this many failures, each snippet / detail cut to
+# this many characters: a large file's thousands of failures (each
+# anchor's whole source, each pydantic error's input) stay in `.failures`,
+# not in one multi-megabyte str
+_SHOWN_FAILURES = 20
+_SNIPPET_CHARS = 80
+_DETAIL_CHARS = 240
+
+
 class ExtractionError(PydantreeSitterError):
     """One or more matches failed to materialize (strict mode); `.failures`
     carries per-match detail (pattern index, anchor span, snippet, pydantic
-    errors) instead of only the first error."""
+    errors) instead of only the first error. The message shows the first
+    `_SHOWN_FAILURES` of them, snippets and details truncated."""
 
     def __init__(self, failures: list, into):
+        for f in failures:
+            if f.snippet is None:       # decoded only on the raise path
+                f.snippet = f.span.text if f.span is not None else ""
         self.failures = failures
         self.into = into
         lines = [
             f"{len(failures)} match(es) failed to materialize "
             f"{into.__name__}:"]
-        for f in failures:
+        for f in failures[:_SHOWN_FAILURES]:
             where = f"line {f.span.line}" if f.span is not None else "?"
+            snippet, detail = f.snippet, f.detail
+            if len(snippet) > _SNIPPET_CHARS:
+                snippet = snippet[:_SNIPPET_CHARS] + "..."
+            if len(detail) > _DETAIL_CHARS:
+                detail = detail[:_DETAIL_CHARS] + "..."
             lines.append(
-                f"  - pattern {f.pattern} @ {where} {f.snippet!r}: {f.detail}")
+                f"  - pattern {f.pattern} @ {where} {snippet!r}: {detail}")
+        if len(failures) > _SHOWN_FAILURES:
+            lines.append(f"  ... and {len(failures) - _SHOWN_FAILURES} more "
+                         f"(see .failures)")
         super().__init__("\n".join(lines))
 
 
@@ -16,6 +16,7 @@ Bundle layout (produced by ``BuildResult.package()`` — see pydantree_sitter_gr
     node-schema.json    the derived node-schema (the bridge artifact)
     tree-sitter.json    bundle metadata: {"name": ..., "abi": ...}
     loader.py           a thin shim: from pydantree_sitter.loader import load_bundle
+    typed_api.py        optional typed CST accessors (``load_typed_api``)
 
 Wasm artifacts (Phase 7): the metadata's ``artifact`` field may name a
 ``.wasm`` instead of the ``.so`` (the seam's natural extension point).
@@ -32,10 +33,11 @@ needs wasm forks the binding and uses that code directly.
 
 from __future__ import annotations
 
-import ctypes
 import json
-import shutil
-from dataclasses import dataclass
+import sys
+import copy
+import types
+from dataclasses import dataclass, replace
 from pathlib import Path
 
 import tree_sitter
@@ -65,7 +67,11 @@ def load_grammar_so(so_path: Path | str, grammar_name: str | None = None):
     unlinked snapshot makes a loaded language immune to later rewrites of the
     bundle dir.
     """
+    # loader-only stdlib, imported on first load rather than with the
+    # package (ctypes dlopens _ctypes; most binds never load a bundle .so)
+    import ctypes
     import os
+    import shutil
     import tempfile
     so_path = Path(so_path).resolve()
     name = grammar_name or so_path.stem
@@ -130,6 +136,21 @@ class Bundle:
     path: Path
 
 
+# loaded bundles, keyed by resolved dir -> (files, their stat stamp, Bundle).
+# A repeat load (a Language per test / per request over one bundle) used to
+# re-copy + re-dlopen the .so and re-validate the schema; a hit now costs one
+# stat per file. Any rewrite of a bundle file (a rebuild into the same dir —
+# the REVIEW 020 scenario) changes the stamp and forces a full load. Each
+# caller gets its own Bundle and metadata; the loaded language, library and
+# schema are shared.
+_BUNDLES: dict[Path, tuple[tuple[Path, ...], tuple, Bundle]] = {}
+
+
+def _stamp(path: Path) -> tuple:
+    st = path.stat()
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
 def load_bundle(dir: Path | str) -> Bundle:
     """Load a bundle directory: grammar.so + node-schema.json + metadata.
 
@@ -141,13 +162,28 @@ def load_bundle(dir: Path | str) -> Bundle:
     artifact contract. Absent = format 1 (the original layout — accepted);
     an unknown (>2) format is rejected with `BundleError` naming both
     versions, so the artifact contract can never silently shift.
+
+    Memoized per directory while its files are unchanged (see `_BUNDLES`).
     """
     dir = Path(dir)
+    key = dir.resolve()
+    hit = _BUNDLES.get(key)
+    if hit is not None:
+        files, stamp, bundle = hit
+        try:
+            if tuple(map(_stamp, files)) == stamp:
+                return _handout(bundle)
+        except OSError:
+            pass                    # a file vanished: the full load reports it
     meta_path = dir / "tree-sitter.json"
     if not meta_path.exists():
         raise BundleError(
             f"not a grammar bundle: {dir} (no tree-sitter.json metadata; "
             f"see pydantree_sitter_grammar BuildResult.package())")
+    # each file is stamped BEFORE it is read: a rewrite racing this load
+    # can only make the memo entry miss, never serve stale content
+    files = [meta_path.resolve()]
+    stamp = [_stamp(files[-1])]
     metadata = json.loads(meta_path.read_text())
     fmt = metadata.get("bundle_format", 1)
     if not isinstance(fmt, int):
@@ -186,6 +222,8 @@ def load_bundle(dir: Path | str) -> Bundle:
             f"for the env-var protocol (TSGRAMMAR_WASM_LIB / "
             f"TSGRAMMAR_WASMTIME_LIB).")
     else:
+        files.append(so_path.resolve())
+        stamp.append(_stamp(files[-1]))
         language, lib = load_grammar_so(so_path, name)
 
     schema = None
@@ -193,6 +231,57 @@ def load_bundle(dir: Path | str) -> Bundle:
     if schema_rel:
         schema_path = dir / schema_rel
         if schema_path.exists():
+            files.append(schema_path.resolve())
+            stamp.append(_stamp(files[-1]))
             schema = NodeSchema.from_node_types_json(schema_path, name=name)
-    return Bundle(language=language, lib=lib, schema=schema,
-                  metadata=metadata, path=dir)
+    bundle = Bundle(language=language, lib=lib, schema=schema,
+                    metadata=metadata, path=dir)
+    if schema is not None or not schema_rel:
+        # (a declared-but-absent schema is not memoized: its later arrival
+        # would not change any stamp)
+        _BUNDLES[key] = (tuple(files), tuple(stamp), bundle)
+        return _handout(bundle)
+    return bundle
+
+
+def _handout(bundle: Bundle) -> Bundle:
+    return replace(bundle, metadata=copy.deepcopy(bundle.metadata))
+
+
+def load_typed_api(dir: Path | str) -> types.ModuleType:
+    """Import a bundle's typed_api.py through the import system, once.
+
+    A source-file spec goes through SourceFileLoader, so the module's
+    ``__pycache__`` bytecode (written by ``write_typed_api``) is reused
+    rather than the generated source re-compiled per load. The module is
+    registered in ``sys.modules`` under the name it was generated with
+    (``typed_api_<grammar name>``); a second call for the same, unchanged
+    file returns that module — a rebuilt typed_api.py is re-imported.
+    """
+    dir = Path(dir)
+    path = (dir / "typed_api.py").resolve()
+    if not path.exists():
+        raise BundleError(
+            f"bundle {dir}: no typed_api.py (package with typed_api=True)")
+    meta_path = dir / "tree-sitter.json"
+    name = json.loads(meta_path.read_text()).get("name") \
+        if meta_path.exists() else None
+    mod_name = f"typed_api_{name or path.parent.name}"
+    # stamped BEFORE the import, as in load_bundle: a rewrite racing it can
+    # only force one more import, never pin stale content
+    stamp = _stamp(path)
+    mod = sys.modules.get(mod_name)
+    if (mod is not None and getattr(mod, "__file__", None) == str(path)
+            and getattr(mod, "_bundle_stamp", None) == stamp):
+        return mod
+    import importlib.util
+    spec = importlib.util.spec_from_file_location(mod_name, path)
+    mod = importlib.util.module_from_spec(spec)
+    mod._bundle_stamp = stamp
+    sys.modules[mod_name] = mod
+    try:
+        spec.loader.exec_module(mod)
+    except BaseException:
+        del sys.modules[mod_name]
+        raise
+    return mod
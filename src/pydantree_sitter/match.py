@@ -4,7 +4,8 @@
 M() path's prefix (the steps before the anchor), applied uniformly to every
 match loop (scalar and list branches share it — the NEW list-branch skip bug
 is fixed by construction). It is called from EXACTLY ONE place: the match
-loop, before grouping.
+loop, before grouping — through `ancestor_path_matcher`, its batch form,
+which memoizes the backtracking across the anchors of one tree.
 
 Property-tested (hypothesis) against a brute-force reference matcher.
 
@@ -32,27 +33,78 @@ def match_ancestor_path(node, path: tuple) -> bool:
     """
     if len(path) == 1:
         return True
-    steps = tuple(reversed(path[:-1]))   # from the anchor upward
+    return _match_anchor(node, tuple(reversed(path[:-1])), None)
+
+
+def ancestor_path_matcher(path: tuple, *, nested: bool = False):
+    """The batch form of `match_ancestor_path` for the anchors of ONE tree:
+    a predicate whose per-(ancestor, step) outcomes are memoized by node id.
+    Sibling anchors share their whole ancestor chain, so the backtracking
+    over it runs once per ancestor instead of once per anchor.
+
+    `nested=True` states that the anchor came from the emitted query, which
+    already nests the steps after the LAST gap as a direct-child chain
+    (compiler._split_suffix): the walk climbs straight past them and only
+    the steps above are matched — re-checking what the query guaranteed is
+    skipped."""
+    if len(path) == 1:
+        return lambda node: True
+    memo: dict[tuple[int, int], bool] = {}
+    if nested:
+        gaps = [i for i, s in enumerate(path) if s is GAP]
+        if not gaps:
+            return lambda node: True
+        # path[gaps[-1] + 1:] is the query's chain; its top is `climb`
+        # parents above the anchor
+        climb = len(path) - 2 - gaps[-1]
+        steps = tuple(reversed(path[:gaps[-1] + 1]))
+        full = tuple(reversed(path[:-1]))
+
+        def on_path(node) -> bool:
+            top = node
+            for _ in range(climb):
+                top = top.parent
+                if top is None:     # not a query anchor: check everything
+                    return _match_anchor(node, full, None)
+            return _match_anchor(top, steps, memo)
+        return on_path
+    steps = tuple(reversed(path[:-1]))      # from the anchor upward
+    return lambda node: _match_anchor(node, steps, memo)
+
+
+def _match_anchor(node, steps: tuple, memo: dict | None) -> bool:
     parent = node.parent
     if parent is None:
         # no ancestors: the prefix must be all gaps (consumed with zero)
         return all(s is GAP for s in steps)
-    return _match_steps(parent, steps, 0)
+    return _match_steps(parent, steps, 0, memo)
 
 
-def _match_steps(node, steps: tuple, i: int) -> bool:
+def _match_steps(node, steps: tuple, i: int, memo: dict | None) -> bool:
     """Match `steps[i:]` against `node` and its ancestors (backtracking)."""
     if i >= len(steps):
         return True
+    if memo is not None and steps[i] is GAP:
+        # only gap steps are memoized: they are what backtracks up the
+        # chain; a kind step is one string compare
+        key = (node.id, i)
+        hit = memo.get(key)
+        if hit is None:
+            hit = memo[key] = _match_step(node, steps, i, memo)
+        return hit
+    return _match_step(node, steps, i, memo)
+
+
+def _match_step(node, steps: tuple, i: int, memo: dict | None) -> bool:
     step = steps[i]
     if step is GAP:
         # the gap absorbs zero ancestors (the next step matches `node`
         # itself) or one at a time — try both orders
-        if _match_steps(node, steps, i + 1):
+        if _match_steps(node, steps, i + 1, memo):
             return True
         parent = node.parent
         if parent is not None:
-            return _match_steps(parent, steps, i)
+            return _match_steps(parent, steps, i, memo)
         return False
     if isinstance(step, PathStep) and node.type in step.kinds:
         parent = node.parent
@@ -60,7 +112,7 @@ def _match_steps(node, steps: tuple, i: int) -> bool:
             # the remaining steps must be gaps (consumable with zero
             # ancestors) — the path needn't reach the root
             return all(s is GAP for s in steps[i + 1:])
-        return _match_steps(parent, steps, i + 1)
+        return _match_steps(parent, steps, i + 1, memo)
     return False
 
 
@@ -68,26 +120,36 @@ def _match_steps(node, steps: tuple, i: int) -> bool:
 # anchor grouping / merge (the ONE place captures become rows)
 # ---------------------------------------------------------------------------
 
-def group_matches(matches: list, anchor_cap: str = ANCHOR):
+def group_matches(matches: list, anchor_cap: str = ANCHOR, *, keep=None):
     """Group matches by their anchor node id, preserving first-seen order.
 
     Returns (groups, order): groups[id] = [capture dicts sharing the anchor].
     Matches with no anchor share the synthetic id 0 (the emitter always
     captures the anchor, so this is a defensive fallback only).
+
+    `keep` (an anchor predicate, e.g. `ancestor_path_matcher`) filters in
+    the same pass that reads the anchor: a match without an anchor, or whose
+    anchor fails it, is dropped — one walk over the matches, not a filter
+    pass and then a grouping pass.
     """
     groups: dict[int, list[dict]] = {}
     order: list[int] = []
     for m in matches:
-        caps = dict(m.caps)
+        caps = m.caps
         anc = caps.get(anchor_cap)
         if not anc:
+            if keep is not None:
+                continue
             gid = 0
         else:
+            if keep is not None and not keep(anc[0]):
+                continue
             gid = anc[0].id
-        if gid not in groups:
+        group = groups.get(gid)
+        if group is None:
             order.append(gid)
-            groups[gid] = []
-        groups[gid].append(caps)
+            groups[gid] = group = []
+        group.append(caps)
     return groups, order
 
 
@@ -111,10 +173,14 @@ def merge_group(caps_list: list[dict], bindings) -> dict:
         `AmbiguousCaptureError` if a scalar is still fed by more than one
         distinct node (the ONE AmbiguousCaptureError, §1.3).
     """
-    merged: dict[str, list] = {}
-    for caps in caps_list:
-        for name, nodes in caps.items():
-            merged.setdefault(name, []).extend(nodes)
+    if len(caps_list) == 1:
+        # the common case (one match per anchor): nothing to concatenate
+        merged = dict(caps_list[0])
+    else:
+        merged = {}
+        for caps in caps_list:
+            for name, nodes in caps.items():
+                merged.setdefault(name, []).extend(nodes)
     for b in bindings:
         if b.is_meta or b.is_list:
             continue
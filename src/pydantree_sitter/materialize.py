@@ -16,21 +16,23 @@ wrong (F-A2). Nested models in FIELD mode are rejected at class creation
 
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass, field as dc_field
 from typing import Any, Optional, get_args, get_origin
 
 import tree_sitter
-from pydantic import ValidationError
+from pydantic import BaseModel, ValidationError
 
 from .emit import Cursor
 from .errors import (
     AmbiguousCaptureError,
     raise_ambiguous_capture,
     ExtractionError,
+    _SNIPPET_CHARS,
 )
 from .markers import ANCHOR, RECORD_CAP, _MARKERS, _MISSING
 from .markers import _Derived as _D
-from .match import group_matches, match_ancestor_path, merge_group
+from .match import ancestor_path_matcher, group_matches, merge_group
 from .spec import is_optional, unwrap_optional
 
 # MatchFailure is defined here (materialize owns per-match diagnostics);
@@ -38,10 +40,15 @@ from .spec import is_optional, unwrap_optional
 
 
 class Span:
-    """A source span (line/column, 1-based lines)."""
+    """A source span (line/column, 1-based lines).
+
+    `from_node` keeps the node's source as bytes (`text_bytes`); `text` is
+    decoded on first read — a row's span is usually consulted for its
+    lines/bytes, and decoding every anchor's whole source eagerly was the
+    bulk of a source_meta() Span's cost."""
 
     __slots__ = ("line", "column", "end_line", "end_column",
-                 "start_byte", "end_byte", "text")
+                 "start_byte", "end_byte", "_text", "_raw")
 
     def __init__(self, line, column, end_line, end_column,
                  start_byte, end_byte, text):
@@ -51,7 +58,27 @@ class Span:
         self.end_column = end_column
         self.start_byte = start_byte
         self.end_byte = end_byte
-        self.text = text
+        self._text = text
+        self._raw = None
+
+    @property
+    def text(self) -> str:
+        if self._text is None:
+            raw = self._raw
+            self._text = raw.decode("utf-8", "replace") if raw else ""
+        return self._text
+
+    @text.setter
+    def text(self, value: str) -> None:
+        self._text = value
+        self._raw = None            # re-encoded from the new text on demand
+
+    @property
+    def text_bytes(self) -> bytes:
+        """The span's source as bytes (no decode)."""
+        if self._raw is None:
+            self._raw = self.text.encode("utf-8")
+        return self._raw
 
     @classmethod
     def from_node(cls, node: tree_sitter.Node) -> "Span":
@@ -73,21 +100,46 @@ class Span:
         r = node.range
         start_row, start_column = r.start_point
         end_row, end_column = r.end_point
-        text = node.text.decode("utf-8", "replace") if node.text else ""
-        return cls(start_row + 1, start_column,
+        span = cls(start_row + 1, start_column,
                    end_row + 1, end_column,
-                   r.start_byte, r.end_byte, text)
-
-    def __repr__(self) -> str:  # pragma: no cover
+                   r.start_byte, r.end_byte, None)
+        span._raw = node.text or b""
+        return span
+
+    def __repr__(self) -> str:
+        # bounded like ExtractionError's snippets: a module-sized anchor's
+        # repr must not decode (or print) the whole module — an undecoded
+        # span decodes just enough head bytes for the shown characters
+        text = self._text
+        if text is None:
+            head = (self._raw or b"")[:4 * (_SNIPPET_CHARS + 1)]
+            text = head.decode("utf-8", "replace")
+        if len(text) > _SNIPPET_CHARS:
+            shown = repr(text[:_SNIPPET_CHARS]) + "..."
+        else:
+            shown = repr(text)
         return (f"Span({self.line}:{self.column}-"
-                f"{self.end_line}:{self.end_column} {self.text!r})")
+                f"{self.end_line}:{self.end_column} {shown})")
+
+
+# the lenient decode's escapes: \uXXXX or one mapped character; anything
+# else (an unknown escape, a trailing backslash) stays verbatim
+_ESCAPE = re.compile(r'\\(?:u([0-9a-fA-F]{4})|([ntr"\\bf/]))')
+_ESCAPED = {"n": "\n", "t": "\t", "r": "\r", '"': '"',
+            "\\": "\\", "b": "\b", "f": "\f", "/": "/"}
+
+
+def _unescape_one(m: re.Match) -> str:
+    hex_ = m.group(1)
+    return chr(int(hex_, 16)) if hex_ is not None else _ESCAPED[m.group(2)]
 
 
 def _unescape_json_string(text: str) -> str:
     """Decode a grammar string literal's content (JSON escape syntax first:
     \\n \\t \\" \\\\ \\uXXXX). Accepts either the string WRAPPER's full text
-    (with quotes) or the bare content. Falls back to a manual decode when
-    the strict JSON round-trip fails (a grammar lenient about raw newlines)."""
+    (with quotes) or the bare content. Falls back to a lenient decode (one
+    regex pass) when the strict JSON round-trip fails (a grammar lenient
+    about raw newlines)."""
     import json as _json
     try:
         if text.startswith('"') and text.endswith('"') and len(text) >= 2:
@@ -97,41 +149,21 @@ def _unescape_json_string(text: str) -> str:
         pass
     if text.startswith('"') and text.endswith('"') and len(text) >= 2:
         text = text[1:-1]
-    out: list[str] = []
-    i = 0
-    mapping = {"n": "\n", "t": "\t", "r": "\r", '"': '"',
-               "\\": "\\", "b": "\b", "f": "\f", "/": "/"}
-    while i < len(text):
-        if text[i] == "\\" and i + 1 < len(text):
-            nxt = text[i + 1]
-            if nxt in mapping:
-                out.append(mapping[nxt])
-                i += 2
-                continue
-            if nxt == "u" and i + 5 <= len(text):
-                try:
-                    out.append(chr(int(text[i + 2:i + 6], 16)))
-                    i += 6
-                    continue
-                except ValueError:
-                    pass
-            out.append(text[i])
-            i += 1
-        else:
-            out.append(text[i])
-            i += 1
-    return "".join(out)
+    return _ESCAPE.sub(_unescape_one, text)
 
 
-@dataclass
+@dataclass(slots=True)
 class MatchFailure:
     """One failed match: pattern index, anchor node, Span, snippet, and the
-    structured pydantic errors when the failure was a validation error."""
+    structured pydantic errors when the failure was a validation error.
+
+    The extract loops leave `snippet` None (a lenient extract drops its
+    failures unread); `ExtractionError` fills it from the span."""
 
     pattern: int
     anchor: Any
     span: Optional["Span"]
-    snippet: str
+    snippet: Optional[str]
     detail: str
     pydantic_errors: Optional[list] = None
 
@@ -152,9 +184,8 @@ def _failure(match, detail: str, *, anchor=None,
         ns = match.nodes(ANCHOR) or match.nodes(RECORD_CAP)
         node = ns[0] if ns else None
     span = Span.from_node(node) if node is not None else None
-    snippet = span.text if span is not None else ""
     return MatchFailure(pattern=getattr(match, "pi", 0), anchor=node,
-                        span=span, snippet=snippet, detail=detail,
+                        span=span, snippet=None, detail=detail,
                         pydantic_errors=pydantic_errors)
 
 
@@ -162,73 +193,98 @@ def _failure(match, detail: str, *, anchor=None,
 # build_kwargs — the ONE kwargs builder
 # ---------------------------------------------------------------------------
 
-def build_kwargs(model_cls, bindings, caps: dict) -> dict:
-    """Build one model's kwargs from a merged capture dict. Coercion goes
-    through pydantic (the model constructor is the coercion layer); this
-    only picks text/list/meta values."""
-    kwargs: dict = {}
+# the plan's entry codes (meta codes first: `code <= _SPAN` is "meta")
+_LINE, _SPAN, _CONST, _NESTED, _TEXT = range(5)
+_FRESH_LIST = object()      # missing list capture: a NEW [] per row
+
+
+def kwargs_plan(model_cls, bindings) -> tuple:
+    """Resolve, once per compiled model, how each field gets its value: one
+    `(code, field, capture, missing, is_list, unescape)` entry per field
+    `build_kwargs` fills. The field -> binding lookup, the annotation
+    unwrap and the default resolution used to run per field per ROW;
+    `missing` is the value for an absent capture (`_MISSING`: leave the
+    field absent)."""
+    by_name: dict = {}
+    for b in bindings:
+        by_name.setdefault(b.name, b)
+    plan = []
     for fname, f in model_cls.model_fields.items():
-        b = _binding_for(bindings, fname)
+        b = by_name.get(fname)
         if b is None:
             # derived() field: excluded from the query — its constant value
             # applies (derived(value)); bare derived() stays absent
             if isinstance(f.default, _D) and f.default.default is not _MISSING:
-                kwargs[fname] = f.default.default
+                plan.append((_CONST, fname, None, f.default.default,
+                             False, False))
             continue
         if b.is_meta:
-            n = caps.get(b.capture_name)
-            node = n[0] if n else None
-            if node is not None:
-                if unwrap_optional(f.annotation) is int:
-                    # REVIEW 020 minor: `int | None` source_meta() used to
-                    # fall into the Span branch (annotation is not exactly
-                    # `int`) and fail validation.
-                    # tuple access, not `.row` — see Span.from_node
-                    kwargs[fname] = node.start_point[0] + 1
-                else:
-                    kwargs[fname] = Span.from_node(node)
+            # REVIEW 020 minor: `int | None` source_meta() used to fall
+            # into the Span branch (annotation is not exactly `int`) and
+            # fail validation.
+            code = _LINE if unwrap_optional(f.annotation) is int else _SPAN
+            plan.append((code, fname, b.capture_name, _MISSING, False, False))
             continue
-        nodes = caps.get(b.capture_name, [])
+        if b.is_list:
+            missing = _FRESH_LIST
+        elif not f.is_required():
+            missing = (None if b.nested is None and _is_marker_default(f)
+                       else f.default)
+        elif b.nested is None and _is_optional(f.annotation):
+            missing = None
+        else:
+            missing = _MISSING
         if b.nested is not None:
             # values are already materialized OutputModel instances (the
             # record recursion built them)
-            if not nodes:
-                if b.is_list:
-                    kwargs[fname] = []
-                elif not f.is_required():
-                    kwargs[fname] = f.default
-                continue
-            kwargs[fname] = nodes if b.is_list else nodes[0]
+            plan.append((_NESTED, fname, b.capture_name, missing,
+                         b.is_list, False))
+        else:
+            plan.append((_TEXT, fname, b.capture_name, missing,
+                         b.is_list, b.unescape))
+    return tuple(plan)
+
+
+def build_kwargs(plan: tuple, caps: dict) -> dict:
+    """Build one model's kwargs from a merged capture dict, following the
+    model's `kwargs_plan`. Coercion goes through pydantic (the model
+    constructor is the coercion layer); this only picks text/list/meta
+    values."""
+    kwargs: dict = {}
+    for code, fname, cname, missing, is_list, unescape in plan:
+        if code == _CONST:
+            kwargs[fname] = missing
+            continue
+        nodes = caps.get(cname)
+        if code <= _SPAN:
+            if nodes:
+                node = nodes[0]
+                # tuple access, not `.row` — see Span.from_node
+                kwargs[fname] = (node.start_point[0] + 1 if code == _LINE
+                                 else Span.from_node(node))
             continue
         if not nodes:
-            if b.is_list:
+            if missing is _FRESH_LIST:
                 kwargs[fname] = []
-            elif not f.is_required():
-                kwargs[fname] = None if _is_marker_default(f) else f.default
-            elif _is_optional(f.annotation):
-                kwargs[fname] = None
+            elif missing is not _MISSING:
+                kwargs[fname] = missing
             continue
-        if b.is_list:
-            if b.unescape:
+        if code == _NESTED:
+            kwargs[fname] = nodes if is_list else nodes[0]
+        elif is_list:
+            if unescape:
                 kwargs[fname] = [_unescape_json_string(_text_of(n))
                                  for n in nodes]
             else:
                 kwargs[fname] = [_text_of(n) for n in nodes]
         else:
             if len(nodes) > 1:
-                raise_ambiguous_capture(fname, b.capture_name, len(nodes))
+                raise_ambiguous_capture(fname, cname, len(nodes))
             text = _text_of(nodes[0])
-            kwargs[fname] = _unescape_json_string(text) if b.unescape else text
+            kwargs[fname] = _unescape_json_string(text) if unescape else text
     return kwargs
 
 
-def _binding_for(bindings, fname):
-    for b in bindings:
-        if b.name == fname:
-            return b
-    return None
-
-
 def _is_marker_default(f) -> bool:
     return isinstance(f.default, _MARKERS)
 
@@ -247,57 +303,110 @@ def extract_field(model_cls, compiled, tree: tree_sitter.Tree, *,
     q = compiled.query.compile(tree.language)
     matches = Cursor(q, compiled.quant_maps, tree).matches()
     # ONE call site for the ancestor matcher: before grouping, so scalar and
-    # list branches share it (the NEW list-branch skip dies by construction)
-    if compiled.match_path is not None:
-        matches = [m for m in matches
-                   if _anchor_of(m) is not None and
-                   match_ancestor_path(_anchor_of(m), compiled.match_path)]
-    results, errors = [], []
-    if compiled.spec.raw_query is not None:
+    # list branches share it (the NEW list-branch skip dies by construction);
+    # an emitted query already nests the after-last-gap chain, a raw one not
+    raw = compiled.spec.raw_query is not None
+    on_path = (ancestor_path_matcher(compiled.match_path, nested=not raw)
+               if compiled.match_path is not None else None)
+    results, errors, pending = [], [], []
+    plan = compiled.kwargs_plan()
+    if raw:
+        if on_path is not None:
+            # fused into the row loop below: one walk, no filtered copy
+            matches = (m for m in matches
+                       if (a := _anchor_of(m)) is not None and on_path(a))
         # a raw query has no emitted anchor: ONE row per match; source_meta()
         # falls back to the first capture's node as the anchor (A8: the
-        # query's DECLARED capture order, not dict insertion order)
+        # query's DECLARED capture order, not dict insertion order) — read
+        # from the query once, not per row
+        declared = [q.capture_name(ci) for ci in range(q.capture_count)]
         for m in matches:
             caps = dict(m.caps)
             if "__anchor__" not in caps:
-                for ci in range(q.capture_count):
-                    name = q.capture_name(ci)
+                for name in declared:
                     v = caps.get(name)
                     if v:
                         caps["__anchor__"] = [v[0]]
                         break
             try:
-                results.append(model_cls(**build_kwargs(model_cls,
-                                                        compiled.bindings,
-                                                        caps)))
-            except ValidationError as e:
-                errors.append(_failure(m, f"pydantic ValidationError: {e.errors()}",
-                                       pydantic_errors=e.errors()))
+                pending.append((build_kwargs(plan, caps), m, None))
             except AmbiguousCaptureError as e:
-                errors.append(_failure(m, str(e)))
+                pending.append((None, _failure(m, str(e)), None))
+        _validate_rows(compiled, pending, results, errors)
         if errors and strict:
             raise ExtractionError(errors, model_cls)
         return results
-    groups, order = group_matches(matches)
+    # filtered while grouping: one pass over the matches
+    groups, order = group_matches(matches, keep=on_path)
     for gid in order:
         caps = merge_group(groups[gid], compiled.bindings)
         try:
-            results.append(model_cls(**build_kwargs(model_cls,
-                                                    compiled.bindings, caps)))
-        except ValidationError as e:
-            errors.append(_failure(None,
-                                   f"pydantic ValidationError: {e.errors()}",
-                                   anchor=_first_anchor(caps),
-                                   pydantic_errors=e.errors()))
+            pending.append((build_kwargs(plan, caps), None,
+                            _first_anchor(caps)))
         except AmbiguousCaptureError as e:
-            errors.append(_failure(None, str(e), anchor=_first_anchor(caps)))
+            pending.append((None, _failure(None, str(e),
+                                           anchor=_first_anchor(caps)), None))
+    _validate_rows(compiled, pending, results, errors)
     if errors and strict:
         raise ExtractionError(errors, model_cls)
     return results
 
 
+def _validate_rows(compiled, pending, results, errors) -> None:
+    """Construct a loop's rows in ONE pydantic-core call.
+
+    `pending` holds `(kwargs, match, anchor)` per row in match order, or
+    `(None, failure, None)` for a row already rejected. A model that
+    overrides `__init__` is constructed row by row, so the override runs."""
+    model_cls = compiled.model
+    if model_cls.__init__ is not BaseModel.__init__:
+        _construct_rows(model_cls, pending, results, errors)
+        return
+    batch = [kw for kw, _, _ in pending if kw is not None]
+    adapter = compiled.rows_adapter()
+    bad: dict[int, list] = {}
+    try:
+        rows = adapter.validate_python(batch)
+    except ValidationError as e:
+        # the list error names every failing row: those keep their own
+        # errors; only the rest are validated again, in one more call
+        for err in e.errors():
+            loc = err["loc"]
+            if not loc or not isinstance(loc[0], int):
+                _construct_rows(model_cls, pending, results, errors)
+                return
+            bad.setdefault(loc[0], []).append(dict(err, loc=loc[1:]))
+        rows = adapter.validate_python(
+            [kw for i, kw in enumerate(batch) if i not in bad])
+    row = iter(rows)
+    i = 0
+    for kwargs, m, anchor in pending:
+        if kwargs is None:
+            errors.append(m)
+            continue
+        errs = bad.get(i)
+        i += 1
+        if errs is None:
+            results.append(next(row))
+        else:
+            errors.append(_failure(m, f"pydantic ValidationError: {errs}",
+                                   anchor=anchor, pydantic_errors=errs))
+
+
+def _construct_rows(model_cls, pending, results, errors) -> None:
+    for kwargs, m, anchor in pending:
+        if kwargs is None:
+            errors.append(m)
+            continue
+        try:
+            results.append(model_cls(**kwargs))
+        except ValidationError as e:
+            errors.append(_failure(m, f"pydantic ValidationError: {e.errors()}",
+                                   anchor=anchor, pydantic_errors=e.errors()))
+
+
 def _anchor_of(match):
-    ns = match.nodes(ANCHOR)
+    ns = match.caps.get(ANCHOR)
     return ns[0] if ns else None
 
 
@@ -309,30 +418,25 @@ def extract_record(model_cls, compiled, tree: tree_sitter.Tree, *,
     `scoped_to` restricts the outer query to a subtree (nested models)."""
 
     rec_q = compiled.records.compile(tree.language)
-    results, errors = [], []
+    results, errors, pending = [], [], []
     if scoped_to is not None:
         outer = Cursor(rec_q, compiled.records_quant_maps, tree) \
             .matches_on(scoped_to)
     else:
         outer = Cursor(rec_q, compiled.records_quant_maps, tree).matches()
+    on_path = (ancestor_path_matcher(compiled.match_path, nested=True)
+               if compiled.match_path is not None else None)
     for rm in outer:
-        recs = rm.nodes(RECORD_CAP)
+        recs = rm.caps.get(RECORD_CAP)
         if not recs:
             continue
         rec = recs[0]
-        if compiled.match_path is not None and \
-                not match_ancestor_path(rec, compiled.match_path):
+        if on_path is not None and not on_path(rec):
             continue
         kwargs = _record_kwargs(model_cls, compiled, rec, tree)
-        if kwargs is None:
-            continue
-        try:
-            results.append(model_cls(**kwargs))
-        except ValidationError as e:
-            errors.append(_failure(rm, f"pydantic ValidationError: {e.errors()}",
-                                   anchor=rec, pydantic_errors=e.errors()))
-        except AmbiguousCaptureError as e:
-            errors.append(_failure(rm, str(e), anchor=rec))
+        if kwargs is not None:
+            pending.append((kwargs, rm, rec))
+    _validate_rows(compiled, pending, results, errors)
     if errors and strict:
         raise ExtractionError(errors, model_cls)
     return results
@@ -350,14 +454,17 @@ def _record_kwargs(model_cls, compiled, rec, tree):
 
     fld_q = compiled.fields.compile(tree.language)
     merged: dict[str, list] = {}
-    for fm in Cursor(fld_q, compiled.fields_quant_maps, tree).matches_on(rec):
-        anc = fm.nodes(ANCHOR)
-        if not anc or anc[0].id != rec.id:
+    rec_id = rec.id
+    for fm in Cursor(fld_q, compiled.fields_quant_maps, tree).matches_at(rec):
+        caps = fm.caps
+        anc = caps.get(ANCHOR)
+        if not anc or anc[0].id != rec_id:
             continue  # a nested record's pair — not a record-level key
-        for cname in set(fm.caps):
+        # the capture dict's own lists, read once (nodes() copies each)
+        for cname, nodes in caps.items():
             if cname == ANCHOR:
                 continue
-            merged.setdefault(cname, []).extend(fm.nodes(cname))
+            merged.setdefault(cname, []).extend(nodes)
     # record-level predicate semantics: a REQUIRED predicate field that did
     # not match (absent) filters the WHOLE record (the row is invalid, like
     # the field-mode query engine); an OPTIONAL one just stays absent (None)
@@ -389,5 +496,5 @@ def _record_kwargs(model_cls, compiled, rec, tree):
             merged[b.key] = []
             continue
         merged[b.key] = out
-    return build_kwargs(model_cls, compiled.bindings, merged)
+    return build_kwargs(compiled.kwargs_plan(), merged)
 
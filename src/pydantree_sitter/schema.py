@@ -29,21 +29,27 @@ run's node-types.json, copied byte-for-byte.
 from __future__ import annotations
 
 import json
+import sys
 from collections import defaultdict
 from pathlib import Path
-from typing import Any, Iterable
+from typing import Annotated, Any, Iterable
 
-from pydantic import BaseModel, Field, PrivateAttr
+from pydantic import AfterValidator, BaseModel, Field, PrivateAttr, TypeAdapter
 
 # --------------------------------------------------------------------------
 # models — mirror node-types.json's per-type shape
 # --------------------------------------------------------------------------
 
+# A node kind string, interned on load: node-types.json repeats each kind in
+# every field/children/subtypes list that mentions it, so interning shares
+# one object per kind and kind comparisons short-circuit on identity.
+Kind = Annotated[str, AfterValidator(sys.intern)]
+
 
 class NodeTypeRef(BaseModel):
     """A reference to a node type (in a field/children/subtypes list)."""
 
-    type: str
+    type: Kind
     named: bool = True
 
 
@@ -65,7 +71,7 @@ class NodeTypeInfo(BaseModel):
     serialization round-trips the CLI byproduct byte-for-byte.
     """
 
-    type: str
+    type: Kind
     named: bool = True
     root: bool = False
     extra: bool = False
@@ -74,6 +80,10 @@ class NodeTypeInfo(BaseModel):
     subtypes: list[NodeTypeRef] | None = None
 
 
+# validates a whole node-types list in one pydantic-core call
+_NODE_TYPE_LIST = TypeAdapter(list[NodeTypeInfo])
+
+
 def _emit_node_type(t: NodeTypeInfo) -> dict:
     """Serialize one entry in the CLI's exact node_types.rs emission shape:
     `type`/`named` always; `root`/`extra` only when true; `fields` only when
@@ -118,22 +128,33 @@ class NodeSchema(BaseModel):
     `node_types` is the canonical list. `name` is optional provenance
     (grammar name when known). `_by_type_cache` is built once on first
     lookup (A6 — `by_type` used to rebuild the dict on every call, and
-    `is_possible_descendant` calls it per node).
+    `is_possible_descendant` calls it per node). `_bits_cache` is likewise
+    built once: a dense id per kind and, per kind, its possible children
+    as an int bitset, so descent checks are one shift-and-mask and the
+    descendant closure ORs whole masks instead of merging string sets.
+    The masks fill per kind on first use: a bind checks a handful of
+    kinds, and building every kind's mask up front cost more than the
+    schema load itself.
     """
 
     name: str | None = None
     node_types: list[NodeTypeInfo] = Field(default_factory=list)
     _by_type_cache: dict | None = PrivateAttr(default=None)
+    _bits_cache: tuple | None = PrivateAttr(default=None)
+    _reach_cache: dict = PrivateAttr(default_factory=dict)
 
     # -- construction -------------------------------------------------------
 
     @classmethod
     def from_list(cls, types: Iterable[Any], *, name: str | None = None) -> "NodeSchema":
-        return cls(name=name, node_types=[NodeTypeInfo.model_validate(t) for t in types])
+        return cls(name=name, node_types=_NODE_TYPE_LIST.validate_python(list(types)))
 
     @classmethod
     def from_node_types_json(cls, path: str | Path, *, name: str | None = None) -> "NodeSchema":
-        data = json.loads(Path(path).read_text())
+        raw = Path(path).read_bytes()
+        if raw.lstrip()[:1] == b"[":        # the CLI's list form: bytes -> models
+            return cls(name=name, node_types=_NODE_TYPE_LIST.validate_json(raw))
+        data = json.loads(raw)
         if isinstance(data, dict) and "node_types" in data:  # our serialized form
             return cls.model_validate(data)
         return cls.from_list(data, name=name)
@@ -145,7 +166,10 @@ class NodeSchema(BaseModel):
         return _canonical_sorted([t.model_copy(deep=True) for t in self.node_types])
 
     def to_json(self, indent: int = 2) -> str:
-        return json.dumps([_emit_node_type(t) for t in self.to_list()],
+        # serialization only reads the entries: sort them as they are, not
+        # the deep copies to_list() hands out for callers to keep
+        return json.dumps([_emit_node_type(t)
+                           for t in _canonical_sorted(self.node_types)],
                           indent=indent)
 
     def write(self, path: str | Path) -> Path:
@@ -212,9 +236,7 @@ class NodeSchema(BaseModel):
 
     # -- structure queries used by A's checks -------------------------------
 
-    def possible_children(self, kind: str) -> set[str]:
-        """All kinds that can appear as a child of `kind` (fields' types +
-        children types, supertypes expanded)."""
+    def _possible_children(self, kind: str) -> set[str]:
         t = self.get(kind)
         if t is None:
             return set()
@@ -222,27 +244,90 @@ class NodeSchema(BaseModel):
         refs += [r.type for r in (t.children.types if t.children else [])]
         return self.expand(refs)
 
+    def _bits(self) -> tuple[dict[str, int], dict[str, int], list[str]]:
+        """(kind -> dense id, kind -> child bitset, id -> kind), built once;
+        the bitsets are filled by `_mask`."""
+        if self._bits_cache is None:
+            ids: dict[str, int] = {}
+            for t in self.node_types:
+                ids.setdefault(t.type, len(ids))
+            self._bits_cache = (ids, {}, list(ids))
+        return self._bits_cache
+
+    def _mask(self, kind: str) -> int:
+        """`kind`'s possible-children bitset, built on first use."""
+        ids, masks, names = self._bits()
+        m = masks.get(kind)
+        if m is None:
+            m = 0
+            for c in self._possible_children(kind):
+                i = ids.get(c)
+                if i is None:           # referenced, never declared
+                    i = ids[c] = len(names)
+                    names.append(c)
+                m |= 1 << i
+            masks[kind] = m
+        return m
+
+    def possible_children(self, kind: str) -> set[str]:
+        """All kinds that can appear as a child of `kind` (fields' types +
+        children types, supertypes expanded)."""
+        m = self._mask(kind)
+        names = self._bits()[2]
+        out: set[str] = set()
+        while m:
+            low = m & -m
+            out.add(names[low.bit_length() - 1])
+            m ^= low
+        return out
+
     def is_possible_descent(self, parent: str, child: str) -> bool:
-        return child in self.possible_children(parent)
+        m = self._mask(parent)      # first: it may assign `child` its id
+        i = self._bits()[0].get(child)
+        return i is not None and (m >> i) & 1 == 1
 
     def is_possible_descendant(self, ancestor: str, descendant: str) -> bool:
         """Can `descendant` occur at ANY depth under `ancestor` (transitive
         closure over possible_children)? The Job-1 check for the `...` path
         element — a gap allows arbitrary depth between the kinds it
-        separates."""
+        separates. The closure is one bitset per ancestor, grown a level
+        at a time only as far as a query needs: a `yes` a level or two down
+        stops there, and the cached (reach, frontier) resumes the walk for
+        the ancestor's next query."""
         if ancestor == descendant:
             return True
-        frontier = set(self.possible_children(ancestor))
-        seen: set[str] = set()
-        while frontier:
-            k = frontier.pop()
-            if k in seen:
-                continue
-            seen.add(k)
-            if k == descendant:
-                return True
-            frontier |= self.possible_children(k)
-        return False
+        ids, masks, names = self._bits()
+        mask = self._mask
+        state = self._reach_cache.get(ancestor)
+        if state is None:
+            frontier = mask(ancestor)
+            state = (frontier, frontier)
+        reach, frontier = state
+        if not frontier:            # the closure is complete: one bit test
+            i = ids.get(descendant)
+            return i is not None and (reach >> i) & 1 == 1
+        while True:
+            # expanding may assign `descendant` its id: look it up per level
+            i = ids.get(descendant)
+            if i is not None and (reach >> i) & 1:
+                found = True
+                break
+            if not frontier:
+                found = False
+                break
+            step = 0
+            while frontier:
+                low = frontier & -frontier
+                kind = names[low.bit_length() - 1]
+                # built masks straight from the dict: `_mask` re-reads the
+                # private cache through pydantic's __getattr__ per call
+                m = masks.get(kind)
+                step |= mask(kind) if m is None else m
+                frontier ^= low
+            frontier = step & ~reach
+            reach |= frontier
+        self._reach_cache[ancestor] = (reach, frontier)
+        return found
 
     def can_occur(self, kind: str) -> bool:
         """Is `kind` a real, named, producible node kind?"""
@@ -263,9 +348,12 @@ def derive_from_node_types(node_types_json: Any) -> list[NodeTypeInfo]:
     canonical node-schema list. Aliases/inline are already flattened away;
     supertypes arrive as `subtypes` entries."""
     if isinstance(node_types_json, (str, Path)):
-        node_types_json = json.loads(Path(node_types_json).read_text())
+        raw = Path(node_types_json).read_bytes()
+        if raw.lstrip()[:1] == b"[":    # the CLI's list form: bytes -> models
+            return _NODE_TYPE_LIST.validate_json(raw)
+        node_types_json = json.loads(raw)
     if isinstance(node_types_json, dict) and "node_types" in node_types_json:
         node_types_json = node_types_json["node_types"]
-    return [NodeTypeInfo.model_validate(t) for t in node_types_json]
+    return _NODE_TYPE_LIST.validate_python(list(node_types_json))
 
 
@@ -69,14 +69,14 @@ __all__ = [
 # ---------------------------------------------------------------------------
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PathStep:
     """One M() path element; `kinds` has len>1 for alternation (D11)."""
 
     kinds: tuple[str, ...]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FieldBinding:
     """One resolved field's binding (pure data; predicates are the inert
     marker objects, not emitted Preds)."""
@@ -110,7 +110,7 @@ class FieldBinding:
         return self.key
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MatchSpec:
     """The whole declaration: the anchored ancestor path, the record flag,
     and the field bindings. `raw_query` is mutually exclusive with `path`
@@ -27,11 +27,15 @@ Notes:
 
 from __future__ import annotations
 
-import inspect
+import functools
 import linecache
+import os
+import sys
 from dataclasses import dataclass
 from pathlib import Path
 
+from pydantic import TypeAdapter
+
 from .ir import (
     AliasNode,
     BlankNode,
@@ -61,7 +65,7 @@ from .ir import (
 # definition-site recording
 # ---------------------------------------------------------------------------
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RuleSite:
     """Where a rule was defined in the author's Python source."""
     file: str
@@ -75,7 +79,9 @@ class RuleSite:
 def _track(node: Rule) -> Rule:
     """Stamp the call site of a node constructor onto the node itself (D8:
     provenance lives on the node — no registry, no drain, no id-reuse)."""
-    node._site = caller_site(skip=3)   # pydantic private attr (frozen-safe)
+    # straight into the private-attr dict: BaseModel.__setattr__ costs ~5x
+    # this per node and only re-derives that `_site` is a private attr
+    node.__pydantic_private__["_site"] = caller_site(skip=3)
     return node
 
 
@@ -83,23 +89,42 @@ def caller_site(skip: int = 2) -> RuleSite:
     """The ONE frame-walking helper: capture the call site (file/lineno/
     source) `skip` frames up. Every attribution path goes through here; a
     refactor that adds a frame fails the caller_site unit tests instead of
-    silently mis-attributing."""
-    frame = inspect.currentframe()
+    silently mis-attributing. `sys._getframe(skip)` lands on the same frame
+    as `skip` hops of `f_back` from inspect.currentframe() without the
+    Python-level loop — every combinator call pays this."""
+    frame = sys._getframe(skip)
     try:
-        for _ in range(skip):
-            frame = frame.f_back  # type: ignore[union-attr]
-        fname = frame.f_code.co_filename  # type: ignore[union-attr]
-        lineno = frame.f_lineno  # type: ignore[union-attr]
-        source = linecache.getline(fname, lineno).rstrip("\n")
-        return RuleSite(fname, lineno, source)
+        fname = frame.f_code.co_filename
+        return _site_at(fname, frame.f_lineno, _file_stamp(fname))
     finally:
         del frame
 
 
+def _file_stamp(fname: str) -> tuple[int, int] | None:
+    """(mtime_ns, size) of a source file — the identity `_site_at` keys on,
+    so a grammar file edited in-process never yields a stale line."""
+    try:
+        st = os.stat(fname)
+    except OSError:                     # <stdin>, <string>, a zip member
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+@functools.lru_cache(maxsize=8192)
+def _site_at(fname: str, lineno: int, stamp: tuple[int, int] | None) -> RuleSite:
+    """One shared RuleSite per source line (it is frozen): a grammar's
+    nodes come from a few hundred lines, and a helper or loop body stamps
+    the same line over and over — the linecache read and the record are
+    paid once per line, not once per node."""
+    linecache.checkcache(fname)         # a new stamp: drop linecache's copy too
+    return RuleSite(fname, lineno, linecache.getline(fname, lineno).rstrip("\n"))
+
+
 def site_of(node: Rule) -> RuleSite | None:
     """The definition site stamped on a node (D8: provenance lives on the
-    node; no per-grammar store)."""
-    return getattr(node, "_site", None)
+    node; no per-grammar store). Read from the private-attr dict: a
+    `getattr` probe goes through pydantic's `__getattr__`."""
+    return node.__pydantic_private__.get("_site")
 
 
 # ---------------------------------------------------------------------------
@@ -144,15 +169,19 @@ def _only_whitespace(pattern: str) -> bool:
 
 
 def _iter_body_nodes(node: RuleNode):
-    """DFS over a rule tree (cycles impossible: Symbol refs are leaves)."""
+    """DFS over a rule tree (cycles impossible: Symbol refs are leaves).
+    The children come from the field dict, as in checks.iter_children: a
+    `getattr(n, name, None)` on a node without the field raises and
+    swallows an AttributeError inside pydantic's `__getattr__`."""
     stack = [node]
     while stack:
         n = stack.pop()
         yield n
-        c = getattr(n, "content", None)
+        fields = n.__dict__
+        c = fields.get("content")
         if isinstance(c, RuleNode):
             stack.append(c)
-        m = getattr(n, "members", None)
+        m = fields.get("members")
         if isinstance(m, list):
             stack.extend(m)
 
@@ -264,27 +293,83 @@ def prec_dynamic(value: int, x: B | Rule | str) -> B:
     return B(_track(PrecDynamicNode(value=value, content=as_node(x))))
 
 
+@functools.cache
+def _members_adapter() -> TypeAdapter:
+    # built on first operator use: the node schemas are deferred (ir.RuleNode)
+    return TypeAdapter(list[Rule])
+
+
 class B:
-    """Thin wrapper so `a + b` (seq) and `a | b` (choice) work."""
+    """Thin wrapper so `a + b` (seq) and `a | b` (choice) work.
+
+    An operator chain is built copy-on-write: `x | y | z | ...` shares ONE
+    append-only member list, each intermediate B keeping its own length
+    mark; each operator validates only the members it adds, and the
+    SeqNode/ChoiceNode is assembled when `.node` is read. Rebuilding and
+    revalidating the whole member list per operator made an n-way chain
+    O(n²). A B extended twice (`a | x`, then `a | y`) forks the list at its
+    own mark — every B still denotes exactly the members it was built from.
+    """
 
-    __slots__ = ("node",)
+    __slots__ = ("_node", "_kind", "_members", "_n", "_site")
 
     def __init__(self, node: Rule):
-        self.node = node
+        self._node = node
+        self._kind = None
+
+    @property
+    def node(self) -> Rule:
+        node = self._node
+        if node is None:
+            node = self._node = self._kind(members=self._members[:self._n])
+            node.__pydantic_private__["_site"] = self._site
+        return node
+
+    @node.setter
+    def node(self, node: Rule) -> None:
+        self._node = node
+        self._kind = None
+
+    def _flat(self, kind: type) -> list:
+        """This operand's members under `kind` flattening (a fresh list)."""
+        if self._node is None and self._kind is kind:
+            return self._members[:self._n]
+        node = self.node
+        return list(node.members) if isinstance(node, kind) else [node]
+
+    def _grow(self, kind: type, other: B | Rule | str) -> B:
+        if isinstance(other, B):
+            added = other._flat(kind)
+        else:
+            right = as_node(other)
+            added = list(right.members) if isinstance(right, kind) else [right]
+        # a bad member fails HERE, at the operator that added it, and before
+        # the shared list is touched; a chain's own members were checked by
+        # the operators that built it
+        check = _members_adapter().validate_python
+        added = check(added)
+        if self._node is None and self._kind is kind:
+            members, n = self._members, self._n
+            if len(members) != n:           # already extended elsewhere: fork
+                members = members[:n]
+        else:
+            members = check(self._flat(kind))
+        members.extend(added)
+        out = B.__new__(B)
+        out._node = None
+        out._kind = kind
+        out._members = members
+        out._n = len(members)
+        out._site = caller_site(skip=3)     # the operator's caller
+        return out
 
     # a + b  ->  sequence (flattening nested seqs)
     def __add__(self, other: B | Rule | str) -> B:
-        left = self.node.members if isinstance(self.node, SeqNode) else [self.node]
-        right_node = as_node(other)
-        right = right_node.members if isinstance(right_node, SeqNode) else [right_node]
-        return B(_track(SeqNode(members=[*left, *right])))
+        return self._grow(SeqNode, other)
 
     # a | b  ->  choice (flattening)
     def __or__(self, other: B | Rule | str) -> B:
-        left = self.node.members if isinstance(self.node, ChoiceNode) else [self.node]
-        right_node = as_node(other)
-        right = right_node.members if isinstance(right_node, ChoiceNode) else [right_node]
-        return B(_track(ChoiceNode(members=[*left, *right])))
+        return self._grow(ChoiceNode, other)
 
     # sugar methods
     def opt(self) -> B:
@@ -663,6 +748,9 @@ class Ladder:
     def __init__(self, grammar: Grammar, levels: list[str], *, named: bool = False):
         self._grammar = grammar
         self._levels = list(levels)
+        # level -> 1-based position: n() is one dict probe instead of a
+        # membership scan plus an .index() scan; rebuilt by insert()
+        self._rank = {lv: i for i, lv in enumerate(self._levels, 1)}
         self.named = named
 
     @property
@@ -681,18 +769,19 @@ class Ladder:
 
     def n(self, level: str) -> int | str:
         """The precedence value (int or name) for a ladder level."""
-        if level not in self._levels:
+        rank = self._rank.get(level)
+        if rank is None:
             raise KeyError(
                 f"level {level!r} not in precedence ladder {self._levels}")
         if self.named:
             return level
-        return self._levels.index(level) + 1
+        return rank
 
     def insert(self, level: str, *, before: str | None = None,
                after: str | None = None) -> Ladder:
         """Add a level; int-mode values renumber automatically. Exactly one of
         `before`/`after` may anchor the position."""
-        if level in self._levels:
+        if level in self._rank:
             raise ValueError(f"level {level!r} already in ladder")
         if before is not None and after is not None:
             raise ValueError("specify only one of before=/after=")
@@ -702,6 +791,7 @@ class Ladder:
             self._levels.insert(self._levels.index(after) + 1, level)
         else:
             self._levels.append(level)
+        self._rank = {lv: i for i, lv in enumerate(self._levels, 1)}
         return self
 
     def ordering(self) -> list[Rule]:
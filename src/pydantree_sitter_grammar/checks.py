@@ -69,7 +69,7 @@ from .ir import (
 VALID_PATTERN_FLAGS = frozenset("i")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CheckIssue:
     """A diagnostic from the analyzer. `site` is the DSL definition site when
     known (builder-analyzed grammars); imported IR grammars have no sites."""
@@ -92,30 +92,33 @@ class CheckIssue:
 # ---------------------------------------------------------------------------
 
 def iter_children(node: RuleNode) -> Iterable[RuleNode]:
-    """Yield direct child rule nodes (mirrors the IR node shapes)."""
-    for attr in ("content",):
-        c = getattr(node, attr, None)
-        if isinstance(c, RuleNode):
-            yield c
-    for attr in ("members",):
-        c = getattr(node, attr, None)
-        if isinstance(c, list):
-            yield from c
+    """Yield direct child rule nodes (mirrors the IR node shapes). Read
+    from the field dict: `getattr(node, name, None)` on a node without
+    the field goes through pydantic's `__getattr__` and a raised
+    AttributeError — most of a walk's cost."""
+    fields = node.__dict__
+    c = fields.get("content")
+    if isinstance(c, RuleNode):
+        yield c
+    c = fields.get("members")
+    if isinstance(c, list):
+        yield from c
 
 
 def iter_all(node: RuleNode) -> Iterable[RuleNode]:
-    """DFS over the whole rule tree, cycles-safe via node id."""
+    """DFS over the whole rule tree, cycles-safe via node id. An explicit
+    stack (children pushed reversed, so the order is the recursive
+    pre-order): nested `yield from` generators paid one frame hop per
+    level for every node yielded."""
     seen: set[int] = set()
-
-    def walk(n: Rule):
+    stack = [node]
+    while stack:
+        n = stack.pop()
         if id(n) in seen:
-            return
+            continue
         seen.add(id(n))
         yield n
-        for c in iter_children(n):
-            yield from walk(c)
-
-    return walk(node)
+        stack.extend(reversed(list(iter_children(n))))
 
 
 def find_symbols(node: RuleNode) -> Iterable[SymbolNode]:
@@ -150,6 +153,33 @@ class _GrammarView:
                 f"expected pydantree_sitter_grammar.builder.Grammar or pydantree_sitter_grammar.ir.Grammar, "
                 f"got {type(g).__name__}")
         self.name = self._g.name
+        # per-rule traversals, walked once per analysis run: every check
+        # scans every rule body, and run_checks shares ONE view
+        self._nodes: dict[str, list[RuleNode]] = {}
+        self._symbols: dict[str, list[SymbolNode]] = {}
+        self._nullable: set[str] | None = None
+
+    def nodes(self, rule_name: str) -> list[RuleNode]:
+        """Every node of a rule body (DFS order), memoized on the view."""
+        out = self._nodes.get(rule_name)
+        if out is None:
+            out = self._nodes[rule_name] = list(iter_all(self.rules[rule_name]))
+        return out
+
+    def symbols(self, rule_name: str) -> list[SymbolNode]:
+        """The SYMBOL refs of a rule body, memoized on the view."""
+        out = self._symbols.get(rule_name)
+        if out is None:
+            out = self._symbols[rule_name] = [
+                n for n in self.nodes(rule_name) if isinstance(n, SymbolNode)]
+        return out
+
+    @property
+    def nullable(self) -> set[str]:
+        """The nullable rule names, solved once and memoized on the view."""
+        if self._nullable is None:
+            self._nullable = _nullable_rules(self)
+        return self._nullable
 
     @property
     def rules(self) -> dict[str, Rule]:
@@ -195,70 +225,100 @@ def _view(g) -> _GrammarView:
 # structural properties
 # ---------------------------------------------------------------------------
 
-def _nullable(node: Rule, view: _GrammarView, seen: set[str]) -> bool:
-    """Nullable computation (cycle-safe). REPEAT is nullable, REPEAT1 is
-    nullable iff its content is (repeat1(opt(x)) can match empty), BLANK is
-    nullable, CHOICE is nullable if any member is, SEQ if all are. FIELD /
-    ALIAS / PREC* / TOKEN / IMMEDIATE_TOKEN / RESERVED wrappers are nullable
-    iff their content is (mirror of _first_set's fallback)."""
-    if isinstance(node, BlankNode):
-        return True
-    if isinstance(node, RepeatNode):
+# node shapes for the structural walks below: one dict probe on the exact
+# type, then int compares, where an isinstance ladder paid up to seven
+# calls per node (the IR node classes are flat). Anything else is a
+# wrapper — FIELD / ALIAS / PREC* / TOKEN / IMMEDIATE_TOKEN / RESERVED —
+# transparent to both walks
+_TERMINAL, _BLANK, _CHOICE, _SEQ, _REPEAT, _REPEAT1, _SYMBOL, _WRAPPER = range(8)
+_SHAPE: dict[type, int] = {
+    StrNode: _TERMINAL, PatternNode: _TERMINAL, BlankNode: _BLANK,
+    ChoiceNode: _CHOICE, SeqNode: _SEQ, RepeatNode: _REPEAT,
+    Repeat1Node: _REPEAT1, SymbolNode: _SYMBOL,
+}
+
+
+def _derives_empty(node: Rule, nullable: set[str]) -> bool:
+    """Whether `node` can match empty, given the set of rule names already
+    known nullable. REPEAT is nullable, REPEAT1 is nullable iff its content
+    is (repeat1(opt(x)) can match empty), BLANK is nullable, CHOICE is
+    nullable if any member is, SEQ if all are. FIELD / ALIAS / PREC* /
+    TOKEN / IMMEDIATE_TOKEN / RESERVED wrappers are nullable iff their
+    content is (mirror of _first_set's fallback)."""
+    shape = _SHAPE.get(type(node), _WRAPPER)
+    if shape == _SEQ:
+        return all(_derives_empty(m, nullable) for m in node.members)
+    if shape == _SYMBOL:
+        return node.name in nullable  # unknown names are never nullable
+    if shape == _TERMINAL:
+        return False
+    if shape == _CHOICE:
+        return any(_derives_empty(m, nullable) for m in node.members)
+    if shape == _BLANK or shape == _REPEAT:
         return True
-    if isinstance(node, Repeat1Node):
-        return _nullable(node.content, view, seen)
-    if isinstance(node, ChoiceNode):
-        return any(_nullable(m, view, seen) for m in node.members)
-    if isinstance(node, SeqNode):
-        return all(_nullable(m, view, seen) for m in node.members)
-    if isinstance(node, SymbolNode):
-        if node.name in seen or node.name not in view.rules:
-            return False  # recursive/unknown: assume non-nullable (conservative)
-        seen.add(node.name)
-        result = _nullable(view.rules[node.name], view, seen)
-        seen.remove(node.name)
-        return result
-    # transparent wrappers (FIELD / ALIAS / PREC* / TOKEN / IMMEDIATE_TOKEN /
-    # RESERVED) are nullable iff their content is — mirror _first_set's fallback
-    content = getattr(node, "content", None)
-    if isinstance(content, RuleNode):
-        return _nullable(content, view, seen)
-    return False
+    # REPEAT1 and the wrappers: nullable iff their content is
+    content = node.__dict__.get("content")
+    return isinstance(content, RuleNode) and _derives_empty(content, nullable)
+
+
+def _nullable_rules(view: _GrammarView) -> set[str]:
+    """The grammar's nullable rule names: the least fixed point of
+    `_derives_empty` over every rule body. Equal to following SYMBOL refs
+    with a cycle cut (a shortest empty derivation never revisits a rule),
+    but computed once per view instead of once per query."""
+    nullable: set[str] = set()
+    pending = dict(view.rules)
+    changed = True
+    while changed:
+        changed = False
+        for name, rule in list(pending.items()):
+            if _derives_empty(rule, nullable):
+                nullable.add(name)
+                del pending[name]
+                changed = True
+    return nullable
+
+
+def _nullable(node: Rule, view: _GrammarView) -> bool:
+    """Nullable computation (cycle-safe): recursive and unknown refs are
+    non-nullable unless some finite expansion matches empty."""
+    return _derives_empty(node, view.nullable)
 
 
 def _first_set(node: Rule, view: _GrammarView, seen: set[str]) -> set[str]:
     """First set as a set of terminal keys: STRING values as-is, PATTERN
     values as-is. Follows SYMBOL refs (cycle-safe, conservative empty on
     cycle). BLANK/empty contributes nothing."""
-    if isinstance(node, StrNode):
+    shape = _SHAPE.get(type(node), _WRAPPER)
+    if shape == _TERMINAL:
         return {node.value}
-    if isinstance(node, PatternNode):
-        return {node.value}
-    if isinstance(node, BlankNode):
-        return set()
-    if isinstance(node, ChoiceNode):
+    if shape == _SEQ:
         out: set[str] = set()
         for m in node.members:
             out |= _first_set(m, view, seen)
+            if not _nullable(m, view):
+                break
         return out
-    if isinstance(node, SeqNode):
+    if shape == _CHOICE:
         out = set()
         for m in node.members:
             out |= _first_set(m, view, seen)
-            if not _nullable(m, view, set()):
-                break
         return out
-    if isinstance(node, RepeatNode | Repeat1Node):
-        return _first_set(node.content, view, seen)
-    if isinstance(node, SymbolNode):
-        if node.name in seen or node.name not in view.rules:
+    if shape == _SYMBOL:
+        # one probe for the body: a membership test then an index hashed
+        # the name twice (and read the `rules` property twice)
+        name = node.name
+        rule = None if name in seen else view.rules.get(name)
+        if rule is None:
             return set()
-        seen.add(node.name)
-        result = _first_set(view.rules[node.name], view, seen)
-        seen.remove(node.name)
+        seen.add(name)
+        result = _first_set(rule, view, seen)
+        seen.remove(name)
         return result
-    # FIELD / ALIAS / PREC* / TOKEN / IMMEDIATE_TOKEN / RESERVED
-    content = getattr(node, "content", None)
+    if shape == _BLANK:
+        return set()
+    # REPEAT / REPEAT1 and the wrappers: their content's first set
+    content = node.__dict__.get("content")
     if isinstance(content, RuleNode):
         return _first_set(content, view, seen)
     return set()
@@ -313,8 +373,8 @@ def check_undefined_symbols(g) -> list[CheckIssue]:
     # name too (the library's own scanner convention)
     external_names |= _external_token_names(view.externals)
     issues = []
-    for name, rule in view.rules.items():
-        for s in find_symbols(rule):
+    for name in view.rules:
+        for s in view.symbols(name):
             if s.name not in view.rules and s.name not in external_names:
                 issues.append(CheckIssue(
                     name, f"undefined Symbol ref {s.name!r}", view.site(name)))
@@ -335,7 +395,7 @@ def check_unused_rules(g) -> list[CheckIssue]:
         if name not in view.rules:
             continue
         used.add(name)
-        for s in find_symbols(view.rules[name]):
+        for s in view.symbols(name):
             if s.name in view.rules and s.name not in used:
                 frontier.append(s.name)
 
@@ -367,9 +427,9 @@ def check_unused_rules(g) -> list[CheckIssue]:
 def check_nullable_in_repeat(g) -> list[CheckIssue]:
     view = _view(g)
     issues = []
-    for name, rule in view.rules.items():
-        for n in iter_all(rule):
-            if isinstance(n, RepeatNode | Repeat1Node) and _nullable(n.content, view, set()):
+    for name in view.rules:
+        for n in view.nodes(name):
+            if isinstance(n, RepeatNode | Repeat1Node) and _nullable(n.content, view):
                 issues.append(CheckIssue(
                     name,
                     f"{n.type} content is nullable — infinite-loop hazard",
@@ -388,8 +448,8 @@ def check_symbol_inside_token(g) -> list[CheckIssue]:
     both wrappers are checked."""
     view = _view(g)
     issues = []
-    for name, rule in view.rules.items():
-        for n in iter_all(rule):
+    for name in view.rules:
+        for n in view.nodes(name):
             if isinstance(n, TokenNode | ImmediateTokenNode):
                 for s in find_symbols(n.content):
                     issues.append(CheckIssue(
@@ -402,8 +462,8 @@ def check_symbol_inside_token(g) -> list[CheckIssue]:
 def check_pattern_flags(g) -> list[CheckIssue]:
     view = _view(g)
     issues = []
-    for name, rule in view.rules.items():
-        for n in iter_all(rule):
+    for name in view.rules:
+        for n in view.nodes(name):
             if isinstance(n, PatternNode) and n.flags:
                 bad = [f for f in n.flags if f not in VALID_PATTERN_FLAGS]
                 if bad:
@@ -424,8 +484,8 @@ def check_precedence_mixing(g) -> list[CheckIssue]:
     seq alternative)."""
     view = _view(g)
     issues = []
-    for name, rule in view.rules.items():
-        for n in iter_all(rule):
+    for name in view.rules:
+        for n in view.nodes(name):
             if isinstance(n, ChoiceNode):
                 kinds = set()
                 for m in n.members:
@@ -503,7 +563,7 @@ def check_nullable_non_start_rule(g) -> list[CheckIssue]:
     for name, rule in view.rules.items():
         if name == view.start:
             continue
-        if _nullable(rule, view, set()):
+        if _nullable(rule, view):
             issues.append(CheckIssue(
                 name,
                 "non-start rule is nullable — the generator accepts this "
@@ -521,8 +581,8 @@ def check_alias_on_seq(g) -> list[CheckIssue]:
     canonical pattern aliases a single hidden symbol."""
     view = _view(g)
     issues = []
-    for name, rule in view.rules.items():
-        for n in iter_all(rule):
+    for name in view.rules:
+        for n in view.nodes(name):
             if isinstance(n, AliasNode):
                 content = n.content
                 while isinstance(content, (PrecNode, PrecLeftNode, PrecRightNode,
@@ -543,7 +603,9 @@ def check_alias_on_seq(g) -> list[CheckIssue]:
 # ---------------------------------------------------------------------------
 
 def run_checks(g) -> list[CheckIssue]:
-    """Run every check. Returns errors AND warnings (check `.severity`)."""
+    """Run every check. Returns errors AND warnings (check `.severity`).
+    The checks share ONE view, so each rule body is walked once."""
+    g = _view(g)
     return (
         check_start_defined(g)
         + check_undefined_symbols(g)
@@ -574,9 +636,13 @@ class GrammarCheckError(Exception):
         super().__init__("\n".join(f"  ! {i}" for i in issues))
 
 
-def assert_clean(g) -> None:
+def assert_clean(g) -> list[CheckIssue]:
     """Raise GrammarCheckError unless the grammar passes every error-level
-    check (warnings are tolerated)."""
-    bad = errors(g)
+    check (warnings are tolerated). Returns those warnings, from the same
+    analyzer run: a build needs one pass, not an errors() and a
+    warnings() pass over the unchanged grammar."""
+    issues = run_checks(g)
+    bad = [i for i in issues if i.severity == "error"]
     if bad:
         raise GrammarCheckError(bad)
+    return [i for i in issues if i.severity == "warning"]
@@ -34,13 +34,14 @@ per-rule (+ production shape), not per-alternative.
 from __future__ import annotations
 
 import json
+import re
 import subprocess
 from dataclasses import dataclass
 
 from .builder import Grammar
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Conflict:
     symbol_sequence: tuple[str, ...]
     conflicting_lookahead: str
@@ -49,18 +50,22 @@ class Conflict:
 
     @property
     def involved_rules(self) -> list[str]:
-        """Rule names mentioned by the interpretations (deduped, order kept)."""
-        seen = []
-        for i in self.interpretations:
-            name = i.get("variable_name")
-            if name and name not in seen:
-                seen.append(name)
-        return seen
+        """Rule names mentioned by the interpretations (deduped, order kept
+        — a dict's keys, not a `not in` scan of the list built so far)."""
+        names = (i.get("variable_name") for i in self.interpretations)
+        return list(dict.fromkeys(n for n in names if n))
 
     def ambiguous_shape(self) -> str:
         return " ".join(self.symbol_sequence) + " • " + self.conflicting_lookahead
 
 
+# the scanner's ONE token: a JSON string literal (escapes included; the
+# unrolled `[^"\\]*(?:\\.[^"\\]*)*` form consumes runs, not characters) or a
+# brace. The regex engine skips everything between tokens — and every
+# string's contents — in C, instead of a Python-level step per character.
+_JSON_TOKEN = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"|[{}]', re.S)
+
+
 def _extract_json_object(raw: str):
     """The JSON object in `raw` (first balanced top-level object that
     parses). The CLI's stderr is not pure JSON — its own PATTERN-flag
@@ -73,27 +78,15 @@ def _extract_json_object(raw: str):
     start = raw.find("{")
     while start != -1:
         depth = 0
-        in_string = False
-        escaped = False
-        for i in range(start, len(raw)):
-            c = raw[i]
-            if in_string:
-                if escaped:
-                    escaped = False
-                elif c == "\\":
-                    escaped = True
-                elif c == '"':
-                    in_string = False
-                continue
-            if c == '"':
-                in_string = True
-            elif c == "{":
+        for m in _JSON_TOKEN.finditer(raw, start):
+            tok = m.group()
+            if tok == "{":
                 depth += 1
-            elif c == "}":
+            elif tok == "}":
                 depth -= 1
                 if depth == 0:
                     try:
-                        return json.loads(raw[start:i + 1])
+                        return json.loads(raw[start:m.end()])
                     except json.JSONDecodeError:
                         break
         start = raw.find("{", start + 1)
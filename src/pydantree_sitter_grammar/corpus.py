@@ -46,7 +46,7 @@ from .builder import Grammar
 # ---------------------------------------------------------------------------
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CorpusCase:
     """One (source, expected-sexp) case. `selector` renders the FIRST node of
     that type in DFS order instead of the tree root (the smoke corpus renders
@@ -93,27 +93,45 @@ def _quote(text: str) -> str:
 
 
 def _render_sexp(node, parts, *, anonymous: str, fields: bool) -> None:
+    """One TreeCursor walk appending straight into `parts`: a per-level
+    sub-list joined at every level re-copied each subtree's text once per
+    ancestor (O(N·depth) on deep trees). Every rendered child is prefixed
+    by its separating space, so a dropped anonymous token leaves none."""
+    keep = anonymous == "keep"
     if not node.is_named:
-        if anonymous == "keep":
+        if keep:
             parts.append(_quote(node.type))
         return
     parts.append("(")
     parts.append(node.type)
-    rendered: list[str] = []
-    for i, c in enumerate(node.children):
-        sub: list[str] = []
-        _render_sexp(c, sub, anonymous=anonymous, fields=fields)
-        if not sub:
-            continue  # anonymous="drop" renders nothing -> no stray space
-        s = "".join(sub)
-        if fields:
-            fname = node.field_name_for_child(i)
-            if fname:
-                s = fname + ": " + s
-        rendered.append(s)
-    if rendered:
-        parts.append(" " + " ".join(rendered))
-    parts.append(")")
+    cursor = node.walk()
+    if not cursor.goto_first_child():
+        parts.append(")")
+        return
+    depth = 1
+    while True:
+        n = cursor.node
+        if n.is_named or keep:
+            parts.append(" ")
+            if fields:
+                fname = cursor.field_name
+                if fname:
+                    parts.append(fname + ": ")
+            if not n.is_named:
+                parts.append(_quote(n.type))
+            else:
+                parts.append("(")
+                parts.append(n.type)
+                if cursor.goto_first_child():
+                    depth += 1
+                    continue
+                parts.append(")")
+        while not cursor.goto_next_sibling():
+            cursor.goto_parent()
+            parts.append(")")
+            depth -= 1
+            if depth == 0:
+                return
 
 
 def render(node, *, anonymous: str = "keep", fields: bool = True) -> str:
@@ -140,14 +158,31 @@ def render_compact(n, *, expr_kind: str = "expr") -> str:
     first expression node, so a ladder reorder that flips the tree shape
     shows up as a diff.
     """
-    if not n.is_named:
-        return n.type
-    if n.type.startswith("_"):
-        return n.type
-    if n.child_count == 0:
+    if not n.is_named or n.type.startswith("_") or n.child_count == 0:
         return n.type
-    inner = " ".join(render_compact(c, expr_kind=expr_kind) for c in n.children)
-    return f"({inner})" if n.type == expr_kind else f"{n.type}({inner})"
+    # one TreeCursor walk into one parts list (as `render`): the recursive
+    # form joined every subtree's text again at each ancestor
+    parts: list[str] = []
+    cursor = n.walk()
+    depth = 0
+    node = n
+    while True:
+        kind = node.type
+        if node.is_named and not kind.startswith("_") and node.child_count:
+            parts.append("(" if kind == expr_kind else kind + "(")
+            cursor.goto_first_child()
+            depth += 1
+            node = cursor.node
+            continue
+        parts.append(kind)
+        while not cursor.goto_next_sibling():
+            cursor.goto_parent()
+            parts.append(")")
+            depth -= 1
+            if depth == 0:
+                return "".join(parts)
+        parts.append(" ")
+        node = cursor.node
 
 
 # ---------------------------------------------------------------------------
@@ -257,15 +292,17 @@ class Corpus:
                                            out / "node-schema.json"))
 
         failures: list[CorpusFailure] = []
+        # one parser for the whole run: parse() resets it per case
+        parser = _parser(lang)
         for case in self.cases:
-            tree = _parse(lang, case.source)
+            tree = _parse(parser, case.source)
             root = tree.root_node
             target = _select(root, case.selector or self.selector)
             if target is None:
                 failures.append(CorpusFailure(
                     case, None,
                     detail=f"no {case.selector or self.selector or 'root'} node "
-                           f"found (parse errors: {_first_error(tree, case.source)})"))
+                           f"found (parse errors: {_first_error(tree)})"))
                 continue
             got = render_compact(target, expr_kind=self.expr_kind) \
                 if self.style == "compact" \
@@ -286,32 +323,43 @@ def _snapshot(src: Path, dst: Path) -> Path:
 # parse helpers (shared with expressions.semantic_smoke)
 # ---------------------------------------------------------------------------
 
-def _parse(lang, source: str):
+def _parser(lang):
     import tree_sitter
-    return tree_sitter.Parser(lang).parse(source.encode("utf-8"))
+    return tree_sitter.Parser(lang)
+
+
+def _parse(parser, source: str):
+    return parser.parse(source.encode("utf-8"))
 
 
 def _select(node, selector: str | None):
     """The node to render: the tree root, or the FIRST node of `selector`
-    type in DFS order (the outermost occurrence)."""
+    type in DFS order (the outermost occurrence). A TreeCursor walk, not
+    recursion: real sources nest deeper than the recursion limit."""
     if selector is None:
         return node
-    if node.type == selector:
-        return node
-    for c in node.children:
-        found = _select(c, selector)
-        if found is not None:
-            return found
-    return None
-
-
-def _first_error(tree, source: str) -> str:
+    cursor = node.walk()
+    while True:
+        if cursor.node.type == selector:
+            return cursor.node
+        if cursor.goto_first_child():
+            continue
+        while not cursor.goto_next_sibling():
+            if not cursor.goto_parent():
+                return None
+
+
+def _first_error(tree) -> str:
+    """Every ERROR / MISSING node in DFS order; only subtrees whose
+    `has_error` is set are entered (an explicit stack, no recursion). Each
+    node's text is its own byte slice: node offsets are BYTE offsets, so
+    slicing the decoded str with them misplaced any non-ASCII source."""
     out: list[str] = []
-
-    def walk(n):
+    stack = [tree.root_node]
+    while stack:
+        n = stack.pop()
         if n.type == "ERROR" or n.is_missing:
-            out.append(f"{n.type}@{source[n.start_byte:n.end_byte]!r}")
-        for c in n.children:
-            walk(c)
-    walk(tree.root_node)
+            text = (n.text or b"").decode("utf-8", "replace")
+            out.append(f"{n.type}@{text!r}")
+        stack.extend(c for c in reversed(n.children) if c.has_error)
     return ", ".join(out) or "none"
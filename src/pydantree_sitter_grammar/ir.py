@@ -51,7 +51,10 @@ class RuleNode(BaseModel):
     carries None; grammar.json round-trips don't see it).
     """
 
-    model_config = {"frozen": True}
+    # defer_build: each node class builds its schema on first validation,
+    # when the `Rule` forward reference resolves — no failed build at class
+    # creation and no module-level model_rebuild() pass
+    model_config = {"frozen": True, "defer_build": True}
 
     type: str
     _site: object = PrivateAttr(default=None)
@@ -219,7 +222,7 @@ class GrammarModel(BaseModel):
     - `reserved` maps a context name to a list of rule nodes.
     """
 
-    model_config = {"extra": "forbid"}
+    model_config = {"extra": "forbid", "defer_build": True}
 
     name: str
     rules: dict[str, Rule]
@@ -251,17 +254,19 @@ class GrammarModel(BaseModel):
         return next(iter(self.rules))
 
     # -- emission -----------------------------------------------------------
-    def emit_json(self, path) -> None:
-        """Serialize this grammar as grammar.json (exclude None/empty for the
-        clean canonical form the CLI expects)."""
-        import json
-        from pathlib import Path
-
-        path = Path(path)
-        path.write_text(self.model_dump_json(indent=2, exclude_none=True))
-        json.loads(path.read_text())  # sanity: must parse as JSON
-
-    def emit_bundle(self, dirpath) -> Path:
+    def canonical_json(self) -> str:
+        """The grammar.json text (exclude None for the clean canonical form
+        the CLI expects) — what `emit_json` writes and `grammar_hash` keys."""
+        return self.model_dump_json(indent=2, exclude_none=True)
+
+    def emit_json(self, path, *, text: str | None = None) -> None:
+        """Serialize this grammar as grammar.json. `text` is an already
+        serialized `canonical_json()` (the build hashes it first — one
+        serialization, no re-read: pydantic's JSON encoder cannot emit
+        invalid JSON, so the old parse-back sanity pass is gone)."""
+        Path(path).write_text(self.canonical_json() if text is None else text)
+
+    def emit_bundle(self, dirpath, *, text: str | None = None) -> Path:
         """Emit grammar.json + the minimal ABI-15 tree-sitter.json config into
         `dirpath`. Returns the grammar.json path. (ABI 15 matches the Python
         bindings 0.26.0; without the config the CLI falls back to ABI 14.)"""
@@ -273,14 +278,5 @@ class GrammarModel(BaseModel):
         if not cfg.exists():
             cfg.write_text(json.dumps(ABI_15_CONFIG) + "\n")
         json_path = dirpath / "grammar.json"
-        self.emit_json(json_path)
+        self.emit_json(json_path, text=text)
         return json_path
-
-
-# Forward refs resolve after all node classes are defined.
-for _cls in (
-    SeqNode, ChoiceNode, RepeatNode, Repeat1Node, FieldNode,
-    AliasNode, TokenNode, ImmediateTokenNode, PrecNode,
-    PrecLeftNode, PrecRightNode, PrecDynamicNode, ReservedNode,
-):
-    _cls.model_rebuild()
@@ -10,8 +10,12 @@ parse convenience wrapper.
 
 from __future__ import annotations
 
+from pathlib import Path
+
 import tree_sitter
 
+from pydantree_sitter.loader import load_grammar_so
+
 # REVIEW 018 B20: the .so's library must stay alive for the language's
 # lifetime; previously load_language returned the (language, lib) tuple and
 # callers had to remember to keep `lib` — parse()/Parser() take a BARE
@@ -19,6 +23,11 @@ import tree_sitter
 # library for the process lifetime (a bounded, deliberate keep-alive —
 # languages are few and long-lived).
 _KEEPALIVE: list = []
+# repeated loads of the SAME .so (tests, corpus runs, a pipeline re-loading a
+# cache hit) used to re-copy + re-dlopen it and grow _KEEPALIVE per call.
+# Keyed by the file's identity — a .so rebuilt in place (new mtime/size/
+# inode) is a different key, so a stale language is never served.
+_LOADED: dict[tuple, tree_sitter.Language] = {}
 
 
 def load_language(so_path, grammar_name: str | None = None):
@@ -28,11 +37,17 @@ def load_language(so_path, grammar_name: str | None = None):
     bundle's loader.py uses the same path). `grammar_name` is the export
     symbol (`tree_sitter_<name>`) and defaults to the .so's file stem.
     Returns the LANGUAGE — the underlying library is kept alive by this
-    module's registry (parse()/Parser() take a bare language).
+    module's registry (parse()/Parser() take a bare language). Memoized
+    per (path, name, file identity): an unchanged .so loads once.
     """
-    from pydantree_sitter.loader import load_grammar_so
-    language, lib = load_grammar_so(so_path, grammar_name)
-    _KEEPALIVE.append(lib)
+    path = Path(so_path).resolve()
+    st = path.stat()
+    key = (path, grammar_name, st.st_mtime_ns, st.st_size, st.st_ino)
+    language = _LOADED.get(key)
+    if language is None:
+        language, lib = load_grammar_so(path, grammar_name)
+        _KEEPALIVE.append(lib)
+        _LOADED[key] = language
     return language
 
 
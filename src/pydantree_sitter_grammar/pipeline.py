@@ -40,11 +40,15 @@ from .ir import GrammarModel
 BUNDLE_LOADER_SOURCE = '''\
 """Load this bundle's grammar into a tree_sitter.Language (B-free)."""
 from pathlib import Path
-from pydantree_sitter.loader import load_bundle
+from pydantree_sitter.loader import load_bundle, load_typed_api
 
 
 def language():
     return load_bundle(Path(__file__).resolve().parent).language
+
+
+def typed_api():
+    return load_typed_api(Path(__file__).resolve().parent)
 '''
 
 
@@ -109,11 +113,12 @@ import functools as _functools
 detect_toolchain = _functools.lru_cache(maxsize=1)(detect_toolchain)
 
 
-def grammar_hash(model: GrammarModel) -> str:
-    """Content-addressed key: sha256 over the canonical grammar.json bytes."""
-    return hashlib.sha256(
-        model.model_dump_json(indent=2, exclude_none=True).encode()
-    ).hexdigest()
+def grammar_hash(model: GrammarModel, *, text: str | None = None) -> str:
+    """Content-addressed key: sha256 over the canonical grammar.json bytes
+    (`text` = an already serialized `model.canonical_json()`)."""
+    if text is None:
+        text = model.canonical_json()
+    return hashlib.sha256(text.encode()).hexdigest()
 
 
 # ---------------------------------------------------------------------------
@@ -352,9 +357,8 @@ def build(model: GrammarModel, *, cache_dir: Path | None = None,
     to the caller. Pass `check=False` to skip.
     """
     if check:
-        from .checks import assert_clean, warnings as check_warnings
-        assert_clean(model)
-        build_warnings = list(check_warnings(model))
+        from .checks import assert_clean
+        build_warnings = assert_clean(model)
     else:
         build_warnings = []
     cache_dir = Path(cache_dir) if cache_dir is not None else default_cache_dir()
@@ -362,7 +366,9 @@ def build(model: GrammarModel, *, cache_dir: Path | None = None,
     name = grammar_name or model.name
     scanner = Path(scanner) if scanner is not None else None
 
-    h = grammar_hash(model)
+    # serialized ONCE: the same text keys the cache and becomes grammar.json
+    grammar_text = model.canonical_json()
+    h = grammar_hash(model, text=grammar_text)
     tc_digest = hashlib.sha256(toolchain.key.encode()).hexdigest()[:12]
     key = f"{h}-{name}-{tc_digest}"
     if scanner is not None and scanner.exists():
@@ -394,7 +400,7 @@ def build(model: GrammarModel, *, cache_dir: Path | None = None,
     work.mkdir(parents=True, exist_ok=True)
 
     try:
-        json_path = model.emit_bundle(work)
+        json_path = model.emit_bundle(work, text=grammar_text)
         gen = run_generate(json_path)
         if gen.returncode != 0:
             # leave evidence behind; the caller decides how to render the failure
@@ -534,7 +540,7 @@ def build_builder(g, *, cache_dir=None, **kw) -> BuildResult:
         # warnings were re-run over the builder and a typo'd ref("nam")
         # raised with no `at file:line` at all.
         from .checks import assert_clean
-        assert_clean(g)
+        build_warnings = assert_clean(g)
         kw = {**kw, "check": False}
     try:
         result = build(model, cache_dir=cache_dir, **kw)
@@ -549,11 +555,10 @@ def build_builder(g, *, cache_dir=None, **kw) -> BuildResult:
                 raise err from None
         raise
     # warning messages should cite the AUTHOR's source, not the IR (which has
-    # no sites): re-run the analyzer over the builder Grammar (B15). Only when
-    # build() actually ran the checks (kw can pass check=False).
+    # no sites): the builder Grammar's analyzer run above supplies them (B15).
+    # Only when the checks actually ran (kw can pass check=False).
     if run_checks:
-        from .checks import warnings as check_warnings
-        result.warnings = check_warnings(g)
+        result.warnings = build_warnings
     return result
 
 
@@ -41,6 +41,7 @@ from __future__ import annotations
 import inspect
 import linecache
 import os
+import re
 import sys
 import types
 from typing import Literal, Sequence, Union, get_args, get_origin
@@ -80,18 +81,23 @@ _RULES_FILE = os.path.abspath(__file__)
 # the metaclass + the kinds
 # ---------------------------------------------------------------------------
 
+# the two _snake passes, compiled once (re.sub(str, ...) re-keys the
+# module's pattern cache on every call)
+_CAMEL_WORD = re.compile(r"(.)([A-Z][a-z]+)")
+_CAMEL_BOUNDARY = re.compile(r"([a-z0-9])([A-Z])")
+
+
 def _snake(name: str) -> str:
     """CamelCase -> snake_case, acronym-aware (F-B4): the standard
     two-regex approach — `HTTPServer` -> `http_server`, `JSONValue` ->
     `json_value`, `IOPort` -> `io_port`. A leading underscore (hidden-rule
     convention) survives. Shared with the codegen class-name helper."""
-    import re as _re
     prefix = ""
     if name.startswith("_"):          # hidden-rule convention survives
         prefix = "_"
         name = name[1:]
-    s1 = _re.sub(r"(.)([A-Z][a-z]+)", r"\1_\2", name)
-    s2 = _re.sub(r"([a-z0-9])([A-Z])", r"\1_\2", s1)
+    s1 = _CAMEL_WORD.sub(r"\1_\2", name)
+    s2 = _CAMEL_BOUNDARY.sub(r"\1_\2", s1)
     return prefix + s2.lower()
 
 
@@ -112,12 +118,21 @@ def _attr_sites(cls: type) -> dict[str, RuleSite]:
     (class + attribute), not a raw combinator line. Found by scanning the
     class's own source lines for the `attr:` prefix."""
     sites: dict[str, RuleSite] = {}
+    wanted = [a for a in cls.__annotations__ if not a.startswith("__")]
+    if not wanted:
+        return sites
+    first = cls.__dict__.get("__firstlineno__")     # 3.13+
+    if first is not None:
+        _scan_body(linecache.getlines(cls.__site__.file), first - 1,
+                   set(wanted), cls.__site__.file, sites)
+        if len(sites) == len(wanted):
+            return sites
     try:
         src_lines, start = inspect.getsourcelines(cls)
     except (OSError, TypeError):
         return sites
-    for attr in cls.__annotations__:
-        if attr.startswith("__"):
+    for attr in wanted:
+        if attr in sites:
             continue
         for i, line in enumerate(src_lines):
             stripped = line.lstrip()
@@ -128,6 +143,33 @@ def _attr_sites(cls: type) -> dict[str, RuleSite]:
     return sites
 
 
+def _scan_body(lines: list[str], first: int, wanted: set[str], file: str,
+               sites: dict[str, RuleSite]) -> None:
+    """The fast path of `_attr_sites`: one pass over the class body from
+    its recorded first line, ending at the first line indented no deeper
+    than the `class` statement. inspect.getsourcelines tokenizes the whole
+    block (and before 3.13 ast-parses the whole module) per class; this
+    indentation rule can only end EARLY (a column-0 line inside a string),
+    and anything it misses falls back to that exact path."""
+    indent = None
+    for i in range(first, len(lines)):
+        line = lines[i]
+        stripped = line.lstrip()
+        if indent is None:
+            if stripped.startswith("class "):       # past any decorators
+                indent = len(line) - len(stripped)
+            continue
+        if not stripped or stripped[0] == "#":
+            continue
+        if len(line) - len(stripped) <= indent:
+            return
+        attr = stripped.partition(":")[0]
+        if attr in wanted and attr not in sites:
+            sites[attr] = RuleSite(file, i + 1, stripped.rstrip("\n"))
+            if len(sites) == len(wanted):
+                return
+
+
 class _RuleMeta(type):
     """Registers rule classes: derives `__rule_name__` from the class name
     (overridable with `__rule_name__`) and records the definition site.
@@ -298,7 +340,7 @@ def _stamp(cls: type, body: B, attr: str | None = None) -> None:
     for n in _iter_body_nodes(as_node(body)):
         existing = site_of(n)
         if existing is None or existing.file == _RULES_FILE:
-            n._site = site   # pydantic private attr
+            n.__pydantic_private__["_site"] = site   # as builder._track
 
 
 def _from_annotations(cls: type) -> tuple[B, dict[int, str]]:
@@ -23,6 +23,7 @@ from pydantree_sitter import (
     M,
     OutputModel,
     ShapeError,
+    Span,
     capture,
     source_meta,
 )
@@ -70,6 +71,149 @@ def test_reparse_mid_buffer_edit_applies_the_edit():
     assert not t2.root_node.has_error
 
 
+def test_reparse_does_not_trust_a_shifted_root_text():
+    """Leading whitespace sits outside the root node, so its text is not the
+    old source: diffing it misplaced the edit (dropping the leading blank
+    lines left `x` parsed at its stale offset 2)."""
+    lang = Language.load(tree_sitter_python.language())
+    t2 = lang.reparse(lang.parse("\n\nx = 1\n"), "x = 1\n")
+    assert t2.root_node.children[0].text == b"x = 1"
+    assert str(t2.root_node) == str(lang.parse("x = 1\n").root_node)
+
+
+def test_parse_reuses_identical_source_without_sharing_edits():
+    """Identical source is a cache hit, but every caller gets its own tree:
+    reparse() edits the tree it is handed, never the cached parse."""
+    lang = Language.load(tree_sitter_python.language(),
+                         parse_cache_bytes=1 << 20)
+    t1 = lang.parse("x = 1\ny = 2\n")
+    t2 = lang.parse(b"x = 1\ny = 2\n")
+    assert t1 is not t2 and str(t1.root_node) == str(t2.root_node)
+    lang.reparse(t1, "x = 1\nyy = 2\n")
+    t3 = lang.parse("x = 1\ny = 2\n")
+    assert t3.root_node.children[1].text == b"y = 2"
+    assert t3.root_node.children[1].start_byte == 6
+
+
+def test_parse_cache_is_opt_in_and_bounded_by_source_bytes():
+    """A default Language keeps no sources; an opted-in one evicts the least
+    recently used parses once their sources exceed the byte bound."""
+    plain = Language.load(tree_sitter_python.language())
+    plain.parse("x = 1\n")
+    assert plain._trees == {}
+    lang = Language.load(tree_sitter_python.language(), parse_cache_bytes=20)
+    a, b, c = b"a = 1\n", b"b = 22\n", b"c = 333\n"     # 6 + 7 + 8 bytes
+    for src in (a, b, a, c):
+        lang.parse(src)
+    assert list(lang._trees) == [a, c] and lang._trees_bytes == 14
+    lang.parse(b"d = " + b"1" * 40 + b"\n")               # over the bound
+    assert list(lang._trees) == [a, c]
+
+
+def test_parse_never_reuses_another_sources_tree():
+    """parse() of a near-copy of a cached source is a fresh parse: no tree
+    state carries over from a different file."""
+    import tree_sitter
+
+    lang = Language.load(tree_sitter_python.language(),
+                         parse_cache_bytes=1 << 20)
+    body = "".join(f"def f{i}(a):\n    return a + {i}\n" for i in range(40))
+    old = lang.parse(body)
+    edited = body.replace("return a + 17", "return (a, 'é') * 17")
+    new = lang.parse(edited)
+    fresh = tree_sitter.Parser(lang.language).parse(edited.encode())
+    assert str(new.root_node) == str(fresh.root_node)
+    assert str(lang.parse(body).root_node) == str(old.root_node)
+
+
+def test_parse_cache_is_safe_across_threads():
+    """One Language shared by many threads (the sugar path): the recent-
+    parse cache's lookups and evictions must not race."""
+    import sys
+    import threading
+
+    lang = Language.load(tree_sitter_python.language(), parse_cache_bytes=300)
+    errors = []
+
+    def work(k):
+        try:
+            for i in range(2000):
+                src = f"x = {(i * 7 + k) % 40}\ny = {k}\n"
+                assert lang.parse(src).root_node.end_byte == len(src)
+        except Exception as e:          # noqa: BLE001 — collected below
+            errors.append(e)
+
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        threads = [threading.Thread(target=work, args=(k,)) for k in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+    finally:
+        sys.setswitchinterval(interval)
+    assert errors == []
+
+
+def test_document_keeps_bytes_and_updates_incrementally():
+    """Document: bytes are primary (offsets index them), `text` is a lazy
+    str view, update() diffs against the exact retained source."""
+    lang = Language.load(tree_sitter_python.language())
+    doc = lang.document("\n\ns = 'é'\n")
+    assert doc.source == "\n\ns = 'é'\n".encode()
+    assert doc.text == "\n\ns = 'é'\n"
+    doc.update("\n\ns = 'é'\nt = 2\n".encode())
+    assert doc.text == "\n\ns = 'é'\nt = 2\n"
+    assert [c.text for c in doc.root_node.children] == [
+        "s = 'é'".encode(), b"t = 2"]
+    doc.update("s = 'é'\n")
+    assert str(doc.root_node) == str(lang.parse("s = 'é'\n").root_node)
+    assert doc.root_node.children[0].start_byte == 0
+
+
+def test_document_edit_splices_at_byte_offsets():
+    """edit() takes BYTE offsets (multi-byte chars before the edit shift
+    them) and splices the buffer in place; the tree matches a fresh parse."""
+    lang = Language.load(tree_sitter_python.language())
+    doc = lang.document("s = 'é'\nprint(s)\n")
+    at = doc.source.find(b"print")
+    assert at == len("s = 'é'\n".encode())     # 10 bytes, 9 chars
+    doc.edit(at, at + len(b"print"), "len")
+    assert doc.text == "s = 'é'\nlen(s)\n"
+    assert str(doc.root_node) == str(lang.parse(doc.source).root_node)
+    assert doc.root_node.children[1].text == b"len(s)"
+    with pytest.raises(ValueError):
+        doc.edit(5, 2, b"")
+
+
+def test_document_tree_kept_across_an_edit_reads_its_own_source():
+    """A tree handed out before an edit() keeps the bytes it was parsed
+    from: the splice must not show through its node text."""
+    lang = Language.load(tree_sitter_python.language())
+    doc = lang.document("x = 1\ny = 2\n")
+    old = doc.tree
+    doc.edit(0, 1, "long_name")
+    assert old.root_node.children[0].text == b"x = 1"
+    assert old.root_node.children[1].text == b"y = 2"
+    assert doc.root_node.children[0].text == b"long_name = 1"
+
+
+def test_document_apply_edits_reparses_once_to_the_same_tree():
+    """apply_edits(): several edits in current-buffer offsets, one reparse
+    — same text and tree as applying them one by one; overlaps reject."""
+    lang = Language.load(tree_sitter_python.language())
+    src = "a = 1\nb = 'é'\nprint(a, b)\n"
+    doc = lang.document(src)
+    at_a, at_p = src.encode().find(b"1"), src.encode().find(b"print")
+    doc.apply_edits([(at_p, at_p + 5, "len"), (at_a, at_a + 1, "100"),
+                     (0, 0, "# x\n")])
+    assert doc.text == "# x\na = 100\nb = 'é'\nlen(a, b)\n"
+    assert str(doc.root_node) == str(lang.parse(doc.source).root_node)
+    with pytest.raises(ValueError):
+        doc.apply_edits([(0, 4, ""), (2, 6, "")])
+
+
 def test_source_meta_into_optional_int():
     """REVIEW 020 minor: `line: int | None = source_meta()` used to take the
     Span branch (the annotation is not exactly `int`) and fail validation."""
@@ -85,6 +229,34 @@ def test_source_meta_into_optional_int():
     assert rows == [{"name": "x", "line": 1}, {"name": "y", "line": 2}]
 
 
+def test_span_keeps_source_bytes_and_decodes_on_read():
+    """a source_meta() Span holds the node's bytes; `text` decodes once, on
+    first read (non-ASCII included)."""
+    lang = Language.load(tree_sitter_python.language())
+
+    class WithSpan(OutputModel):
+        __match__ = M("module", "expression_statement", "assignment")
+        name: str = capture("left")
+        span: Span = source_meta()
+        model_config = {"arbitrary_types_allowed": True}
+
+    (row,) = WithSpan.extract("s = 'é'\n", language=lang)
+    assert row.span.text_bytes == "s = 'é'".encode()
+    assert row.span.text == "s = 'é'" and row.span.text is row.span.text
+    assert (row.span.start_byte, row.span.end_byte) == (0, 8)
+    built = Span(1, 0, 1, 3, 0, 3, "abc")
+    assert built.text == "abc" and built.text_bytes == b"abc"
+    assert repr(built) == "Span(1:0-1:3 'abc')"
+    big = Span(1, 0, 900, 0, 0, 9000, None)
+    big._raw = b"x = 1\n" * 1500
+    assert repr(big).endswith("...)") and len(repr(big)) < 120
+    assert big._text is None            # repr decoded only the head
+    # `text` stays assignable: the bytes follow the new text
+    row.span.text = "t = 'ü'"
+    assert row.span.text == "t = 'ü'"
+    assert row.span.text_bytes == "t = 'ü'".encode()
+
+
 def test_model_without_declaration_raises_friendly_shape_error():
     """REVIEW 020 minor: a subclass with no __match__/__raw_query__ used to
     surface a raw AttributeError at bind."""
@@ -94,3 +266,52 @@ def test_model_without_declaration_raises_friendly_shape_error():
     lang = Language.load(tree_sitter_python.language())
     with pytest.raises(ShapeError, match="not an extraction model"):
         lang.extractor(Bare)
+
+
+def test_edit_diff_matches_the_bytewise_scan():
+    """the block-compared prefix/suffix diff agrees with the naive byte
+    loop, including edits that straddle a block boundary."""
+    import random
+
+    from pydantree_sitter import binding
+
+    def naive(a, b):
+        start, limit = 0, min(len(a), len(b))
+        while start < limit and a[start] == b[start]:
+            start += 1
+        ea, eb = len(a), len(b)
+        while ea > start and eb > start and a[ea - 1] == b[eb - 1]:
+            ea -= 1
+            eb -= 1
+        return start, len(a) - ea
+
+    rng = random.Random(7)
+    block = binding._DIFF_BLOCK
+    base = bytes(rng.randrange(97, 100) for _ in range(3 * block + 17))
+    cases = [(base, base), (base, b""), (b"", base), (base, base + b"x"),
+             (base, b"x" + base)]
+    for _ in range(200):
+        i = rng.randrange(len(base))
+        j = rng.randrange(i, len(base) + 1)
+        ins = bytes(rng.randrange(97, 100) for _ in range(rng.randrange(4)))
+        cases.append((base, base[:i] + ins + base[j:]))
+    for a, b in cases:
+        start = binding._common_prefix(a, b)
+        assert (start, binding._common_suffix(a, b, start)) == naive(a, b)
+
+
+def test_edit_points_advance_from_the_start_point():
+    """an edit's end points, derived from its start point over the edited
+    span only, equal the points recounted from byte 0."""
+    import random
+
+    from pydantree_sitter import binding
+
+    rng = random.Random(11)
+    text = bytes(rng.choice(b"ab\n") for _ in range(2000))
+    for _ in range(300):
+        lo = rng.randrange(len(text) + 1)
+        hi = rng.randrange(lo, len(text) + 1)
+        start = binding._point_of(text, lo)
+        assert binding._advance(start, text, lo, hi) == \
+            binding._point_of(text, hi)
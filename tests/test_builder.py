@@ -35,6 +35,46 @@ def test_operator_sugar_and_flattening():
     assert isinstance(tg.ref("x").plus().node, Repeat1Node)
 
 
+def test_operator_chains_share_members_but_never_alias():
+    """`|`/`+` chains grow one shared member list (copy-on-write): a prefix
+    extended twice forks, and every intermediate keeps its own members."""
+    from pydantree_sitter_grammar.builder import site_of
+    a = tg.ref("x") | "y"
+    b = a | "z"
+    c = a | tg.ref("w")
+    d = b + ";"
+    assert [m.type for m in a.node.members] == ["SYMBOL", "STRING"]
+    assert b.node.members[2] == StrNode(value="z")
+    assert c.node.members[2].name == "w" and len(c.node.members) == 3
+    assert len((b | c).node.members) == 6
+    assert isinstance(d.node, SeqNode) and d.node.members[0] == b.node
+    assert site_of(b.node).file.endswith("test_builder.py")
+    assert "b = a | " in site_of(b.node).source
+
+
+def test_b_node_is_assignable_and_bad_members_fail_at_the_operator():
+    """`b.node = ...` still rebinds a B, and a member the IR union rejects
+    raises at the `|`/`+` that added it, not at a later `.node` read."""
+    from pydantic import ValidationError
+
+    from pydantree_sitter_grammar.ir import RuleNode
+
+    class Odd(RuleNode):
+        type: str = "ODD"
+
+    b = tg.ref("x") | "y"
+    b.node = StrNode(value="z")
+    assert b.node == StrNode(value="z")
+    assert (b | "w").node.members == [StrNode(value="z"), StrNode(value="w")]
+    with pytest.raises(ValidationError):
+        b | Odd()
+    with pytest.raises(ValidationError):
+        tg.ref("x") + "y" + Odd()
+    b.node = Odd()
+    with pytest.raises(ValidationError):
+        b + "y"
+
+
 def test_str_becomes_string():
     from pydantree_sitter_grammar.builder import as_node
     assert as_node(";") == StrNode(value=";")
@@ -51,6 +91,22 @@ def test_definition_site_recording():
     assert site.lineno > 0
 
 
+def test_definition_site_follows_an_edited_grammar_file(tmp_path):
+    """Sites are cached per (file, line) AND the file's mtime/size: editing
+    a grammar file in-process must not attribute nodes to the old text."""
+    from pydantree_sitter_grammar.builder import site_of
+    path = tmp_path / "g.py"
+
+    def build(src: str):
+        path.write_text(src)
+        ns = {"tg": tg}
+        exec(compile(src, str(path), "exec"), ns)
+        return ns["x"]
+
+    assert site_of(build("x = tg.ref('a')\n").node).source == "x = tg.ref('a')"
+    assert site_of(build("x = tg.ref('bbbb')\n").node).source == "x = tg.ref('bbbb')"
+
+
 def test_duplicate_rule_raises():
     g = tg.Grammar("t")
     g.rule("a", tg.pattern(r"\d+"))
@@ -152,7 +152,8 @@ def test_assert_clean_raises_on_errors_tolerates_warnings():
         tg.seq(tg.ref("tok"), tg.opt(tg.ref("div")))))
     g.start("source_file")
     g.extra(tg.pattern(r"/\*"))
-    tg.assert_clean(g)  # only a warning — tolerated
+    # only a warning — tolerated, and handed back from the same run
+    assert tg.assert_clean(g) == tg.warnings(g) != []
     g2 = _g()
     g2.rule("source_file", tg.repeat(tg.ref("missing")))
     g2.start("source_file")
@@ -175,3 +176,25 @@ def test_issues_carry_dsl_sites():
     assert unused.site is not None
     assert unused.site.file.endswith("test_checks.py")
     assert "orphan" in linecache.getline(unused.site.file, unused.site.lineno)
+
+
+def test_run_checks_walks_each_rule_body_once(monkeypatch):
+    """the checks share one view: a rule body is traversed once per
+    run_checks, not once per check."""
+    from pydantree_sitter_grammar import checks
+
+    walked: list = []
+    orig = checks.iter_all
+
+    def counting(node):
+        walked.append(id(node))
+        return orig(node)
+
+    monkeypatch.setattr(checks, "iter_all", counting)
+    g = _g()
+    g.rule("item", tg.pattern(r"\d+"))
+    g.rule("source_file", tg.repeat(tg.seq(tg.ref("item"), ",")))
+    g.start("source_file")
+    checks.run_checks(g)
+    bodies = [id(r) for r in g.rules.values()]
+    assert all(walked.count(b) == 1 for b in bodies)
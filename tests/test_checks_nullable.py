@@ -23,7 +23,7 @@ def test_nullable_truth_table(body_factory, expected):
     view = _view(g)
     body = body_factory()
     node = body.node if hasattr(body, "node") else body
-    assert _nullable(node, view, set()) is expected
+    assert _nullable(node, view) is expected
 
 
 def test_nullable_non_start_rule_catches_wrapped():
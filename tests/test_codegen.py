@@ -47,6 +47,60 @@ def test_generated_module_execs_over_real_rust():
     assert mod.wrap(None) is None
 
 
+def test_fieldless_kinds_are_built_on_first_use():
+    """kinds without field accessors get no class statement: the factory
+    builds them on first `wrap()` or module attribute access (PEP 562)."""
+    mod = _exec_module(generate_typed_api(_rust_schema(), "rust_api"),
+                       "rust_api")
+    assert "empty_statement" in mod._LAZY_KINDS
+    assert "EmptyStatement" in vars(mod)     # a union member: eager
+    assert "shebang" in mod.KIND_MAP and "shebang" not in mod._KIND_CLASSES
+    node = types.SimpleNamespace(type="shebang")
+    w = mod.wrap(node)
+    assert type(w) is mod.Shebang and w.KIND == "shebang"
+    assert mod._KIND_CLASSES["shebang"] is mod.Shebang
+    assert mod.wrap(types.SimpleNamespace(type="shebang")).__class__ is type(w)
+    with pytest.raises(AttributeError):
+        mod.NoSuchKind
+
+
+def test_kind_map_lists_every_kind_before_first_use():
+    """KIND_MAP is complete from import: fieldless kinds are listed (and
+    built on first `[]`) without a prior lookup() or wrap()."""
+    schema = NodeSchema.from_node_types_json(
+        FIXTURES.parent / "jsonlike" / "node-types.json")
+    mod = _exec_module(generate_typed_api(schema, "jsonlike_api"),
+                       "jsonlike_api")
+    named = {t.type for t in schema.node_types if t.named}
+    lazy = {"array", "source_file", "string_content"}
+    assert lazy <= set(mod._LAZY_KINDS)
+    assert not lazy & set(mod._KIND_CLASSES)
+    assert lazy <= set(mod.KIND_MAP) and len(mod.KIND_MAP) == len(set(mod.KIND_MAP))
+    assert set(mod.KIND_MAP) <= named and "pair" in mod.KIND_MAP
+    assert mod.KIND_MAP["array"] is mod.Array and mod.Array.KIND == "array"
+    assert "nope" not in mod.KIND_MAP
+    with pytest.raises(KeyError):
+        mod.KIND_MAP["nope"]
+
+
+def test_lookup_resolves_eager_lazy_and_unknown_kinds():
+    mod = _exec_module(generate_typed_api(_rust_schema(), "rust_api"),
+                       "rust_api")
+    assert mod.lookup("function_item") is mod.FunctionItem
+    assert mod.lookup("shebang") is mod.Shebang
+    assert mod.lookup("no_such_kind") is mod.TypedNode
+
+
+def test_wrappers_are_slotted():
+    """one wrapper per visited node: no per-instance __dict__, eager or
+    factory-built."""
+    mod = _exec_module(generate_typed_api(_rust_schema(), "rust_api"),
+                       "rust_api")
+    for kind in ("function_item", "shebang", "no_such_kind"):
+        w = mod.wrap(types.SimpleNamespace(type=kind))
+        assert not hasattr(w, "__dict__")
+
+
 @requires_toolchain
 def test_runtime_round_trip_matches_raw_child_by_field_name(tmp_path):
     """parse real rust source, wrap() the tree, walk fields — the typed
@@ -151,12 +205,162 @@ def wrap_roundtrip(n: tree_sitter.Node) -> ra.TypedNode | None:
     _exec_module(mod_src, "rust_accessors")
 
 
+def test_match_args_and_fused_match_values():
+    """kind classes expose their field accessors as `__match_args__`;
+    match_values reads them in one getter call, for any arity."""
+    mod = _exec_module(generate_typed_api(_rust_schema(), "rust_api"),
+                       "rust_api")
+    fi = mod.FunctionItem
+    assert fi.__match_args__ == (
+        "body", "name", "parameters", "return_type", "type_parameters")
+    ident = types.SimpleNamespace(type="identifier")
+    raw = types.SimpleNamespace(
+        type="function_item",
+        child_by_field_name=lambda f: ident if f == "name" else None)
+    w = mod.wrap(raw)
+    vals = mod.match_values(w)
+    assert len(vals) == 5 and vals[1].node is ident and vals[0] is None
+    match w:
+        case mod.FunctionItem(None, name):
+            assert name.node is ident
+        case _:
+            raise AssertionError("structural match failed")
+    one = mod.lookup("abstract_type")
+    assert one.__match_args__ == ("trait",)
+    assert mod.match_values(mod.wrap(types.SimpleNamespace(
+        type="abstract_type", child_by_field_name=lambda f: None))) == (None,)
+    assert mod.match_values(mod.wrap(types.SimpleNamespace(type="shebang"))) == ()
+    # like-shaped classes share one tuple and one fused getter
+    same = [c for c in set(mod.KIND_MAP.values())
+            if c.__match_args__ == ("body",)]
+    assert len(same) > 1
+    assert len({id(c.__match_args__) for c in same}) == 1
+    assert len({id(c._match_getter) for c in same}) == 1
+
+
+def test_colliding_class_names_share_one_class():
+    """kinds that camel-case to the same name get ONE class registered under
+    both keys (a second class statement used to shadow the first)."""
+    ident = {"multiple": False, "required": True,
+             "types": [{"type": "identifier", "named": True}]}
+    schema = NodeSchema.from_list([
+        {"type": "pair", "named": True, "fields": {"key": ident}},
+        {"type": "_pair", "named": True, "fields": {"value": ident}},
+        {"type": "self", "named": True},
+        {"type": "_self", "named": True},
+        {"type": "identifier", "named": True},
+    ])
+    src = generate_typed_api(schema, "collide")
+    assert src.count("class Pair(") == 1
+    mod = _exec_module(src, "collide")
+    assert mod.KIND_MAP["pair"] is mod.KIND_MAP["_pair"] is mod.Pair
+    assert mod.Pair.KINDS == ("_pair", "pair")
+    assert mod.Pair.__match_args__ == ("key", "value")
+    assert mod.lookup("self") is mod.lookup("_self") is mod.Self
+
+
+def test_kinds_named_like_the_module_imports_get_their_own_classes():
+    """`mapping`/`any`/`callable`/`iterator` camel-case to the names the
+    generated module imports; its underscore aliases keep them apart."""
+    ident = {"multiple": False, "required": True,
+             "types": [{"type": "identifier", "named": True}]}
+    schema = NodeSchema.from_list([
+        {"type": "mapping", "named": True},
+        {"type": "iterator", "named": True},
+        {"type": "any", "named": True, "fields": {"key": ident}},
+        {"type": "callable", "named": True, "fields": {"key": ident}},
+        {"type": "identifier", "named": True},
+    ])
+    mod = _exec_module(generate_typed_api(schema, "shadow"), "shadow")
+    for kind in ("mapping", "iterator", "any", "callable"):
+        cls = mod.KIND_MAP[kind]
+        assert issubclass(cls, mod.TypedNode) and cls.KIND == kind
+        assert getattr(mod, cls.__name__) is cls
+    assert len(mod.KIND_MAP) == 5
+
+
+def test_bind_dispatches_on_symbol_ids():
+    """after bind(language), wrap() indexes a per-symbol-id table (filled
+    lazily for factory-built kinds) and agrees with the string dispatch."""
+    import tree_sitter
+    import tree_sitter_python
+
+    ident = {"multiple": False, "required": True,
+             "types": [{"type": "identifier", "named": True}]}
+    schema = NodeSchema.from_list([
+        {"type": "assignment", "named": True, "fields": {"left": ident}},
+        {"type": "identifier", "named": True},
+        {"type": "module", "named": True},
+    ])
+    mod = _exec_module(generate_typed_api(schema, "py_api"), "py_api")
+    lang = tree_sitter.Language(tree_sitter_python.language())
+    tree = tree_sitter.Parser(lang).parse(b"x = 1\n")
+    mod.bind(lang)
+    assert len(mod._BY_ID) == lang.node_kind_count
+    assign = tree.root_node.children[0].children[0]
+    w = mod.wrap(assign)
+    assert type(w) is mod.Assignment
+    assert type(w.left) is mod.Identifier
+    assert mod._BY_ID[w.left.node.kind_id] is mod.Identifier
+    # bound field accessors read by field id
+    assert mod._FIELD_IDS["left"] == lang.field_id_for_name("left")
+    assert w.left.node == assign.child_by_field_name("left")
+    assert type(mod.wrap(tree.root_node)) is mod.Module
+    integer = assign.child_by_field_name("right")
+    assert type(mod.wrap(integer)) is mod.TypedNode
+    # ERROR's id (65535) is outside the table: the string path handles it
+    err = tree_sitter.Parser(lang).parse(b"x = (").root_node.children[0]
+    assert type(mod.wrap(err)) is mod.TypedNode
+    # warm=True resolves every id now: the deferred classes exist before
+    # the first wrap, and dispatch agrees with the lazy fill
+    warm = _exec_module(generate_typed_api(schema, "py_api"), "py_api")
+    assert "Identifier" not in vars(warm)
+    warm.bind(lang, warm=True)
+    assert "Identifier" in vars(warm)
+    assert None not in warm._BY_ID[1:]
+    assert type(warm.wrap(assign).left) is warm.Identifier
+
+
+def test_wrap_all_agrees_with_wrap_bound_and_unbound():
+    """the batch dispatcher resolves exactly what per-node wrap() does, on
+    both the string path and the bound symbol-id path; children() and
+    repeated fields go through it."""
+    import tree_sitter
+    import tree_sitter_python
+
+    ident = {"multiple": True, "required": True,
+             "types": [{"type": "identifier", "named": True}]}
+    schema = NodeSchema.from_list([
+        {"type": "import_statement", "named": True,
+         "fields": {"name": ident}},
+        {"type": "identifier", "named": True},
+        {"type": "module", "named": True},
+    ])
+    lang = tree_sitter.Language(tree_sitter_python.language())
+    tree = tree_sitter.Parser(lang).parse(b"import a, b\nx = 1\n")
+    nodes = [tree.root_node, *tree.root_node.children,
+             *tree.root_node.children[0].children]
+    for bound in (False, True):
+        mod = _exec_module(generate_typed_api(schema, "py_api"), "py_api")
+        if bound:
+            mod.bind(lang)
+        assert ([type(w) for w in mod.wrap_all(nodes)]
+                == [type(mod.wrap(n)) for n in nodes])
+        imp = mod.wrap(tree.root_node).children("import_statement")[0]
+        assert [w.text for w in imp.children("dotted_name")] == ["a", "b"]
+        assert [w.text for w in imp.children("import")] == ["import"]
+        assert imp.children("no_such_kind") == []
+        assert [w.text for w in imp.name] == ["a", "b"]
+        assert imp.text is imp.text      # decoded once per wrapper
+
+
 def test_acronym_aware_class_names():
     """F-B4-style naming: kinds -> camel class names (shared helper)."""
     from pydantree_sitter.codegen import class_name
     assert class_name("function_item") == "FunctionItem"
     assert class_name("_type") == "Type"
     assert class_name("http_server") == "HttpServer"
+    assert class_name("false") == "False_"     # not `class False`
 
 
 @requires_toolchain
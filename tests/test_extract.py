@@ -361,6 +361,21 @@ def test_unescaped_over_cfg_string():
     assert rows[0].title == "A\nB"
 
 
+def test_unescape_lenient_fallback_keeps_what_it_cannot_decode():
+    """When the strict JSON round-trip rejects a literal, known escapes and
+    \\uXXXX still decode; a raw newline, an unknown escape, a short \\u and a
+    trailing backslash are kept verbatim."""
+    from pydantree_sitter.materialize import _unescape_json_string as unescape
+
+    assert unescape('"a\nb\\tc"') == "a\nb\tc"            # raw newline
+    assert unescape('a\\qb\\n') == "a\\qb\n"              # unknown escape
+    assert unescape('"\\u0041\\u00e9\n"') == "Aé\n"       # \uXXXX
+    assert unescape('x\\u41 \\n') == "x\\u41 \n"          # short \u
+    assert unescape('\\u12zz\\t') == "\\u12zz\t"          # non-hex \u
+    assert unescape('tail\\') == "tail\\"                 # trailing backslash
+    assert unescape('"\n\\"q\\\\"') == '\n"q\\'
+
+
 # ---------------------------------------------------------------------------
 # A2 (REVIEW 018): the documented sugar one-liner must not recompile and
 # re-check every call — memoized per-input Language on the sugar path
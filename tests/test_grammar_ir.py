@@ -58,6 +58,21 @@ def test_minimal_grammar_roundtrip():
     assert again == g
 
 
+def test_emitted_json_is_the_hashed_text(tmp_path):
+    """grammar.json is `canonical_json()` byte-for-byte, and the cache key is
+    its sha256 — whether serialized once by the build or by each call."""
+    import hashlib
+
+    from pydantree_sitter_grammar.pipeline import grammar_hash
+    g = GrammarModel.model_validate(json.loads(REFERENCE.read_text()))
+    path = g.emit_bundle(tmp_path)
+    text = path.read_text()
+    assert text == g.canonical_json()
+    assert GrammarModel.model_validate_json(text) == g
+    assert grammar_hash(g) == hashlib.sha256(text.encode()).hexdigest()
+    assert grammar_hash(g, text=text) == grammar_hash(g)
+
+
 def test_all_node_types_instantiate_and_roundtrip():
     """Each node type constructs and serializes with its discriminator."""
     cases = [
@@ -75,6 +75,89 @@ def test_non_int_bundle_format_is_rejected(tmp_path):
     assert "bundle_format" in str(exc.value)
 
 
+def test_typed_api_imports_once_from_precompiled_bytecode(tmp_path):
+    """write_typed_api byte-compiles the module beside it; load_typed_api
+    imports it through the import system (the .pyc is what loads) and
+    returns the registered module on the next call."""
+    import sys
+
+    from pydantree_sitter.codegen import write_typed_api
+    from pydantree_sitter.loader import load_typed_api
+    from pydantree_sitter.schema import NodeSchema
+
+    bundle = _metadata_bundle(tmp_path, {"name": "loader_t"})
+    with pytest.raises(BundleError):
+        load_typed_api(bundle)
+    schema = NodeSchema.from_node_types_json(
+        ROOT / "tests" / "fixtures" / "jsonlike" / "node-types.json")
+    write_typed_api(schema, bundle / "typed_api.py",
+                    module_name="typed_api_loader_t")
+    assert list((bundle / "__pycache__").glob("typed_api.*.pyc"))
+    try:
+        mod = load_typed_api(bundle)
+        assert mod.__name__ == "typed_api_loader_t"
+        assert mod.__spec__.cached is not None
+        assert "pair" in mod.KIND_MAP
+        assert load_typed_api(bundle) is mod
+    finally:
+        sys.modules.pop("typed_api_loader_t", None)
+
+
+def test_typed_api_reimports_a_rebuilt_module(tmp_path):
+    """A typed_api.py regenerated in place (a rebuild into the same bundle)
+    changes the file stamp: the next load imports it afresh."""
+    import sys
+
+    from pydantree_sitter.codegen import write_typed_api
+    from pydantree_sitter.loader import load_typed_api
+    from pydantree_sitter.schema import NodeSchema
+
+    bundle = _metadata_bundle(tmp_path, {"name": "rebuild_t"})
+    schema = NodeSchema.from_node_types_json(
+        ROOT / "tests" / "fixtures" / "jsonlike" / "node-types.json")
+    write_typed_api(schema, bundle / "typed_api.py",
+                    module_name="typed_api_rebuild_t")
+    try:
+        old = load_typed_api(bundle)
+        assert "pair" in old.KIND_MAP and "widget" not in old.KIND_MAP
+        write_typed_api(
+            NodeSchema.from_list([{"type": "widget", "named": True}]),
+            bundle / "typed_api.py", module_name="typed_api_rebuild_t")
+        new = load_typed_api(bundle)
+        assert new is not old
+        assert "widget" in new.KIND_MAP and "pair" not in new.KIND_MAP
+        assert load_typed_api(bundle) is new
+    finally:
+        sys.modules.pop("typed_api_rebuild_t", None)
+
+
+def test_memoized_bundle_hands_each_caller_its_own_metadata(tmp_path):
+    """A memo hit shares the loaded language but not the Bundle: a caller
+    mutating (or json-dumping) its metadata dict never reaches the next."""
+    from pydantree_sitter import loader
+
+    bundle = _metadata_bundle(tmp_path, {"name": "shared_t",
+                                         "value_map": {"k": ["v"]}})
+    meta = (bundle / "tree-sitter.json").resolve()
+    cached = loader.Bundle(language=None, lib=None, schema=None,
+                           metadata={"name": "shared_t",
+                                     "value_map": {"k": ["v"]}},
+                           path=bundle)
+    key = bundle.resolve()
+    loader._BUNDLES[key] = ((meta,), (loader._stamp(meta),), cached)
+    try:
+        first = load_bundle(bundle)
+        assert first is not cached and first.language is cached.language
+        first.metadata["name"] = "mutated"
+        first.metadata["value_map"]["k"].append("w")
+        json.dumps(first.metadata)
+        second = load_bundle(bundle)
+        assert second.metadata == {"name": "shared_t",
+                                   "value_map": {"k": ["v"]}}
+    finally:
+        loader._BUNDLES.pop(key, None)
+
+
 @requires_toolchain
 def test_format_1_bundle_still_loads(tmp_path):
     """Absent bundle_format = format 1 (the original layout) — accepted, not
@@ -93,6 +176,10 @@ def test_format_1_bundle_still_loads(tmp_path):
     assert b.language is not None
     assert b.schema is not None
     assert "source_file" in b.schema.kinds()
+    # an unchanged bundle loads once; rewriting any of its files reloads
+    assert load_bundle(bundle).language is b.language
+    (bundle / "tree-sitter.json").write_text(json.dumps(metadata, indent=1))
+    assert load_bundle(bundle).language is not b.language
 
 
 @requires_toolchain
@@ -13,7 +13,7 @@ import random
 
 import pytest
 
-from pydantree_sitter.match import match_ancestor_path
+from pydantree_sitter.match import ancestor_path_matcher, match_ancestor_path
 from pydantree_sitter.markers import GAP
 from pydantree_sitter.spec import PathStep
 
@@ -24,6 +24,7 @@ class _Node:
     def __init__(self, kind: str, parent: "_Node | None" = None):
         self.type = kind
         self.parent = parent
+        self.id = id(self)      # tree-sitter's stable per-tree node id
 
 
 def _chain(kinds: list[str]) -> _Node:
@@ -110,6 +111,38 @@ def test_matcher_agrees_with_brute_force():
         assert got == want, f"mismatch on chain={_ancestry(node)} path={path}"
 
 
+def test_batch_matcher_agrees_with_brute_force_over_shared_ancestors():
+    """the memoized batch form, over every node of random TREES (anchors
+    share ancestors, so memo entries are reused across anchors)."""
+    rng = random.Random(20261015)
+    for _ in range(300):
+        nodes = [_Node(rng.choice("abc"))]
+        for _ in range(rng.randint(1, 30)):
+            nodes.append(_Node(rng.choice("abc"), parent=rng.choice(nodes)))
+        _node, path = _random_case(rng)
+        on_path = ancestor_path_matcher(path)
+        for n in nodes:
+            assert on_path(n) == _brute(n, path), (_ancestry(n), path)
+
+
+def test_nested_matcher_agrees_where_the_query_nested_the_suffix():
+    """nested=True skips the after-last-gap chain the emitted query already
+    enforced: over anchors that satisfy that chain, it agrees with the full
+    check."""
+    rng = random.Random(20261016)
+    for _ in range(300):
+        nodes = [_Node(rng.choice("abc"))]
+        for _ in range(rng.randint(1, 30)):
+            nodes.append(_Node(rng.choice("abc"), parent=rng.choice(nodes)))
+        _node, path = _random_case(rng)
+        gaps = [i for i, s in enumerate(path) if s is GAP]
+        suffix = path[gaps[-1] + 1:] if gaps else path
+        on_path = ancestor_path_matcher(path, nested=True)
+        for n in nodes:
+            if _brute(n, suffix):
+                assert on_path(n) == _brute(n, path), (_ancestry(n), path)
+
+
 def test_path_step_alternation():
     """A PathStep with multiple kinds matches ANY of them."""
     node = _chain(["a", "b", "c"])
@@ -152,3 +185,22 @@ def test_scalar_capture_ambiguity_raises_the_one_error():
     # the SAME node twice (a Python-wrapper dedup case) merges, not raises
     merged = merge_group([{"x": [N(1)]}, {"x": [N(1)]}], [b])
     assert len(merged["x"]) == 1
+
+
+def test_grouping_filters_anchors_in_the_same_pass():
+    from pydantree_sitter.markers import ANCHOR
+    from pydantree_sitter.match import group_matches
+
+    class Match:
+        def __init__(self, caps):
+            self.caps = caps
+
+    a, b = _chain(["module", "a"]), _chain(["class", "a"])
+    ms = [Match({ANCHOR: [a], "x": [1]}), Match({"x": [2]}),
+          Match({ANCHOR: [b], "x": [3]}), Match({ANCHOR: [a], "x": [4]})]
+    groups, order = group_matches(ms)
+    assert order == [a.id, 0, b.id]
+    groups, order = group_matches(ms, keep=ancestor_path_matcher(
+        (PathStep(("module",)), PathStep(("a",)))))
+    assert order == [a.id]
+    assert [c["x"] for c in groups[a.id]] == [[1], [4]]
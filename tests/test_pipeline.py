@@ -148,6 +148,8 @@ def test_full_pipeline_generate_compile_load_parse(cache_dir):
     assert result.so_path.exists()
     lang = tg.load_language(result.so_path, "pipeline_t")
     assert lang.abi_version == 15
+    # an unchanged .so is loaded once (no re-copy/re-dlopen per call)
+    assert tg.load_language(result.so_path, "pipeline_t") is lang
 
     tree = tg.parse(lang, "1 2 3.5")
     assert not tree.root_node.has_error
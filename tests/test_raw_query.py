@@ -107,3 +107,17 @@ def test_match_and_raw_query_are_mutually_exclusive():
             __match__ = M("module", "expression_statement")
             __raw_query__ = RawQuery("(module)")
             name: str = capture()
+
+
+def test_match_view_nodes_is_a_list_copy():
+    """`MatchView.nodes` hands out a fresh list: appendable, list-equal,
+    and never the match's own capture list."""
+    from pydantree_sitter.emit import MatchView
+
+    own = ["a", "b"]
+    view = MatchView(0, {"name": own}, {})
+    got = view.nodes("name")
+    assert got == ["a", "b"] and type(got) is list
+    got.append("c")
+    assert own == ["a", "b"]
+    assert view.nodes("absent") == []
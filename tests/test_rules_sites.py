@@ -85,3 +85,33 @@ def test_attribute_sites_are_more_precise_than_the_class_line(tmp_path):
         assert class_line not in (key_site.lineno, value_site.lineno)
     finally:
         sys.modules.pop("authorgram2", None)
+
+
+def test_attribute_sites_survive_a_column_zero_line_in_the_body(tmp_path):
+    """The body scan ends at the first line indented no deeper than the
+    class — a column-0 line inside a docstring ends it early, and the
+    attributes after it must still get their own lines (exact fallback)."""
+    src = (
+        "from pydantree_sitter_grammar import Rule\n"
+        "class Name(Rule):\n"
+        "    __pattern__ = r'[a-z]+'\n"
+        "class Pair(Rule):\n"
+        '    """A pair.\n'
+        "\n"
+        "flush-left docstring line\n"
+        '    """\n'
+        "    key: Name\n"
+        "    value: Name\n"
+    )
+    f = tmp_path / "authorgram3.py"
+    f.write_text(src)
+    mod = types.ModuleType("authorgram3")
+    mod.__file__ = str(f)
+    sys.modules["authorgram3"] = mod
+    try:
+        exec(compile(src, str(f), "exec"), mod.__dict__)
+        sites = mod.Pair.__attr_sites__
+        assert (sites["key"].lineno, sites["value"].lineno) == (9, 10)
+        assert sites["value"].source == "value: Name"
+    finally:
+        sys.modules.pop("authorgram3", None)
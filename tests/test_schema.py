@@ -96,6 +96,48 @@ def test_possible_children_descent():
     assert not s.is_possible_descent("pair", "value")
 
 
+def test_descendant_closure_matches_a_set_walk():
+    """the bitset closure (A6) agrees with a plain BFS over possible_children
+    for every kind pair of a real grammar, unknown kinds included."""
+    s = _schema_for("rust")
+    kinds = sorted(s.kinds()) + ["no_such_kind"]
+
+    def walk(a, b):
+        seen, todo = set(), [a]
+        while todo:
+            k = todo.pop()
+            if k == b:
+                return True
+            if k not in seen:
+                seen.add(k)
+                todo.extend(s.possible_children(k))
+        return False
+
+    for a in kinds[::31]:
+        for b in kinds:
+            assert s.is_possible_descendant(a, b) == walk(a, b), (a, b)
+    assert s.possible_children("no_such_kind") == set()
+
+
+def test_lazy_masks_see_undeclared_children_on_a_cold_schema():
+    """masks fill per kind on first use: a kind referenced but never declared
+    gets its id while the asked-about mask is built, so the FIRST query on a
+    cold schema already sees it."""
+    def cold():
+        return NodeSchema.from_list([
+            {"type": "a", "named": True, "children": {
+                "multiple": True, "required": False,
+                "types": [{"type": "b", "named": True}]}},
+            {"type": "b", "named": True, "children": {
+                "multiple": False, "required": True,
+                "types": [{"type": "ghost", "named": True}]}},
+        ])
+    assert cold().is_possible_descent("b", "ghost")
+    assert cold().is_possible_descendant("a", "ghost")
+    assert cold().possible_children("b") == {"ghost"}
+    assert not cold().is_possible_descendant("ghost", "a")
+
+
 def test_hidden_inline_transparency():
     """The CLI flattens hidden rules: `_value` does not appear as a kind; its
     visible children do (the schema is the CLI byproduct, not the IR)."""
@@ -158,6 +200,26 @@ def test_byte_for_byte_roundtrip_over_real_rust():
     assert '"extra": false' not in s.to_json()
 
 
+def test_bytes_path_and_from_list_agree():
+    """from_node_types_json validates the CLI list form straight from bytes
+    (one core call); it must equal the per-entry dict path."""
+    raw = json.loads((_RUST / "node-types.json").read_text())
+    via_bytes = NodeSchema.from_node_types_json(_RUST / "node-types.json")
+    assert via_bytes == NodeSchema.from_list(raw)
+    assert via_bytes.get("identifier").type == "identifier"
+
+
+def test_kind_strings_are_interned_on_load():
+    """every mention of a kind shares ONE string object (the rust schema
+    repeats `identifier` across dozens of field/children lists)."""
+    s = NodeSchema.from_node_types_json(_RUST / "node-types.json", name="rust")
+    refs = [r for t in s.node_types for fi in (t.fields or {}).values()
+            for r in fi.types if r.type == "identifier"]
+    assert len(refs) > 1
+    assert all(r.type is refs[0].type for r in refs)
+    assert s.get("identifier").type is refs[0].type
+
+
 def test_nix_node_types_shape_semantics():
     """The schema shape over real nix (toolchain-free — the COMMITTED
     fixture, which the shared byte-for-byte oracle test regenerates): the
@@ -5,8 +5,10 @@ src/pydantree_sitter/ and verified against the real community wheels (tree-sitte
 
 from __future__ import annotations
 
+import dataclasses
 from typing import Annotated
 
+from pydantic import ValidationError
 import pytest
 import tree_sitter_json
 import tree_sitter_python
@@ -15,11 +17,14 @@ from pydantree_sitter import (
     M,
     AnyOf,
     Eq,
+    ExtractionError,
     Language,
+    MatchFailure,
     Matches,
     NodeKind,
     OutputModel,
     ShapeError,
+    Span,
     capture,
     derived,
     source_meta,
@@ -139,6 +144,93 @@ def test_task2_json_record_mode():
     assert got == JSON_GROUND_TRUTH
 
 
+def test_extract_cache_dir_round_trips_and_skips_the_parse(tmp_path,
+                                                           monkeypatch):
+    ext = Language.load(tree_sitter_json.language()).extractor(Person)
+    first = ext.extract(JSON_SAMPLE, cache_dir=tmp_path)
+    assert norm(first) == JSON_GROUND_TRUTH
+    assert len(list(tmp_path.glob("*.json"))) == 1
+
+    def no_parse(self, text):
+        raise AssertionError("cache hit must not reparse")
+
+    monkeypatch.setattr(Language, "parse", no_parse)
+    assert norm(ext.extract(JSON_SAMPLE, cache_dir=tmp_path)) \
+        == JSON_GROUND_TRUTH
+    # different content -> a different entry (and a real parse)
+    monkeypatch.undo()
+    ext.extract("[]", cache_dir=tmp_path)
+    assert len(list(tmp_path.glob("*.json"))) == 2
+    # a torn/stale entry is a miss: re-extracted and rewritten
+    for entry in tmp_path.glob("*.json"):
+        entry.write_bytes(b'[{"name": ')
+    assert norm(ext.extract(JSON_SAMPLE, cache_dir=tmp_path)) \
+        == JSON_GROUND_TRUTH
+    assert {type(r) for r in ext.extract(JSON_SAMPLE, cache_dir=tmp_path)} \
+        == {Person}
+    assert list(tmp_path.glob("*.tmp")) == []
+
+
+def test_extract_cache_key_covers_library_versions_and_racing_stores(
+        tmp_path, monkeypatch):
+    """An entry written under another pydantic (or pydantree) version is a
+    different key; threads storing one key at once never share a temp file."""
+    import threading
+
+    import pydantic
+
+    ext = Language.load(tree_sitter_json.language()).extractor(Person)
+    key = ext._cache_key(JSON_SAMPLE.encode())
+    monkeypatch.setattr(pydantic, "VERSION", "0.0.0")
+    other = Language.load(tree_sitter_json.language()).extractor(Person)
+    assert other._cache_key(JSON_SAMPLE.encode()) != key
+    monkeypatch.undo()
+
+    results, errors = [], []
+
+    def store():
+        try:
+            fresh = Language.load(tree_sitter_json.language()).extractor(Person)
+            results.append(norm(fresh.extract(JSON_SAMPLE, cache_dir=tmp_path)))
+        except Exception as e:          # noqa: BLE001 — collected below
+            errors.append(e)
+
+    threads = [threading.Thread(target=store) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert errors == [] and results == [JSON_GROUND_TRUTH] * 8
+    assert [p.name for p in tmp_path.iterdir()] == [f"{key}.json"]
+
+
+def test_extract_cache_dir_rejects_rows_with_no_json_form(tmp_path):
+    """A source_meta() Span has no JSON form (nor a list of them): cache_dir
+    is refused before the extract, never a serialization crash after it."""
+    class WithSpan(OutputModel):
+        __match__ = M("module", "expression_statement", "assignment")
+        name: Annotated[str, Eq("x")] = capture("left")
+        span: Span = source_meta()
+        spans: list[Span] | None = derived(None)
+        model_config = {"arbitrary_types_allowed": True}
+
+    ext = Language.load(tree_sitter_python.language()).extractor(WithSpan)
+    with pytest.raises(ValueError, match=r"field\(s\) span, spans hold"):
+        ext.extract("x = 1\n", cache_dir=tmp_path)
+    assert list(tmp_path.iterdir()) == []
+    assert [r.name for r in ext.extract("x = 1\n")] == ["x"]
+
+
+def test_extract_cache_dir_store_failure_still_returns_rows(tmp_path):
+    """The row cache is an optimization: an unwritable cache_dir (here a
+    path under a regular file) costs the store, never the extract."""
+    blocker = tmp_path / "not-a-dir"
+    blocker.write_bytes(b"")
+    ext = Language.load(tree_sitter_json.language()).extractor(Person)
+    got = ext.extract(JSON_SAMPLE, cache_dir=blocker / "cache")
+    assert norm(got) == JSON_GROUND_TRUTH
+
+
 def test_validate_with_accepts_both_queries():
     Assignment.validate_with(tree_sitter_python)
     Person.validate_with(tree_sitter_json)
@@ -213,6 +305,109 @@ def test_lenient_mode():
     assert len(rows) == 4
 
 
+def test_batched_rows_keep_per_row_failures():
+    """Rows validate in one batch; a failing row keeps its own errors (as
+    the per-row constructor reports them), so the lenient loop keeps the
+    valid rows in order and strict mode still names the failing anchor."""
+    class Pos(OutputModel):
+        __match__ = M("module", "expression_statement", "assignment")
+        name: str = capture("left")
+        value: int = capture("right")
+
+    src = "a = 1\nb = 'x'\nc = 3\n"
+    lang = Language.load(tree_sitter_python.language())
+    lenient = lang.extractor(Pos, strict=False)
+    assert [r.name for r in lenient.extract(src)] == ["a", "c"]
+    with pytest.raises(ExtractionError) as ei:
+        lang.extractor(Pos).extract(src)
+    (failure,) = ei.value.failures
+    assert failure.span.line == 2 and failure.pydantic_errors
+    with pytest.raises(ValidationError) as direct:
+        Pos(name="b", value="'x'")
+    assert failure.pydantic_errors == direct.value.errors()
+
+
+def test_overridden_init_runs_per_row():
+    """A model overriding `__init__` is constructed row by row, not batch-
+    validated past its override."""
+    class Upper(OutputModel):
+        __match__ = M("module", "expression_statement", "assignment")
+        name: str = capture("left")
+
+        def __init__(self, **data):
+            data["name"] = data["name"].upper()
+            super().__init__(**data)
+
+    lang = Language.load(tree_sitter_python.language())
+    rows = lang.extractor(Upper).extract("a = 1\nb = 2\n")
+    assert [r.name for r in rows] == ["A", "B"]
+
+
+def test_extraction_error_message_is_bounded_but_failures_are_not():
+    """Thousands of failures keep full detail on `.failures`; the message
+    lists the first few with truncated snippets and counts the rest."""
+    class Pos(OutputModel):
+        __match__ = M("module", "expression_statement", "assignment")
+        name: str = capture("left")
+        value: int = capture("right")
+
+    long = "'" + "y" * 500 + "'"
+    src = "".join(f"v{i} = {long}\n" for i in range(300))
+    lang = Language.load(tree_sitter_python.language())
+    with pytest.raises(ExtractionError) as ei:
+        lang.extractor(Pos).extract(src)
+    e = ei.value
+    assert len(e.failures) == 300
+    assert long in e.failures[-1].snippet
+    msg = str(e)
+    assert msg.startswith("300 match(es) failed")
+    assert "... and 280 more (see .failures)" in msg
+    assert long not in msg and len(msg.splitlines()) == 22
+
+
+def test_match_failure_snippet_keeps_its_field_place_and_is_filled_on_raise():
+    """`snippet` stays MatchFailure's 4th field (positional construction
+    unchanged, slotted); the extract loops leave it None and ExtractionError
+    fills it from the span."""
+    class Pos(OutputModel):
+        __match__ = M("module", "expression_statement", "assignment")
+        name: str = capture("left")
+        value: int = capture("right")
+
+    lang = Language.load(tree_sitter_python.language())
+    with pytest.raises(ExtractionError) as ei:
+        lang.extractor(Pos).extract("v = 'x'\n")
+    (f,) = ei.value.failures
+    assert f.snippet == "v = 'x'"
+    assert [fl.name for fl in dataclasses.fields(MatchFailure)] == [
+        "pattern", "anchor", "span", "snippet", "detail", "pydantic_errors"]
+    given = MatchFailure(0, None, f.span, "given", "detail")
+    assert (given.snippet, given.detail) == ("given", "detail")
+    assert not hasattr(given, "__dict__")
+    ExtractionError([given], Pos)
+    assert given.snippet == "given"
+
+
+def test_kwargs_plan_resolves_once_and_fills_missing_captures_per_row():
+    """Each field's value source is resolved once per bind; an absent list
+    capture still gets a FRESH [] per row, an absent optional one None."""
+    class Ann(OutputModel):
+        __match__ = M("module", "expression_statement", "assignment")
+        name: str = capture("left")
+        types: list[str] = capture("type")
+        hint: str | None = capture("type")
+        line: int = source_meta()
+
+    lang = Language.load(tree_sitter_python.language())
+    ext = lang.extractor(Ann)
+    a, b, c = ext.extract("a = 1\nb: int = 2\nc = 3\n")
+    plan = ext.compiled.kwargs_plan()
+    assert ext.compiled.kwargs_plan() is plan
+    assert (a.types, a.hint, a.line) == ([], None, 1)
+    assert (b.types, b.hint, b.line) == (["int"], "int", 2)
+    assert a.types is not c.types
+
+
 def test_derived_field_constant():
     class WithConst(OutputModel):
         __match__ = M("module", "expression_statement", "assignment")
@@ -224,6 +419,22 @@ def test_derived_field_constant():
     assert rows[0]["source"] == "spike"
 
 
+def test_stacked_predicates_fuse_into_one():
+    """Eq/AnyOf intersect and each Matches is decided against the value set
+    at bind: ONE text predicate per match, same rows."""
+    class Sized(OutputModel):
+        __match__ = M("module", "expression_statement", "assignment")
+        name: Annotated[str, AnyOf("WIDTH", "HEIGHT", "local_count"),
+                        Matches(r"^[A-Z]+$")] = capture("left")
+
+    lang = Language.load(tree_sitter_python.language())
+    src = lang.extractor(Sized).query_source
+    assert '(#any-of? @name "WIDTH" "HEIGHT")' in src
+    assert "#match?" not in src
+    rows = norm(Sized.extract(PY_SAMPLE, language=lang))
+    assert [r["name"] for r in rows] == ["WIDTH", "HEIGHT"]
+
+
 def test_unmappable_shape_raises_at_bind():
     """A record shape the ValueMap cannot express (list[dict]) raises
     ShapeError at BIND (shapes resolve against the ValueMap, D6) - never a
@@ -247,6 +458,15 @@ def test_nested_record_models():
     assert all(r["address"] is None for r in rows if r["name"] != "carol")
 
 
+def test_record_fields_come_from_the_record_not_its_nested_objects():
+    """The inner query only starts matches AT the record node: a nested
+    object's same-named keys never reach the outer row (the nested model
+    still gets its own)."""
+    src = '[{"name": "a", "address": {"city": "X", "name": "inner"}}]'
+    (row,) = norm(PersonNested.extract(src, language=tree_sitter_json))
+    assert row == {"name": "a", "address": {"city": "X"}}
+
+
 def test_compiled_source_never_user_facing_but_available():
     src = Person.compiled_source()
     assert "(document" in src and "(pair" in src